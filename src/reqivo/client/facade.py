@@ -6,7 +6,17 @@ Provides ``Reqivo`` (sync) and ``AsyncReqivo`` (async) as single entry
 points that wrap Session/AsyncSession with a fluent interface.
 """
 
-from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
 
 from reqivo.client.response import Response
 from reqivo.client.session import AsyncSession, Session
@@ -307,19 +317,19 @@ class AsyncReqivo:
 
     # -- HTTP Methods --------------------------------------------------------
 
-    async def get(
+    # Verb helpers return the session coroutine directly instead of
+    # wrapping it in an extra coroutine frame.
+    def get(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async GET request."""
-        return await self._session.get(
-            url, headers=headers, timeout=timeout, limits=limits
-        )
+        return self._session.get(url, headers=headers, timeout=timeout, limits=limits)
 
-    async def post(
+    def post(
         self,
         url: str,
         *,
@@ -327,13 +337,13 @@ class AsyncReqivo:
         body: Optional[Union[str, bytes, Iterator[bytes], IO[bytes]]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async POST request."""
-        return await self._session.post(
+        return self._session.post(
             url, headers=headers, body=body, timeout=timeout, limits=limits
         )
 
-    async def put(
+    def put(
         self,
         url: str,
         *,
@@ -341,13 +351,13 @@ class AsyncReqivo:
         body: Optional[Union[str, bytes, Iterator[bytes], IO[bytes]]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async PUT request."""
-        return await self._session.put(
+        return self._session.put(
             url, headers=headers, body=body, timeout=timeout, limits=limits
         )
 
-    async def delete(
+    def delete(
         self,
         url: str,
         *,
@@ -355,13 +365,13 @@ class AsyncReqivo:
         body: Optional[Union[str, bytes, Iterator[bytes], IO[bytes]]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async DELETE request."""
-        return await self._session.delete(
+        return self._session.delete(
             url, headers=headers, body=body, timeout=timeout, limits=limits
         )
 
-    async def patch(
+    def patch(
         self,
         url: str,
         *,
@@ -369,33 +379,31 @@ class AsyncReqivo:
         body: Optional[Union[str, bytes, Iterator[bytes], IO[bytes]]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async PATCH request."""
-        return await self._session.patch(
+        return self._session.patch(
             url, headers=headers, body=body, timeout=timeout, limits=limits
         )
 
-    async def head(
+    def head(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async HEAD request."""
-        return await self._session.head(
-            url, headers=headers, timeout=timeout, limits=limits
-        )
+        return self._session.head(url, headers=headers, timeout=timeout, limits=limits)
 
-    async def options(
+    def options(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async OPTIONS request."""
-        return await self._session.options(
+        return self._session.options(
             url, headers=headers, timeout=timeout, limits=limits
         )
 
@@ -4,18 +4,25 @@ HTTP request builder and sender.
 """
 
 # pylint: disable=redefined-builtin,protected-access,too-many-statements
+# pylint: disable=too-many-lines
 
 import asyncio
 import collections.abc
+import functools
 import socket
+import types
 import urllib.parse
 from typing import (
     IO,
     TYPE_CHECKING,
+    Any,
     AsyncIterator,
+    Coroutine,
     Dict,
     Iterator,
+    Mapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -36,26 +43,125 @@ from reqivo.http.body import (
 
 # pylint: disable=unused-import
 from reqivo.http.http11 import HttpParser
+from reqivo.http.url import DEFAULT_SCHEME_INFO, SCHEME_INFO
 from reqivo.transport.connection import AsyncConnection, Connection
 from reqivo.utils.timing import Timeout
 
 if TYPE_CHECKING:  # pragma: no cover
     from reqivo.client.session import AsyncSession, Session
 
-__all__ = ["Request", "AsyncRequest"]
+__all__ = ["Request", "AsyncRequest", "validate_header"]
 
+_H_AUTHORIZATION = "Authorization"
 
-class Request:
+# Shared read-only stand-in for "no headers", so header-less calls
+# allocate nothing until _perform_request copies it.
+_EMPTY_HEADERS: Mapping[str, str] = types.MappingProxyType({})
+
+
+# Credential headers (compared lowercase) are formatted on every request
+# and never enter the module-level caches below, so tokens and cookies are
+# not kept alive after their session drops them.
+_UNCACHED_HEADERS = frozenset(("authorization", "proxy-authorization", "cookie"))
+
+
+def validate_header(name: str, value: str) -> None:
     """
-    HTTP request builder and sender.
+    Check that a header can be written without injecting extra lines.
+
+    Args:
+        name: Header name.
+        value: Header value.
+
+    Raises:
+        ValueError: If the name or value contains CR, LF or NUL.
     """
+    # Validate against HTTP header injection attacks
+    if "\r" in name or "\n" in name or "\r" in value or "\n" in value:
+        raise ValueError(f"Invalid character in header {name}: {value!r}")
+    if "\x00" in name or "\x00" in value:
+        raise ValueError(f"Null byte in header {name}: {value!r}")
 
-    _session_instance: Optional["Session"] = None
 
-    @classmethod
-    def set_session_instance(cls, session: Optional["Session"]) -> None:
-        """Sets the current session instance for the request."""
-        cls._session_instance = session
+def _format_header_line(name: str, value: str) -> str:
+    """
+    Validate one header and format it as a ``"Name: value\r\n"`` line.
+
+    Args:
+        name: Header name.
+        value: Header value.
+
+    Returns:
+        Formatted header line including the trailing CRLF.
+
+    Raises:
+        ValueError: If the name or value contains CR, LF or NUL.
+    """
+    validate_header(name, value)
+    return f"{name}: {value}\r\n"
+
+
+@functools.lru_cache(maxsize=512)
+def _header_line(name: str, value: str) -> str:
+    """
+    Cached :func:`_format_header_line` for non-credential headers.
+
+    Session headers and the default ``Host``/``User-Agent`` repeat on every
+    request, so their lines are checked and formatted once and then served
+    from the cache.
+    """
+    return _format_header_line(name, value)
+
+
+def _build_head(
+    method: str, path: str, header_items: Tuple[Tuple[str, str], ...]
+) -> bytes:
+    """
+    Encode the request line and header block, terminated by an empty line.
+
+    Args:
+        method: HTTP method.
+        path: Request target.
+        header_items: Final ``(name, value)`` pairs, in send order.
+
+    Raises:
+        ValueError: If a header name or value contains CR, LF or NUL.
+    """
+    lines = [
+        (_format_header_line if k.lower() in _UNCACHED_HEADERS else _header_line)(k, v)
+        for k, v in header_items
+    ]
+    return f"{method} {path} HTTP/1.1\r\n{''.join(lines)}\r\n".encode("utf-8")
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_head(
+    method: str, path: str, header_items: Tuple[Tuple[str, str], ...]
+) -> bytes:
+    """
+    Cached :func:`_build_head` for requests without credential headers.
+
+    Polling or scraping through a session sends the same method, path and
+    headers over and over, so the encoded bytes are cached on exactly
+    those inputs; any change in a header value is simply a different key.
+    """
+    return _build_head(method, path, header_items)
+
+
+def _request_head(
+    method: str, path: str, header_items: Tuple[Tuple[str, str], ...]
+) -> bytes:
+    """Encode the head via :func:`_encode_head` unless it carries credentials."""
+    for name, _ in header_items:
+        if name.lower() in _UNCACHED_HEADERS:
+            return _build_head(method, path, header_items)
+    return _encode_head(method, path, header_items)
+
+
+class Request:
+    """
+    HTTP request builder and sender.
+    """
 
     @staticmethod
     def build_request(
@@ -68,7 +174,6 @@ class Request:
         """
         Builds the raw HTTP request bytes.
         """
-        request_line = f"{method} {path} HTTP/1.1\r\n"
         default_headers = {
             "Host": host,
             "Connection": "close",
@@ -86,19 +191,7 @@ class Request:
         else:
             body_bytes = b""
 
-        headers_str = ""
-        for k, v in final_headers.items():
-            # Validate against HTTP header injection attacks
-            if "\r" in k or "\n" in k or "\r" in v or "\n" in v:
-                raise ValueError(f"Invalid character in header {k}: {v!r}")
-            if "\x00" in k or "\x00" in v:
-                raise ValueError(f"Null byte in header {k}: {v!r}")
-            headers_str += f"{k}: {v}\r\n"
-
-        full_request = (request_line + headers_str + "\r\n").encode(
-            "utf-8"
-        ) + body_bytes
-        return full_request
+        return _request_head(method, path, tuple(final_headers.items())) + body_bytes
 
     @staticmethod
     def build_request_headers(
@@ -125,7 +218,6 @@ class Request:
         Returns:
             Encoded request line and headers ending with \\r\\n\\r\\n.
         """
-        request_line = f"{method} {path} HTTP/1.1\r\n"
         default_headers = {
             "Host": host,
             "Connection": "close",
@@ -136,15 +228,7 @@ class Request:
         if chunked:
             final_headers["Transfer-Encoding"] = "chunked"
 
-        headers_str = ""
-        for k, v in final_headers.items():
-            if "\r" in k or "\n" in k or "\r" in v or "\n" in v:
-                raise ValueError(f"Invalid character in header {k}: {v!r}")
-            if "\x00" in k or "\x00" in v:
-                raise ValueError(f"Null byte in header {k}: {v!r}")
-            headers_str += f"{k}: {v}\r\n"
-
-        return (request_line + headers_str + "\r\n").encode("utf-8")
+        return _request_head(method, path, tuple(final_headers.items()))
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-branches
@@ -159,15 +243,19 @@ class Request:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
+        session: Optional["Session"] = None,
     ) -> Response:
         """
         Sends an HTTP request with automatic redirects support.
+
+        If ``session`` is given, cookies from every response (including
+        redirects) are stored in it.
         """
         history: list[Response] = []
         visited_urls = {url}
         current_url = url
         current_method = method
-        current_headers = headers or {}
+        current_headers: Mapping[str, str] = headers or _EMPTY_HEADERS
         current_body = body
 
         # Ensure timeout is a Timeout object
@@ -185,6 +273,7 @@ class Request:
                 timeout_obj,
                 connection,
                 limits=limits,
+                session=session,
             )
 
             # Check for redirect
@@ -229,10 +318,15 @@ class Request:
                         if not k.lower().startswith("content-")
                     }
 
-                # Strip Authorization if host changed
+                # Strip Authorization if host changed (without touching
+                # the caller's dict)
                 if parsed_new.netloc != parsed_current.netloc:
-                    if "Authorization" in current_headers:
-                        del current_headers["Authorization"]
+                    if _H_AUTHORIZATION in current_headers:
+                        current_headers = {
+                            k: v
+                            for k, v in current_headers.items()
+                            if k != _H_AUTHORIZATION
+                        }
 
                 # If connection was specific, we shouldn't reuse it for redirect
                 # to different host
@@ -254,17 +348,18 @@ class Request:
         cls,
         method: str,
         url: str,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         body: Optional[Union[str, bytes, Iterator[bytes], IO[bytes]]],
         timeout: Timeout,
         connection: Optional[Connection],
         limits: Optional[Dict[str, int]] = None,
+        session: Optional["Session"] = None,
     ) -> Response:
         """Internal method to perform a single HTTP request."""
         parsed = urllib.parse.urlparse(url)
-        scheme = parsed.scheme
         host = parsed.hostname
-        port = parsed.port or (443 if scheme == "https" else 80)
+        default_port, use_ssl = SCHEME_INFO.get(parsed.scheme, DEFAULT_SCHEME_INFO)
+        port = parsed.port or default_port
         path = parsed.path or "/"
         if parsed.query:
             path += f"?{parsed.query}"
@@ -272,7 +367,7 @@ class Request:
         if not host:
             raise RequestError("Invalid URL: could not determine host")
 
-        headers_dict = headers.copy()
+        headers_dict = dict(headers)
         headers_dict.setdefault("Connection", "close")
 
         # Determine if body is a streaming iterable
@@ -298,7 +393,7 @@ class Request:
             conn = Connection(
                 host,
                 port,
-                use_ssl=(scheme == "https"),
+                use_ssl=use_ssl,
                 timeout=timeout,
             )
 
@@ -338,9 +433,8 @@ class Request:
 
             resp_obj = Response(response_data, connection=conn, limits=limits)
 
-            session_instance = getattr(cls, "_session_instance", None)
-            if session_instance:
-                session_instance._update_cookies_from_response(resp_obj)
+            if session is not None:
+                session._update_cookies_from_response(resp_obj)
 
             return resp_obj
 
@@ -525,13 +619,6 @@ class AsyncRequest:
     Asynchronous HTTP request builder and sender.
     """
 
-    _session_instance: Optional["AsyncSession"] = None
-
-    @classmethod
-    def set_session_instance(cls, session: Optional["AsyncSession"]) -> None:
-        """Sets the current session instance for the async request."""
-        cls._session_instance = session
-
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals,too-many-branches
     async def send(
@@ -547,13 +634,19 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
+        session: Optional["AsyncSession"] = None,
     ) -> Response:
-        """Sends an async request with automatic redirects support."""
+        """
+        Sends an async request with automatic redirects support.
+
+        If ``session`` is given, cookies from every response (including
+        redirects) are stored in it.
+        """
         history: list[Response] = []
         visited_urls = {url}
         current_url = url
         current_method = method
-        current_headers = headers or {}
+        current_headers: Mapping[str, str] = headers or _EMPTY_HEADERS
         current_body = body
 
         if isinstance(timeout, Timeout):
@@ -570,6 +663,7 @@ class AsyncRequest:
                 timeout_obj,
                 connection,
                 limits=limits,
+                session=session,
             )
 
             # Check for redirect
@@ -611,10 +705,15 @@ class AsyncRequest:
                         if not k.lower().startswith("content-")
                     }
 
-                # Strip Authorization if host changed
+                # Strip Authorization if host changed (without touching
+                # the caller's dict)
                 if parsed_new.netloc != parsed_current.netloc:
-                    if "Authorization" in current_headers:
-                        del current_headers["Authorization"]
+                    if _H_AUTHORIZATION in current_headers:
+                        current_headers = {
+                            k: v
+                            for k, v in current_headers.items()
+                            if k != _H_AUTHORIZATION
+                        }
 
                 continue
 
@@ -630,19 +729,20 @@ class AsyncRequest:
         cls,
         method: str,
         url: str,
-        headers: Dict[str, str],
+        headers: Mapping[str, str],
         body: Optional[
             Union[str, bytes, Iterator[bytes], AsyncIterator[bytes], IO[bytes]]
         ],
         timeout: Timeout,
         connection: Optional[AsyncConnection],
         limits: Optional[Dict[str, int]] = None,
+        session: Optional["AsyncSession"] = None,
     ) -> Response:
         """Internal method to perform a single async HTTP request."""
         parsed = urllib.parse.urlparse(url)
-        scheme = parsed.scheme
         host = parsed.hostname
-        port = parsed.port or (443 if scheme == "https" else 80)
+        default_port, use_ssl = SCHEME_INFO.get(parsed.scheme, DEFAULT_SCHEME_INFO)
+        port = parsed.port or default_port
         path = parsed.path or "/"
         if parsed.query:
             path += f"?{parsed.query}"
@@ -650,7 +750,7 @@ class AsyncRequest:
         if not host:
             raise RequestError("Invalid URL: could not determine host")
 
-        headers_dict = headers.copy()
+        headers_dict = dict(headers)
         headers_dict.setdefault("Connection", "close")
 
         # Determine if body is a streaming iterable
@@ -681,7 +781,7 @@ class AsyncRequest:
             conn = AsyncConnection(
                 host,
                 port,
-                use_ssl=(scheme == "https"),
+                use_ssl=use_ssl,
                 timeout=timeout,
             )
 
@@ -744,9 +844,8 @@ class AsyncRequest:
 
             resp_obj = Response(response_data, limits=limits)
 
-            session_instance = getattr(cls, "_session_instance", None)
-            if session_instance:
-                session_instance._update_cookies_from_response(resp_obj)
+            if session is not None:
+                session._update_cookies_from_response(resp_obj)
 
             return resp_obj
 
@@ -754,9 +853,12 @@ class AsyncRequest:
             if conn is not connection:
                 await conn.close()
 
+    # Verb helpers hand back the ``send`` coroutine directly rather than
+    # wrapping it in a second coroutine frame that only awaits once.
+
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def get(
+    def get(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -765,8 +867,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "GET",
             url,
             headers=headers,
@@ -779,7 +881,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def post(
+    def post(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -791,8 +893,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "POST",
             url,
             headers=headers,
@@ -806,7 +908,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def put(
+    def put(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -818,8 +920,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "PUT",
             url,
             headers=headers,
@@ -833,7 +935,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def delete(
+    def delete(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -845,8 +947,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "DELETE",
             url,
             headers=headers,
@@ -860,7 +962,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def patch(
+    def patch(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -872,8 +974,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "PATCH",
             url,
             headers=headers,
@@ -887,7 +989,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def head(
+    def head(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -896,8 +998,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "HEAD",
             url,
             headers=headers,
@@ -910,7 +1012,7 @@ class AsyncRequest:
 
     @classmethod
     # pylint: disable=too-many-arguments,too-many-positional-arguments,missing-function-docstring
-    async def options(
+    def options(
         cls,
         url: str,
         headers: Optional[Dict[str, str]] = None,
@@ -919,8 +1021,8 @@ class AsyncRequest:
         allow_redirects: bool = True,
         max_redirects: int = 30,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
-        return await cls.send(
+    ) -> Coroutine[Any, Any, Response]:
+        return cls.send(
             "OPTIONS",
             url,
             headers=headers,
@@ -8,24 +8,84 @@ including status line, headers, and body parsing.
 
 # pylint: disable=line-too-long,unused-import,unused-variable
 
+import functools
 import json as std_json
-from typing import Any, Dict, Generator, List, Optional, Union, cast
+import socket
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from reqivo.exceptions import InvalidResponseError, ProtocolError
 
 # pylint: disable=unused-import
-from reqivo.http.body import iter_read_chunked, read_exact
+from reqivo.http.body import iter_read_chunked, read_chunked, read_exact
 from reqivo.http.headers import Headers
 from reqivo.http.http11 import HttpParser
 from reqivo.transport.connection import Connection
 
 __all__ = ["ResponseParseError", "Response"]
 
+# Lowercase, matching the keys of the parser's normalized field dict
+_K_CT = "content-type"
+_K_TE = "transfer-encoding"
+_K_CL = "content-length"
+
+# Codecs with a fast strict decoder, tried before falling back to "replace".
+_STRICT_FIRST_ENCODINGS = frozenset(("utf-8", "utf8", "ascii", "us-ascii"))
+
+# Bits of Response._flags.
+_F_STREAM = 1 << 0
+_F_CONSUMED = 1 << 1
+_F_CHUNKED = 1 << 2
+
+# Charsets whose bytes json.loads can decode directly (RFC 8259 mandates UTF-8).
+_JSON_BYTES_CHARSETS = frozenset(("utf-8", "utf8"))
+
+
+@functools.lru_cache(maxsize=8)
+def _parser_for(limits_items: Tuple[Tuple[str, int], ...]) -> HttpParser:
+    """
+    Return a shared HttpParser for the given limits.
+
+    HttpParser only holds its size limits, so a single instance per
+    distinct limits configuration can parse any number of responses.
+
+    Args:
+        limits_items: Sorted ``(name, value)`` pairs of parser limits.
+
+    Returns:
+        Cached parser configured with those limits.
+    """
+    return HttpParser(**dict(limits_items))
+
 
 class ResponseParseError(Exception):
     """Exception raised when HTTP response parsing fails."""
 
 
+def _iter_recv_until_eof(
+    sock: socket.socket, chunk_size: int
+) -> Generator[bytes, None, None]:
+    """
+    Yield data from ``sock`` until the peer closes the connection.
+
+    Reads go into one reusable buffer via ``recv_into`` so the only
+    allocation per chunk is the exact-size ``bytes`` handed to the caller.
+
+    Args:
+        sock: Connected socket to read from.
+        chunk_size: Maximum number of bytes per chunk.
+
+    Yields:
+        Bytes chunks of at most ``chunk_size`` bytes.
+    """
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = sock.recv_into(buf, chunk_size)
+        if not n:
+            break
+        yield view[:n].tobytes()
+
+
 class Response:
     """
     Represents a parsed HTTP response.
@@ -44,14 +104,17 @@ class Response:
         "raw",
         "status_line",
         "status_code",
-        "headers",
-        "body",
+        "_headers",
+        "_header_fields",
+        "_body",
+        "_body_view",
         "url",
         "_connection",
-        "_stream",
-        "_consumed",
+        "_flags",
         "history",
         "_limits",
+        "_content_type",
+        "_content_length",
     )
 
     def __init__(
@@ -73,15 +136,18 @@ class Response:
         self.raw: bytes = raw_response
         self.status_line: str = ""
         self.status_code: int = 0
-        self.headers: Headers = Headers()
-        self.body: bytes = b""
+        self._headers: Optional[Headers] = None
+        self._header_fields: Dict[str, List[str]] = {}
+        self._body: Optional[bytes] = b""
+        self._body_view: memoryview = memoryview(b"")
         self.url: Optional[str] = None
         self.history: list["Response"] = []
         self._limits = limits or {}
 
         self._connection = connection
-        self._stream = stream
-        self._consumed = False
+        self._flags = _F_STREAM if stream else 0
+        self._content_type: str = ""
+        self._content_length: Optional[str] = None
 
         self._parse_response()
 
@@ -90,27 +156,94 @@ class Response:
         """Alias for status_code for compatibility."""
         return self.status_code
 
+    @property
+    def headers(self) -> Headers:
+        """
+        Response headers (case-insensitive).
+
+        Built on first access from the fields collected by the parser, so
+        responses whose headers are never inspected skip the wrapper.
+        """
+        headers = self._headers
+        if headers is None:
+            # pylint: disable=protected-access
+            headers = self._headers = Headers._from_normalized(self._header_fields)
+        return headers
+
+    @headers.setter
+    def headers(self, value: Headers) -> None:
+        # Body framing and charset are cached from the parsed head; keep
+        # them in step with the headers that replace it.
+        self._headers = value
+        self._content_type = value.get(_K_CT) or ""
+        self._content_length = value.get(_K_CL)
+        if any("chunked" in item.lower() for item in value.get_all(_K_TE)):
+            self._flags |= _F_CHUNKED
+        else:
+            self._flags &= ~_F_CHUNKED
+
+    @property
+    def body(self) -> bytes:
+        """
+        Response body as bytes (full content if stream=False).
+
+        The parsed body is kept as a view over ``raw`` and only copied into
+        a ``bytes`` object the first time it is requested.
+        """
+        body = self._body
+        if body is None:
+            body = self._body = self._body_view.tobytes()
+        return body
+
+    @body.setter
+    def body(self, value: bytes) -> None:
+        self._body = value
+        self._body_view = memoryview(value)
+
     @property
     def stream(self) -> bool:
         """Whether the response is streamed."""
-        return self._stream
+        return bool(self._flags & _F_STREAM)
+
+    @property
+    def _consumed(self) -> bool:
+        """Whether the body has been fully read from the connection."""
+        return bool(self._flags & _F_CONSUMED)
+
+    @_consumed.setter
+    def _consumed(self, value: bool) -> None:
+        if value:
+            self._flags |= _F_CONSUMED
+        else:
+            self._flags &= ~_F_CONSUMED
 
     def _parse_response(self) -> None:
         """
         Internal method to parse the raw response.
         """
         try:
-            parser = HttpParser(**self._limits)
-            # parse_response returns (status_code, status_line, headers, body_buffer)
-            # headers is Dict[str, List[str]]
-            status_code, status_line, headers_dict, body_buffer = parser.parse_response(
-                self.raw
-            )
+            parser = _parser_for(tuple(sorted(self._limits.items())))
+            # parse_head returns (status_code, status_line, fields, body_offset)
+            # fields maps lowercase header names to lists of values
+            status_code, status_line, fields, body_offset = parser.parse_head(self.raw)
 
             self.status_code = status_code
             self.status_line = status_line
-            self.headers = Headers(cast(Dict[str, Union[str, List[str]]], headers_dict))
-            self.body = body_buffer
+            self._header_fields = fields
+            self._body = None
+            self._body_view = memoryview(self.raw)[body_offset:]
+
+            content_type = fields.get(_K_CT)
+            if content_type:
+                self._content_type = ", ".join(content_type)
+            transfer_encoding = fields.get(_K_TE)
+            if transfer_encoding and any(
+                "chunked" in value.lower() for value in transfer_encoding
+            ):
+                self._flags |= _F_CHUNKED
+            content_length = fields.get(_K_CL)
+            if content_length:
+                self._content_length = ", ".join(content_length)
 
         except (ProtocolError, InvalidResponseError) as e:
             self.close()
@@ -129,30 +262,32 @@ class Response:
         Yields:
             Bytes chunks.
         """
-        if self._consumed:
+        if self._flags & _F_CONSUMED:
             # Already consumed (or fully read in body)
             yield self.body
             return
 
         # First yield any data already in buffer
-        if self.body:
-            yield self.body
+        if self._body_view:
+            buffered = self._body
+            yield self._body_view.tobytes() if buffered is None else buffered
             self.body = b""  # Clear memory
 
-        if not self._stream or not self._connection or not self._connection.sock:
+        if (
+            not self._flags & _F_STREAM
+            or not self._connection
+            or not self._connection.sock
+        ):
             # Nothing else to read
             return
 
         try:
             # Determine read strategy
-            transfer_encoding = cast(
-                str, self.headers.get("Transfer-Encoding", "")
-            ).lower()
-            content_length = self.headers.get("Content-Length")
+            content_length = self._content_length
 
             sock = self._connection.sock
 
-            if "chunked" in transfer_encoding:
+            if self._flags & _F_CHUNKED:
                 yield from iter_read_chunked(sock)
 
             elif content_length is not None:
@@ -177,51 +312,113 @@ class Response:
 
                 # Let's assume standard behavior: read until EOF.
 
-                while True:
-                    chunk = sock.recv(chunk_size)
-                    if not chunk:
-                        break
-                    yield chunk
+                yield from _iter_recv_until_eof(sock, chunk_size)
 
             else:
                 # No CL, no Chunked -> read until connection closes
+                yield from _iter_recv_until_eof(sock, chunk_size)
+
+        finally:
+            self._flags |= _F_CONSUMED
+            self.close()
+
+    def _read_full_body(self, chunk_size: int = 65536) -> bytes:
+        """
+        Drain the rest of a streamed body without going through iter_content.
+
+        Reads the remaining Content-Length bytes, the whole chunked body, or
+        everything up to EOF in a single tight loop, then closes the
+        connection.
+
+        Args:
+            chunk_size: Maximum number of bytes requested per recv call.
+
+        Returns:
+            Buffered body bytes followed by everything read from the socket.
+        """
+        if not self._connection or not self._connection.sock:
+            return self.body
+
+        body = self._body_view
+
+        try:
+            sock = self._connection.sock
+            if self._flags & _F_CHUNKED:
+                return b"".join((body, read_chunked(sock)))
+
+            parts: List[Union[bytes, memoryview]] = [body]
+            try:
+                remaining = int(self._content_length or "") - len(body)
+            except ValueError:
+                remaining = -1
+
+            if remaining >= 0:
+                while remaining > 0:
+                    chunk = sock.recv(min(remaining, chunk_size))
+                    if not chunk:
+                        break
+                    parts.append(chunk)
+                    remaining -= len(chunk)
+            else:
                 while True:
                     chunk = sock.recv(chunk_size)
                     if not chunk:
                         break
-                    yield chunk
+                    parts.append(chunk)
+
+            return b"".join(parts)
 
         finally:
-            self._consumed = True
+            self._flags |= _F_CONSUMED
             self.close()
 
+    def _buffer_stream(self) -> None:
+        """Load the rest of a streamed body into memory, if not done yet."""
+        if (self._flags & (_F_STREAM | _F_CONSUMED)) == _F_STREAM:
+            self.body = self._read_full_body()
+            self._flags |= _F_CONSUMED
+
+    def _charset(self) -> Optional[str]:
+        """Return the charset declared in Content-Type, if any."""
+        content_type = self._content_type
+        if "charset=" in content_type:
+            return content_type.rsplit("charset=", maxsplit=1)[-1].split(";")[0].strip()
+        return None
+
     def text(self, encoding: Optional[str] = None) -> str:
         """
         Return decoded text.
         Note: Accessing .text on a stream (without iterating) consumes it into memory.
         """
-        if self._stream and not self._consumed:
-            # Load full content into memory
-            params = []
-            for chunk in self.iter_content():
-                params.append(chunk)
-            self.body = b"".join(params)
-            self._consumed = True
+        self._buffer_stream()
 
         if encoding is None:
-            content_type = cast(str, self.headers.get("Content-Type", ""))
-            if "charset=" in content_type:
-                encoding = content_type.split("charset=")[-1].split(";")[0].strip()
-            else:
-                encoding = "utf-8"  # default fallback
-
-        return self.body.decode(encoding, errors="replace")
+            encoding = self._charset() or "utf-8"  # default fallback
+
+        if encoding.lower() in _STRICT_FIRST_ENCODINGS:
+            # Clean input stays on the decoder's fast path; only malformed
+            # bodies pay for the replacement error handler.
+            try:
+                return str(self._body_view, encoding)
+            except UnicodeDecodeError:
+                pass
+        # Decoding straight from the view skips materializing ``body``.
+        return str(self._body_view, encoding, "replace")
 
     def json(self) -> Any:
         """
         Returns JSON-decoded body.
         """
         try:
+            charset = self._charset()
+            if charset is None or charset.lower() in _JSON_BYTES_CHARSETS:
+                self._buffer_stream()
+                try:
+                    # json.loads detects UTF-8/16/32 on bytes itself, which
+                    # skips building an intermediate str via text().
+                    return std_json.loads(self.body)
+                except UnicodeDecodeError:
+                    pass
             return std_json.loads(self.text())
         except (std_json.JSONDecodeError, TypeError, ValueError) as exc:
             raise InvalidResponseError("Failed to decode JSON response") from exc
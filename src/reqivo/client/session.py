@@ -7,16 +7,22 @@ cookie management, authentication, and request state across multiple HTTP calls.
 """
 
 import asyncio
+import functools
+import http.cookies
+import re
 import urllib.parse
-from http.cookies import CookieError, SimpleCookie
 from typing import (
     IO,
     Any,
     AsyncIterator,
+    Awaitable,
     Callable,
+    Coroutine,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Optional,
     Tuple,
     Union,
@@ -28,14 +34,430 @@ from reqivo.client.auth import (
 )
 from reqivo.client.request import AsyncRequest, Request
 from reqivo.client.response import Response
-from reqivo.transport.connection_pool import AsyncConnectionPool, ConnectionPool
+from reqivo.http.url import DEFAULT_SCHEME_INFO, SCHEME_INFO
+from reqivo.transport.connection_pool import (
+    AsyncConnectionPool,
+    AsyncPooledConnection,
+    ConnectionPool,
+    PooledConnection,
+)
 
 __all__ = ["Session", "AsyncSession"]
 
-# pylint: disable=too-many-instance-attributes,too-many-arguments
+# pylint: disable=too-many-instance-attributes,too-many-arguments,too-many-locals
+# pylint: disable=too-many-lines
+
+
+_HTTP_SCHEME_PREFIXES = ("https://", "http://")
+
+# Header names used on every request
+_H_AUTHORIZATION = "Authorization"
+_H_COOKIE = "Cookie"
+_H_SET_COOKIE = "Set-Cookie"
+
+# Leading name=value pair of a Set-Cookie line; the name must be an
+# RFC 6265 token, the value runs up to the first ";".
+_SET_COOKIE_RE = re.compile(r"\s*([A-Za-z0-9!#$%&'*+\-.^_`|~]+)\s*=\s*([^;]*)")
+
+# RFC 3986 section 3.1: scheme = ALPHA *( ALPHA / DIGIT / "+" / "-" / "." )
+_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*:")
+
+
+def _url_origin(url: str) -> Optional[str]:
+    """
+    Return the ``scheme://netloc`` prefix of an absolute URL.
+
+    Args:
+        url: URL to split.
+
+    Returns:
+        Origin string, or None if the URL has no scheme or host.
+    """
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme and parts.netloc:
+        return f"{parts.scheme}://{parts.netloc}"
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_origin(url: str) -> Tuple[str, int, bool]:
+    """
+    Return the connection pool key for an absolute URL.
+
+    Results are cached process-wide, so repeat URLs skip urlsplit and the
+    hostname lowercasing entirely.
+
+    Args:
+        url: Absolute request URL.
+
+    Returns:
+        ``(host, port, use_ssl)`` with the host lowercased and the scheme's
+        default port filled in.
+
+    Raises:
+        ValueError: If the URL has no host (not cached).
+    """
+    # urlsplit skips the ;params handling urlparse does, which HTTP never uses
+    parsed = urllib.parse.urlsplit(url)
+    host = parsed.hostname
+    if not host:
+        raise ValueError(f"Invalid URL: could not determine host: {url}")
+    default_port, use_ssl = SCHEME_INFO.get(parsed.scheme, DEFAULT_SCHEME_INFO)
+    return host, parsed.port or default_port, use_ssl
+
+
+def _url_base_dir(url: str) -> Optional[str]:
+    """
+    Return the prefix a relative path segment is appended to by ``urljoin``.
+
+    That is the origin plus the base path up to its last ``/``. Bases whose
+    path holds dot segments or empty segments are rejected because
+    ``urljoin`` would normalize them.
+
+    Args:
+        url: Absolute base URL.
+
+    Returns:
+        Directory prefix ending in ``/``, or None if it cannot be used.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path
+    if not (parts.scheme and parts.netloc) or "/." in path or "//" in path:
+        return None
+    return f"{parts.scheme}://{parts.netloc}{path[: path.rfind('/') + 1] or '/'}"
+
+
+def _resolve_against_base(
+    url: str,
+    base_url: Optional[str],
+    base_origin: Optional[str],
+    base_dir: Optional[str],
+) -> str:
+    """
+    Resolve a request URL against a session's base URL.
+
+    Gives the same result as ``urljoin(base_url, url)`` for relative URLs,
+    but skips ``urljoin`` for the common shapes it would only concatenate.
+
+    Args:
+        url: URL to resolve (absolute or relative).
+        base_url: Session base URL, or None.
+        base_origin: Cached ``_url_origin(base_url)``.
+        base_dir: Cached ``_url_base_dir(base_url)``.
+
+    Returns:
+        Resolved URL; ``url`` unchanged if it is absolute or there is no base.
+    """
+    if not base_url or url.startswith(_HTTP_SCHEME_PREFIXES):
+        return url
+    if base_origin and url[:1] == "/" and url[1:2] != "/" and "/." not in url:
+        # Absolute path without dot segments: urljoin would only swap
+        # the path, so concatenate onto the cached origin instead.
+        return base_origin + url
+    if _SCHEME_RE.match(url):
+        return url
+    if (
+        base_dir
+        and url
+        and url[0] not in "./?#"
+        and "/." not in url
+        and "//" not in url
+    ):
+        # Plain relative segment: urljoin would append it to the base
+        # directory unchanged.
+        return base_dir + url
+    return urllib.parse.urljoin(base_url, url)
+
+
+def _parse_set_cookie(
+    line: str, parser: Optional[http.cookies.SimpleCookie] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    Extract the cookie name and value from a Set-Cookie header value.
+
+    Attributes after the first ``;`` (Path, Expires, ...) are ignored since
+    the session jar only stores name/value pairs. Malformed lines are
+    rejected by a single regex match rather than by raising.
+
+    Args:
+        line: Raw Set-Cookie header value.
+        parser: Reusable SimpleCookie for the quoted-value fallback.
+
+    Returns:
+        ``(name, value)`` tuple, or None if the line has no usable pair or
+        the name is not a valid token.
+    """
+    match = _SET_COOKIE_RE.match(line)
+    if match is None:
+        return None
+    value = match.group(2).rstrip()
+    if value[:1] == '"' and (len(value) < 2 or value[-1] != '"' or "\\" in value):
+        # Quoted value holding ";" or backslash escapes: rare enough to
+        # leave to SimpleCookie's full quoted-string handling.
+        quoted = _parse_quoted_set_cookie(line, parser)
+        if quoted is not None:
+            return quoted
+    return match.group(1), value.strip('"')
+
+
+def _parse_quoted_set_cookie(
+    line: str, parser: Optional[http.cookies.SimpleCookie] = None
+) -> Optional[Tuple[str, str]]:
+    """
+    Parse a Set-Cookie line with :class:`http.cookies.SimpleCookie`.
+
+    Args:
+        line: Raw Set-Cookie header value.
+        parser: SimpleCookie to clear and reuse; a new one is created if
+            omitted.
+
+    Returns:
+        ``(name, value)`` of the first cookie, or None if it cannot be parsed.
+    """
+    if parser is None:
+        cookie = http.cookies.SimpleCookie()
+    else:
+        cookie = parser
+        cookie.clear()
+    try:
+        cookie.load(line)
+    except http.cookies.CookieError:
+        return None
+    for name, morsel in cookie.items():
+        return name, morsel.value
+    return None
+
+
+def _as_async_hook(hook: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """
+    Return ``hook`` as a coroutine function.
+
+    Sync hooks are wrapped in a thin adapter so AsyncSession can await
+    every registered hook uniformly.
+
+    Args:
+        hook: Sync or async hook callable.
+
+    Returns:
+        ``hook`` itself if it is already a coroutine function, else an
+        async adapter calling it.
+    """
+    if asyncio.iscoroutinefunction(hook):
+        return hook
+
+    async def _adapter(*args: Any) -> Any:
+        return hook(*args)
+
+    return _adapter
+
+
+class _VersionedDict(Dict[str, str]):
+    """
+    Dictionary that counts its mutations.
+
+    Used for the session cookie jar and persistent headers: sessions compare
+    ``version`` against the value they last serialized to decide whether a
+    cached header is still valid, so every mutating dict method bumps it.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if key in self and dict.__getitem__(self, key) == value:
+            return
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other: Any) -> "_VersionedDict":  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.version += 1
+
+    def pop(self, *args: Any) -> Any:
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, str]:
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, *args: Any) -> Any:
+        self.version += 1
+        return super().setdefault(*args)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
+class _SessionState:
+    """
+    Header and cookie state shared by :class:`Session` and :class:`AsyncSession`.
+
+    Holds the persistent headers, the cookie jar, the Set-Cookie lines not
+    yet parsed into it and the cached merge of headers, ``Authorization``
+    and ``Cookie``. Subclasses initialize the slots.
+    """
+
+    __slots__ = (
+        "_cookies",
+        "_cookie_header",
+        "_cookie_header_version",
+        "_cookie_parser",
+        "_pending_set_cookies",
+        "_headers",
+        "_base_headers",
+        "_base_headers_key",
+        "_credential_headers",
+        "_auth_header",
+    )
+
+    _cookies: _VersionedDict
+    _cookie_header: str
+    _cookie_header_version: int
+    _cookie_parser: http.cookies.SimpleCookie
+    _pending_set_cookies: List[str]
+    _headers: _VersionedDict
+    _base_headers: Dict[str, str]
+    _base_headers_key: Optional[Tuple[int, int, Optional[str]]]
+    _credential_headers: Dict[str, str]
+    _auth_header: Optional[str]
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """Stored cookies, sent with every request as the Cookie header."""
+        if self._pending_set_cookies:
+            self._apply_pending_cookies()
+        return self._cookies
+
+    @cookies.setter
+    def cookies(self, value: Dict[str, str]) -> None:
+        # Cookies received so far are superseded by the new jar
+        self._pending_set_cookies = []
+        self._cookies = _VersionedDict(value)
+        self._cookie_header_version = -1
+        self._base_headers_key = None
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Persistent headers sent with every request."""
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: Dict[str, str]) -> None:
+        self._headers = _VersionedDict(value)
+        self._base_headers_key = None
+
+    def _merge_headers(self, headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """
+        Build the header dict for a single request.
+
+        Args:
+            headers: Per-call headers, if any.
+
+        Returns:
+            Fresh dict owned by the caller; session credentials and cookies
+            take precedence over per-call values.
+        """
+        base_headers = self._get_base_headers()
+        if not headers:
+            # Copy so hooks and redirect handling cannot alter the cached dict
+            return base_headers.copy()
+        if not base_headers:
+            return dict(headers)
+        # copy() clones the cached dict wholesale; credentials go last so
+        # they override per-call values
+        merged_headers = base_headers.copy()
+        merged_headers.update(headers)
+        credentials = self._credential_headers
+        if credentials:
+            merged_headers.update(credentials)
+        return merged_headers
+
+    def _get_base_headers(self) -> Dict[str, str]:
+        """
+        Return session headers merged with Authorization and Cookie.
+
+        The merged dict is cached and rebuilt only when the persistent
+        headers, the cookie jar or the credentials change. Callers must
+        copy it before handing it to code that may mutate it.
+
+        Returns:
+            Cached dict of headers shared by every request.
+        """
+        if self._pending_set_cookies:
+            self._apply_pending_cookies()
+        key = (self._headers.version, self._cookies.version, self._auth_header)
+        if key != self._base_headers_key:
+            credentials: Dict[str, str] = {}
+            if self._auth_header:
+                credentials[_H_AUTHORIZATION] = self._auth_header
+            if self._cookies:
+                credentials[_H_COOKIE] = self._build_cookie_header()
+            self._credential_headers = credentials
+            self._base_headers = {**self._headers, **credentials}
+            self._base_headers_key = key
+        return self._base_headers
+
+    def _update_cookies_from_response(self, response: Response) -> None:
+        """
+        Queue the response's Set-Cookie headers for the cookie jar.
+
+        The lines are only parsed when the jar is next needed (reading
+        ``cookies`` or building the next request's headers), so responses
+        whose cookies are never used cost no parsing.
 
+        Args:
+            response: Response object containing Set-Cookie headers.
+        """
+        headers = response.headers
+        if _H_SET_COOKIE not in headers:
+            # Most responses set no cookies
+            return
+        self._pending_set_cookies += headers.get_all(_H_SET_COOKIE)
+
+    def _apply_pending_cookies(self) -> None:
+        """Parse queued Set-Cookie lines into the cookie jar, in arrival order."""
+        pending = self._pending_set_cookies
+        self._pending_set_cookies = []
+        jar = self._cookies
+        parser = self._cookie_parser
+        # Set-Cookie headers should be handled individually
+        for cookie_val in pending:
+            pair = _parse_set_cookie(cookie_val, parser)
+            if pair is not None:
+                jar[pair[0]] = pair[1]
+
+    def _build_cookie_header(self) -> str:
+        """
+        Build Cookie header string from stored cookies.
+
+        The string is cached and only rebuilt after the cookie jar changes.
 
-class Session:
+        Returns:
+            Cookie header value in 'name=value; name2=value2' format.
+        """
+        if self._pending_set_cookies:
+            self._apply_pending_cookies()
+        jar = self._cookies
+        if self._cookie_header_version != jar.version:
+            self._cookie_header = "; ".join([f"{k}={v}" for k, v in jar.items()])
+            self._cookie_header_version = jar.version
+        return self._cookie_header
+
+
+class Session(_SessionState):
     """
     HTTP session manager for persistent connections and state.
 
@@ -52,13 +474,13 @@ class Session:
     """
 
     __slots__ = (
-        "cookies",
-        "headers",
         "pool",
         "_basic_auth",
         "_bearer_token",
         "limits",
-        "base_url",
+        "_base_url",
+        "_base_origin",
+        "_base_dir",
         "default_timeout",
         "_pre_request_hooks",
         "_post_response_hooks",
@@ -70,6 +492,7 @@ class Session:
         base_url: Optional[str] = None,
         default_timeout: Optional[float] = 5,
         limits: Optional[Dict[str, int]] = None,
+        pool: Optional[ConnectionPool] = None,
     ) -> None:
         """
         Initialize a new HTTP session.
@@ -78,17 +501,45 @@ class Session:
             base_url: Base URL prefix for relative URLs.
             default_timeout: Default timeout in seconds for all requests.
             limits: Default resource limits (max_header_size, etc.).
+            pool: Connection pool to use. Defaults to a new pool owned by
+                this session; pass the same pool to several sessions to
+                share connections between them.
         """
-        self.cookies: Dict[str, str] = {}
-        self.headers: Dict[str, str] = {}
-        self.pool = ConnectionPool()
+        self._cookies = _VersionedDict()
+        self._cookie_header = ""
+        self._cookie_header_version = -1
+        # Reused by the quoted-value Set-Cookie fallback
+        self._cookie_parser = http.cookies.SimpleCookie()
+        # Raw Set-Cookie lines not yet parsed into the jar
+        self._pending_set_cookies: List[str] = []
+        self._headers = _VersionedDict()
+        self._base_headers: Dict[str, str] = {}
+        self._base_headers_key: Optional[Tuple[int, int, Optional[str]]] = None
+        self._credential_headers: Dict[str, str] = {}
+        self.pool = pool if pool is not None else ConnectionPool()
         self._basic_auth: Optional[Tuple[str, str]] = None
         self._bearer_token: Optional[str] = None
+        self._auth_header: Optional[str] = None
         self.limits = limits
+        self._base_url: Optional[str] = None
+        self._base_origin: Optional[str] = None
+        self._base_dir: Optional[str] = None
         self.base_url = base_url
         self.default_timeout = default_timeout
-        self._pre_request_hooks: List[Callable[..., Any]] = []
-        self._post_response_hooks: List[Callable[..., Any]] = []
+        # Tuples: rebuilt on registration, cheap to iterate on every request
+        self._pre_request_hooks: Tuple[Callable[..., Any], ...] = ()
+        self._post_response_hooks: Tuple[Callable[..., Any], ...] = ()
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """Base URL prefix for relative URLs."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: Optional[str]) -> None:
+        self._base_url = value
+        self._base_origin = _url_origin(value) if value else None
+        self._base_dir = _url_base_dir(value) if value else None
 
     def set_basic_auth(self, username: str, password: str) -> None:
         """
@@ -101,6 +552,7 @@ class Session:
         self._basic_auth = (username, password)
         # Clear bearer token if basic auth is set
         self._bearer_token = None
+        self._auth_header = build_basic_auth_header(username, password)
 
     def set_bearer_token(self, token: str) -> None:
         """
@@ -112,6 +564,7 @@ class Session:
         self._bearer_token = token
         # Clear basic auth if bearer token is set
         self._basic_auth = None
+        self._auth_header = build_bearer_auth_header(token)
 
     def add_pre_request_hook(self, hook: Callable[..., Any]) -> None:
         """
@@ -124,7 +577,7 @@ class Session:
         Args:
             hook: Callable that transforms request parameters.
         """
-        self._pre_request_hooks.append(hook)
+        self._pre_request_hooks += (hook,)
 
     def add_post_response_hook(self, hook: Callable[..., Any]) -> None:
         """
@@ -137,35 +590,7 @@ class Session:
         Args:
             hook: Callable that transforms the response.
         """
-        self._post_response_hooks.append(hook)
-
-    def _update_cookies_from_response(self, response: Response) -> None:
-        """
-        Parse Set-Cookie headers and update internal cookie jar.
-
-        Args:
-            response: Response object containing Set-Cookie headers.
-        """
-        # Set-Cookie headers should be handled individually
-        set_cookies = response.headers.get_all("Set-Cookie")
-        if set_cookies:
-            cookie = SimpleCookie()
-            for cookie_val in set_cookies:
-                try:
-                    cookie.load(cookie_val)
-                    for key, morsel in cookie.items():
-                        self.cookies[key] = morsel.value
-                except CookieError:
-                    continue
-
-    def _build_cookie_header(self) -> str:
-        """
-        Build Cookie header string from stored cookies.
-
-        Returns:
-            Cookie header value in 'name=value; name2=value2' format.
-        """
-        return "; ".join([f"{k}={v}" for k, v in self.cookies.items()])
+        self._post_response_hooks += (hook,)
 
     def _resolve_url(self, url: str) -> str:
         """
@@ -177,9 +602,9 @@ class Session:
         Returns:
             Resolved absolute URL.
         """
-        if self.base_url and not urllib.parse.urlparse(url).scheme:
-            return urllib.parse.urljoin(self.base_url, url)
-        return url
+        return _resolve_against_base(
+            url, self._base_url, self._base_origin, self._base_dir
+        )
 
     # pylint: disable=too-many-arguments
     def _request(
@@ -209,38 +634,24 @@ class Session:
         url = self._resolve_url(url)
         effective_timeout = timeout if timeout is not None else self.default_timeout
 
-        merged_headers = {**self.headers, **(headers or {})}
-        # Inject Authorization header if applicable
-        if self._basic_auth:
-            merged_headers["Authorization"] = build_basic_auth_header(
-                self._basic_auth[0], self._basic_auth[1]
-            )
-        elif self._bearer_token:
-            merged_headers["Authorization"] = build_bearer_auth_header(
-                self._bearer_token
-            )
-        if self.cookies:
-            merged_headers["Cookie"] = self._build_cookie_header()
+        pre_hooks = self._pre_request_hooks
+        merged_headers: Optional[Dict[str, str]] = None
+        has_cookies = bool(self._cookies or self._pending_set_cookies)
+        if headers or self._headers or has_cookies or self._auth_header or pre_hooks:
+            merged_headers = self._merge_headers(headers)
+        # Otherwise there is nothing to merge and Request.send gets None
 
         # Execute pre-request hooks (FIFO)
-        for hook in self._pre_request_hooks:
-            method, url, merged_headers = hook(method, url, merged_headers)
-
-        parsed = urllib.parse.urlparse(url)
-        host = parsed.hostname
-        if not host:
-            raise ValueError(f"Invalid URL: could not determine host: {url}")
-
-        conn = self.pool.get_connection(
-            host,
-            parsed.port or (443 if parsed.scheme == "https" else 80),
-            use_ssl=(parsed.scheme == "https"),
-            timeout=effective_timeout,
-        )
+        if pre_hooks:
+            for hook in pre_hooks:
+                method, url, merged_headers = hook(method, url, merged_headers)
 
-        try:
-            Request.set_session_instance(self)
+        host, port, use_ssl = _parse_origin(url)
 
+        # Put back on success, discarded if anything below raises
+        with PooledConnection(
+            self.pool, host, port, use_ssl, effective_timeout
+        ) as conn:
             response = Request.send(
                 method,
                 url,
@@ -249,24 +660,25 @@ class Session:
                 timeout=effective_timeout,
                 connection=conn,
                 limits=limits or self.limits,
+                session=self,
             )
 
-            self._update_cookies_from_response(response)
-
-            # Execute post-response hooks (FIFO)
-            for hook in self._post_response_hooks:
-                response = hook(response)
+            if response.stream:
+                # The body is still on the connection: keep it until the
+                # hooks are done
+                return self._run_post_response_hooks(response)
 
-            self.pool.put_connection(conn)
+        # Body already read: other callers can reuse the connection while
+        # the hooks run
+        return self._run_post_response_hooks(response)
 
-            return response
-
-        except Exception:
-            self.pool.discard_connection(conn)
-            raise
-
-        finally:
-            Request.set_session_instance(None)
+    def _run_post_response_hooks(self, response: Response) -> Response:
+        """Execute post-response hooks (FIFO)."""
+        post_hooks = self._post_response_hooks
+        if post_hooks:
+            for hook in post_hooks:
+                response = hook(response)
+        return response
 
     def get(
         self,
@@ -369,7 +781,7 @@ class Session:
         self.pool.close_all()
 
 
-class AsyncSession:
+class AsyncSession(_SessionState):
     """
     Asynchronous HTTP session manager.
 
@@ -383,13 +795,13 @@ class AsyncSession:
     """
 
     __slots__ = (
-        "cookies",
-        "headers",
         "pool",
         "_basic_auth",
         "_bearer_token",
         "limits",
-        "base_url",
+        "_base_url",
+        "_base_origin",
+        "_base_dir",
         "default_timeout",
         "_pre_request_hooks",
         "_post_response_hooks",
@@ -401,6 +813,7 @@ class AsyncSession:
         base_url: Optional[str] = None,
         default_timeout: Optional[float] = 5,
         limits: Optional[Dict[str, int]] = None,
+        pool: Optional[AsyncConnectionPool] = None,
     ) -> None:
         """
         Initialize a new async HTTP session.
@@ -409,27 +822,58 @@ class AsyncSession:
             base_url: Base URL prefix for relative URLs.
             default_timeout: Default timeout in seconds for all requests.
             limits: Default resource limits (max_header_size, etc.).
+            pool: Connection pool to use. Defaults to a new pool owned by
+                this session; pass the same pool to several sessions on one
+                event loop to share connections between them.
         """
-        self.cookies: Dict[str, str] = {}
-        self.headers: Dict[str, str] = {}
-        self.pool = AsyncConnectionPool()
+        self._cookies = _VersionedDict()
+        self._cookie_header = ""
+        self._cookie_header_version = -1
+        # Reused by the quoted-value Set-Cookie fallback
+        self._cookie_parser = http.cookies.SimpleCookie()
+        # Raw Set-Cookie lines not yet parsed into the jar
+        self._pending_set_cookies: List[str] = []
+        self._headers = _VersionedDict()
+        self._base_headers: Dict[str, str] = {}
+        self._base_headers_key: Optional[Tuple[int, int, Optional[str]]] = None
+        self._credential_headers: Dict[str, str] = {}
+        self.pool = pool if pool is not None else AsyncConnectionPool()
         self._basic_auth: Optional[Tuple[str, str]] = None
         self._bearer_token: Optional[str] = None
+        self._auth_header: Optional[str] = None
         self.limits = limits
+        self._base_url: Optional[str] = None
+        self._base_origin: Optional[str] = None
+        self._base_dir: Optional[str] = None
         self.base_url = base_url
         self.default_timeout = default_timeout
-        self._pre_request_hooks: List[Callable[..., Any]] = []
-        self._post_response_hooks: List[Callable[..., Any]] = []
+        # Tuples of coroutine functions; sync hooks are wrapped by
+        # _as_async_hook() when registered
+        self._pre_request_hooks: Tuple[Callable[..., Awaitable[Any]], ...] = ()
+        self._post_response_hooks: Tuple[Callable[..., Awaitable[Any]], ...] = ()
+
+    @property
+    def base_url(self) -> Optional[str]:
+        """Base URL prefix for relative URLs."""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: Optional[str]) -> None:
+        self._base_url = value
+        self._base_origin = _url_origin(value) if value else None
+        self._base_dir = _url_base_dir(value) if value else None
 
     def set_basic_auth(self, username: str, password: str) -> None:
         """Set basic auth."""
         self._basic_auth = (username, password)
         self._bearer_token = None
+        self._auth_header = build_basic_auth_header(username, password)
 
     def set_bearer_token(self, token: str) -> None:
         """Set bearer token."""
         self._bearer_token = token
         self._basic_auth = None
+        self._auth_header = build_bearer_auth_header(token)
 
     def add_pre_request_hook(self, hook: Callable[..., Any]) -> None:
         """
@@ -441,7 +885,7 @@ class AsyncSession:
         Args:
             hook: Callable that transforms request parameters.
         """
-        self._pre_request_hooks.append(hook)
+        self._pre_request_hooks += (_as_async_hook(hook),)
 
     def add_post_response_hook(self, hook: Callable[..., Any]) -> None:
         """
@@ -453,39 +897,25 @@ class AsyncSession:
         Args:
             hook: Callable that transforms the response.
         """
-        self._post_response_hooks.append(hook)
-
-    def _build_cookie_header(self) -> str:
-        return "; ".join([f"{k}={v}" for k, v in self.cookies.items()])
-
-    def _update_cookies_from_response(self, response: Response) -> None:
-        set_cookies = response.headers.get_all("Set-Cookie")
-        if set_cookies:
-            cookie = SimpleCookie()
-            for cookie_val in set_cookies:
-                try:
-                    cookie.load(cookie_val)
-                    for key, morsel in cookie.items():
-                        self.cookies[key] = morsel.value
-
-                except CookieError:
-                    continue
+        self._post_response_hooks += (_as_async_hook(hook),)
 
     def _resolve_url(self, url: str) -> str:
         """Resolve URL against base_url if relative."""
-        if self.base_url and not urllib.parse.urlparse(url).scheme:
-            return urllib.parse.urljoin(self.base_url, url)
-        return url
+        return _resolve_against_base(
+            url, self._base_url, self._base_origin, self._base_dir
+        )
 
-    async def get(
+    # Verb helpers return the ``_request`` coroutine directly instead of
+    # wrapping it in an extra coroutine frame.
+    def get(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async GET request."""
-        return await self._request(
+        return self._request(
             "GET",
             url,
             headers=headers,
@@ -493,7 +923,7 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def post(
+    def post(
         self,
         url: str,
         *,
@@ -503,9 +933,9 @@ class AsyncSession:
         ] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async POST request."""
-        return await self._request(
+        return self._request(
             "POST",
             url,
             headers=headers,
@@ -514,7 +944,7 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def put(
+    def put(
         self,
         url: str,
         *,
@@ -524,9 +954,9 @@ class AsyncSession:
         ] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async PUT request."""
-        return await self._request(
+        return self._request(
             "PUT",
             url,
             headers=headers,
@@ -535,7 +965,7 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def delete(
+    def delete(
         self,
         url: str,
         *,
@@ -545,9 +975,9 @@ class AsyncSession:
         ] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async DELETE request."""
-        return await self._request(
+        return self._request(
             "DELETE",
             url,
             headers=headers,
@@ -556,7 +986,7 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def patch(
+    def patch(
         self,
         url: str,
         *,
@@ -566,9 +996,9 @@ class AsyncSession:
         ] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async PATCH request."""
-        return await self._request(
+        return self._request(
             "PATCH",
             url,
             headers=headers,
@@ -577,15 +1007,15 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def head(
+    def head(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async HEAD request."""
-        return await self._request(
+        return self._request(
             "HEAD",
             url,
             headers=headers,
@@ -593,15 +1023,15 @@ class AsyncSession:
             limits=limits,
         )
 
-    async def options(
+    def options(
         self,
         url: str,
         headers: Optional[Dict[str, str]] = None,
         timeout: Optional[float] = None,
         limits: Optional[Dict[str, int]] = None,
-    ) -> Response:
+    ) -> Coroutine[Any, Any, Response]:
         """Send an async OPTIONS request."""
-        return await self._request(
+        return self._request(
             "OPTIONS",
             url,
             headers=headers,
@@ -609,7 +1039,30 @@ class AsyncSession:
             limits=limits,
         )
 
-    # pylint: disable=too-many-arguments
+    async def send_many(self, requests: Iterable[Mapping[str, Any]]) -> List[Response]:
+        """
+        Send several requests concurrently and wait for all of them.
+
+        Each request is a mapping with ``method`` and ``url`` keys plus any of
+        ``headers``, ``body``, ``timeout`` and ``limits``. All requests are
+        scheduled in one ``asyncio.gather`` call and go through the same
+        path as the verb helpers (hooks, cookies, connection reuse).
+
+        Args:
+            requests: Request specifications, e.g.
+                ``{"method": "GET", "url": "/items"}``.
+
+        Returns:
+            Responses in the same order as ``requests``.
+
+        Raises:
+            Exception: The first error raised by any request; the remaining
+                requests still run to completion and release their
+                connections.
+        """
+        return list(await asyncio.gather(*(self._request(**spec) for spec in requests)))
+
+    # pylint: disable=too-many-arguments,too-many-branches
     async def _request(
         self,
         method: str,
@@ -626,40 +1079,25 @@ class AsyncSession:
         url = self._resolve_url(url)
         effective_timeout = timeout if timeout is not None else self.default_timeout
 
-        merged_headers = {**self.headers, **(headers or {})}
-
-        if self._basic_auth:
-            merged_headers["Authorization"] = build_basic_auth_header(*self._basic_auth)
-        elif self._bearer_token:
-            merged_headers["Authorization"] = build_bearer_auth_header(
-                self._bearer_token
-            )
-
-        if self.cookies:
-            merged_headers["Cookie"] = self._build_cookie_header()
+        pre_hooks = self._pre_request_hooks
+        merged_headers: Optional[Dict[str, str]] = None
+        has_cookies = bool(self._cookies or self._pending_set_cookies)
+        if headers or self._headers or has_cookies or self._auth_header or pre_hooks:
+            merged_headers = self._merge_headers(headers)
+        # Otherwise there is nothing to merge and Request.send gets None
 
         # Execute pre-request hooks (FIFO, supports sync and async)
-        for hook in self._pre_request_hooks:
-            if asyncio.iscoroutinefunction(hook):
+        if pre_hooks:
+            for hook in pre_hooks:
                 method, url, merged_headers = await hook(method, url, merged_headers)
-            else:
-                method, url, merged_headers = hook(method, url, merged_headers)
 
-        parsed = urllib.parse.urlparse(url)
-        host = parsed.hostname
-        if not host:
-            raise ValueError(f"Invalid URL: {url}")
+        host, port, use_ssl = _parse_origin(url)
 
-        conn = await self.pool.get_connection(
-            host,
-            parsed.port or (443 if parsed.scheme == "https" else 80),
-            use_ssl=(parsed.scheme == "https"),
-            timeout=effective_timeout,
-        )
-
-        # Inject session into AsyncRequest to handle cookies
-        AsyncRequest.set_session_instance(self)
-        try:
+        # Put back on success, discarded if anything below raises or the
+        # task is cancelled
+        async with AsyncPooledConnection(
+            self.pool, host, port, use_ssl, effective_timeout
+        ) as conn:
             response = await AsyncRequest.send(
                 method,
                 url,
@@ -668,26 +1106,25 @@ class AsyncSession:
                 timeout=effective_timeout,
                 connection=conn,
                 limits=limits or self.limits,
+                session=self,
             )
 
-            # Execute post-response hooks (FIFO, supports sync and async)
-            for hook in self._post_response_hooks:
-                if asyncio.iscoroutinefunction(hook):
-                    response = await hook(response)
-                else:
-                    response = hook(response)
-
-            # Put connection back to pool if it's still open
-            await self.pool.put_connection(conn)
-
-            return response
-
-        except Exception:
-            # If request failed, connection might be broken
-            await self.pool.discard_connection(conn)
-            raise
-        finally:
-            AsyncRequest.set_session_instance(None)
+            if response.stream:
+                # The body is still on the connection: keep it until the
+                # hooks are done
+                return await self._run_post_response_hooks(response)
+
+        # Body already read: other tasks can reuse the connection while
+        # the hooks run
+        return await self._run_post_response_hooks(response)
+
+    async def _run_post_response_hooks(self, response: Response) -> Response:
+        """Execute post-response hooks (FIFO, supports sync and async)."""
+        post_hooks = self._post_response_hooks
+        if post_hooks:
+            for hook in post_hooks:
+                response = await hook(response)
+        return response
 
     async def close(self) -> None:
         """Close pool."""
@@ -15,8 +15,9 @@ import time
 import urllib.parse
 from typing import Dict, List, Optional, Union
 
-from reqivo.client.request import Request
+from reqivo.client.request import Request, validate_header
 from reqivo.client.response import Response
+from reqivo.http.url import SCHEME_INFO
 from reqivo.transport.connection import AsyncConnection, Connection
 from reqivo.utils.websocket_utils import (
     OPCODE_BINARY,
@@ -28,7 +29,6 @@ from reqivo.utils.websocket_utils import (
     WebSocketError,
     apply_mask,
     create_frame,
-    parse_frame_header,
 )
 
 __all__ = ["MAX_FRAME_SIZE", "WebSocket", "AsyncWebSocket"]
@@ -36,16 +36,143 @@ __all__ = ["MAX_FRAME_SIZE", "WebSocket", "AsyncWebSocket"]
 # Maximum frame payload size (10 MB)
 MAX_FRAME_SIZE = 10 * 1024 * 1024
 
+# Minimum recv() size for the sync client's receive buffer
+_RECV_SIZE = 64 * 1024
+
+# Bytes of extended payload length that follow each 7-bit length marker
+_EXTENDED_LENGTH_SIZE = {126: 2, 127: 8}
+
+# Consumed bytes at the front of WebSocket._buffer that trigger compaction
+_BUFFER_COMPACT_SIZE = 64 * 1024
+
+# GUID appended to the client key before hashing (RFC 6455 Section 1.3)
+_WS_MAGIC = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+# Handshake headers that never change between connections (RFC 6455 4.1)
+_BASE_WS_HEADERS = (
+    ("Upgrade", "websocket"),
+    ("Connection", "Upgrade"),
+    ("Sec-WebSocket-Version", "13"),
+)
+
+
+def _handshake_headers(
+    host: str,
+    key: str,
+    extra: Optional[Dict[str, str]],
+    subprotocols: Optional[List[str]],
+) -> Dict[str, str]:
+    """
+    Build the opening handshake headers.
+
+    Args:
+        host: Value of the Host header (``host:port``).
+        key: Base64 Sec-WebSocket-Key for this connection.
+        extra: User-supplied headers; these override the defaults.
+        subprotocols: Subprotocols to offer, if any.
+
+    Returns:
+        Header mapping for ``Request.build_request``.
+    """
+    headers = {"Host": host, "Sec-WebSocket-Key": key}
+    headers.update(_BASE_WS_HEADERS)
+    if extra:
+        headers.update(extra)
+    if subprotocols:
+        headers["Sec-WebSocket-Protocol"] = ", ".join(subprotocols)
+    return headers
+
+
+def _build_handshake_template() -> str:
+    """
+    Render the plain opening handshake once through ``Request.build_request``.
+
+    Placeholders stand in for the path, host and key, so the template keeps
+    the builder's header order and defaults (e.g. ``User-Agent``) instead of
+    restating them here.
+
+    Returns:
+        ``str.format`` template with ``{path}``, ``{host}`` and ``{key}``.
+    """
+    fields = ("path", "host", "key")
+    marks = {name: f"\x01{name}\x01" for name in fields}
+    headers = _handshake_headers(marks["host"], marks["key"], None, None)
+    head = Request.build_request("GET", marks["path"], marks["host"], headers, None)
+    template = head.decode("utf-8").replace("{", "{{").replace("}", "}}")
+    for name in fields:
+        template = template.replace(marks[name], "{" + name + "}")
+    return template
+
+
+# Opening handshake without user headers, as Request.build_request()
+# produces it for the same header set
+_HANDSHAKE_TEMPLATE = _build_handshake_template()
+
+
+def _encode_handshake(
+    path: str,
+    host: str,
+    key: str,
+    extra: Optional[Dict[str, str]],
+    subprotocols: Optional[List[str]],
+) -> bytes:
+    """
+    Encode the opening handshake request.
+
+    The plain handshake always has the same shape, so it is formatted from
+    a template. The random key is also kept out of the request builder's
+    head cache, which it would otherwise fill with one-off entries. User
+    headers and subprotocols go through ``Request.build_request``.
+
+    Args:
+        path: Request target, including any query string.
+        host: Value of the Host header (``host:port``).
+        key: Base64 Sec-WebSocket-Key for this connection.
+        extra: User-supplied headers.
+        subprotocols: Subprotocols to offer, if any.
+
+    Returns:
+        Encoded request line and headers.
+
+    Raises:
+        ValueError: If the path, host or a header contains CR, LF or NUL.
+    """
+    if "\r" in path or "\n" in path or "\x00" in path:
+        raise ValueError(f"Invalid character in request target: {path!r}")
+    if extra or subprotocols:
+        headers = _handshake_headers(host, key, extra, subprotocols)
+        return Request.build_request("GET", path, host, headers, None)
+    # Same Host check the builder applies to every header line
+    validate_header("Host", host)
+    return _HANDSHAKE_TEMPLATE.format(path=path, host=host, key=key).encode("utf-8")
+
+
+def _decode_message(payload: Union[bytes, bytearray]) -> Union[str, bytes]:
+    """
+    Return a message as text if it is valid UTF-8, otherwise as bytes.
+
+    Args:
+        payload: Complete (reassembled) message payload.
+
+    Returns:
+        Decoded string, or the payload as ``bytes``.
+    """
+    try:
+        return payload.decode("utf-8")
+    except UnicodeDecodeError:
+        return bytes(payload)
+
 
 def _compute_accept_key(sec_key: str) -> str:
     """
     Compute Sec-WebSocket-Accept value from Sec-WebSocket-Key.
     As per RFC 6455 Section 4.2.2.
     """
-    magic_string = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
-    # SHA1 is required by RFC 6455, not used for security purposes
+    # The key is base64, so ASCII; SHA1 is required by RFC 6455, not used
+    # for security purposes
     sha1 = hashlib.sha1(
-        (sec_key + magic_string).encode("utf-8"), usedforsecurity=False
+        sec_key.encode("ascii") + _WS_MAGIC, usedforsecurity=False
     ).digest()
     return base64.b64encode(sha1).decode("ascii")
 
@@ -63,6 +190,7 @@ class WebSocket:
         "sock",
         "connected",
         "_buffer",
+        "_buf_pos",
         "max_frame_size",
         "_auto_reconnect",
         "_max_reconnect_attempts",
@@ -87,6 +215,8 @@ class WebSocket:
         self.sock: Optional[socket.socket] = None
         self.connected = False
         self._buffer = bytearray()
+        # Start of unread data in _buffer; consumed bytes are dropped lazily
+        self._buf_pos = 0
         self.max_frame_size = max_frame_size
         self._auto_reconnect = auto_reconnect
         self._max_reconnect_attempts = max_reconnect_attempts
@@ -99,14 +229,13 @@ class WebSocket:
             raise ValueError("URL must use ws:// or wss:// scheme")
 
         host = parsed.hostname
-        port = parsed.port or (443 if parsed.scheme == "wss" else 80)
+        default_port, use_ssl = SCHEME_INFO[parsed.scheme]
+        port = parsed.port or default_port
 
         if not host:
             raise ValueError("Invalid URL: Hostname missing")
 
-        conn = Connection(
-            host, port, use_ssl=(parsed.scheme == "wss"), timeout=self.timeout
-        )
+        conn = Connection(host, port, use_ssl=use_ssl, timeout=self.timeout)
         self.sock = conn.open()
 
         key = base64.b64encode(os.urandom(16)).decode("ascii")
@@ -114,38 +243,32 @@ class WebSocket:
         if parsed.query:
             path += f"?{parsed.query}"
 
-        headers = {
-            "Host": f"{host}:{port}",
-            "Upgrade": "websocket",
-            "Connection": "Upgrade",
-            "Sec-WebSocket-Key": key,
-            "Sec-WebSocket-Version": "13",
-        }
-
-        if self.headers:
-            for k, v in self.headers.items():
-                headers[k] = v
-
-        if self.subprotocols:
-            headers["Sec-WebSocket-Protocol"] = ", ".join(self.subprotocols)
-
-        req_bytes = Request.build_request("GET", path, host, headers, None)
+        req_bytes = _encode_handshake(
+            path, f"{host}:{port}", key, self.headers, self.subprotocols
+        )
         if self.sock is None:
             raise WebSocketError("Failed to open connection")
         self.sock.sendall(req_bytes)
 
-        header_data = b""
-        while b"\r\n\r\n" not in header_data:
-            chunk = self.sock.recv(4096)
+        # The handshake is read into the frame buffer itself, so whatever
+        # follows the headers is already in place for recv()
+        header_data = self._buffer
+        header_data.clear()
+        self._buf_pos = 0
+        end = -1
+        while end < 0:
+            chunk = self.sock.recv(_RECV_SIZE)
             if not chunk:
                 raise WebSocketError("Connection closed during handshake")
+            # Only the new bytes (plus 3 for a split terminator) need scanning
+            start = max(len(header_data) - 3, 0)
             header_data += chunk
+            end = header_data.find(b"\r\n\r\n", start)
 
-        parts = header_data.split(b"\r\n\r\n", 1)
-        headers_bytes = parts[0]
-        self._buffer = bytearray(parts[1])
-
-        response = Response(headers_bytes + b"\r\n\r\n")
+        end += 4
+        response = Response(bytes(header_data[:end]))
+        # Anything after the handshake is the start of the first frame
+        del header_data[:end]
 
         if response.status_code != 101:
             raise WebSocketError(
@@ -166,7 +289,8 @@ class WebSocket:
     def _reconnect(self) -> None:
         """Attempt to re-establish the WebSocket connection."""
         self.connected = False
-        self._buffer = bytearray()
+        self._buffer.clear()
+        self._buf_pos = 0
         if self.sock:
             with contextlib.suppress(Exception):
                 self.sock.close()
@@ -195,6 +319,28 @@ class WebSocket:
                 time.sleep(delay)
                 self._reconnect()
 
+    def _recv_into_buffer(self, needed: int) -> None:
+        """
+        Append at least one more read from the socket to the receive buffer.
+
+        Reads are sized ``max(needed, _RECV_SIZE)`` so small frames arriving
+        together are picked up by one call and large payloads by few.
+
+        Args:
+            needed: Number of bytes the caller is still missing.
+
+        Raises:
+            ConnectionError: If the socket is gone or the peer closed it.
+        """
+        if self.sock is None:
+            raise ConnectionError("WebSocket is not connected")
+
+        chunk = self.sock.recv(max(needed, _RECV_SIZE))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+
+        self._buffer.extend(chunk)
+
     def recv(self) -> Union[str, bytes]:
         """Receives data from the WebSocket."""
         # pylint: disable=too-many-branches,too-many-statements
@@ -202,30 +348,32 @@ class WebSocket:
             raise ConnectionError("WebSocket is not connected")
 
         message_payload = bytearray()
+        buffer = self._buffer
         while True:
-            while len(self._buffer) < 2:
-                if self.sock is None:
-                    raise ConnectionError("WebSocket is not connected")
-
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    raise ConnectionError("Connection closed")
-
-                self._buffer.extend(chunk)
-
-            header_info = parse_frame_header(bytes(self._buffer))
-            if header_info is None:
-                if self.sock is None:
-                    raise ConnectionError("WebSocket is not connected")
-
-                chunk = self.sock.recv(4096)
-                if not chunk:
-                    raise ConnectionError("Connection closed")
+            pos = self._buf_pos
+            while len(buffer) - pos < 2:
+                self._recv_into_buffer(2 - (len(buffer) - pos))
+
+            # Decode the header in place, as the async client does
+            b0 = buffer[pos]
+            b1 = buffer[pos + 1]
+            fin = b0 & 0x80
+            opcode = b0 & 0x0F
+            masked = b1 & 0x80
+            payload_len = b1 & 0x7F
 
-                self._buffer.extend(chunk)
+            header_len = 2 + _EXTENDED_LENGTH_SIZE.get(payload_len, 0)
+            if masked:
+                header_len += 4
+            if len(buffer) - pos < header_len:
+                self._recv_into_buffer(header_len - (len(buffer) - pos))
                 continue
 
-            header_len, payload_len, fin, _, _, _, opcode, masked = header_info
+            if payload_len >= 126:
+                payload_len = int.from_bytes(
+                    buffer[pos + 2 : pos + 2 + _EXTENDED_LENGTH_SIZE[payload_len]],
+                    "big",
+                )
 
             # Validate frame size to prevent DoS
             if payload_len > self.max_frame_size:
@@ -234,24 +382,31 @@ class WebSocket:
                     f"(max: {self.max_frame_size})"
                 )
 
-            total_len = header_len + payload_len
-            while len(self._buffer) < total_len:
-                needed = total_len - len(self._buffer)
-                if self.sock is None:
-                    raise ConnectionError("WebSocket is not connected")
-
-                chunk = self.sock.recv(min(needed, 4096))
-                if not chunk:
-                    raise ConnectionError("Connection closed")
-
-                self._buffer.extend(chunk)
-
-            frame_data = bytes(self._buffer[:total_len])
-            self._buffer = self._buffer[total_len:]
-            payload_bytes = frame_data[header_len:]
-            if masked:
-                mask_key = frame_data[header_len - 4 : header_len]
-                payload_bytes = apply_mask(payload_bytes, mask_key)
+            payload_start = pos + header_len
+            frame_end = payload_start + payload_len
+            while len(buffer) < frame_end:
+                self._recv_into_buffer(frame_end - len(buffer))
+
+            # Copy the payload out of the buffer exactly once; unmasking
+            # reads the view directly and produces the result in that copy
+            with memoryview(buffer) as view:
+                if masked:
+                    payload_bytes = apply_mask(
+                        view[payload_start:frame_end],
+                        view[payload_start - 4 : payload_start].tobytes(),
+                    )
+                else:
+                    payload_bytes = view[payload_start:frame_end].tobytes()
+
+            # Advance past the frame instead of re-slicing the unread tail;
+            # the consumed prefix is only dropped once it is worth a move
+            if frame_end == len(buffer):
+                buffer.clear()
+                frame_end = 0
+            elif frame_end > _BUFFER_COMPACT_SIZE or frame_end > len(buffer) // 2:
+                del buffer[:frame_end]
+                frame_end = 0
+            self._buf_pos = frame_end
 
             if opcode == OPCODE_CLOSE:
                 self.close()
@@ -270,17 +425,15 @@ class WebSocket:
                     break
 
             elif opcode in (OPCODE_TEXT, OPCODE_BINARY):
-                message_payload = bytearray(payload_bytes)
                 if fin:
-                    break
+                    # Unfragmented message: decode the payload as received
+                    return _decode_message(payload_bytes)
+                message_payload = bytearray(payload_bytes)
 
             else:
                 raise WebSocketError(f"Unknown opcode: {opcode}")
 
-        try:
-            return message_payload.decode("utf-8")
-        except UnicodeDecodeError:
-            return bytes(message_payload)
+        return _decode_message(message_payload)
 
     def ping(self, payload: bytes = b"") -> None:
         """Sends a PING frame."""
@@ -366,13 +519,14 @@ class AsyncWebSocket:
             raise ValueError("URL must use ws:// or wss:// scheme")
 
         host = parsed.hostname
-        port = parsed.port or (443 if parsed.scheme == "wss" else 80)
+        default_port, use_ssl = SCHEME_INFO[parsed.scheme]
+        port = parsed.port or default_port
 
         if not host:
             raise ValueError("Invalid URL: Hostname missing")
 
         self.connection = AsyncConnection(
-            host, port, use_ssl=(parsed.scheme == "wss"), timeout=self.timeout
+            host, port, use_ssl=use_ssl, timeout=self.timeout
         )
         try:
             await self.connection.open()
@@ -390,27 +544,14 @@ class AsyncWebSocket:
         if parsed.query:
             path += f"?{parsed.query}"
 
-        headers = {
-            "Host": f"{host}:{port}",
-            "Upgrade": "websocket",
-            "Connection": "Upgrade",
-            "Sec-WebSocket-Key": key,
-            "Sec-WebSocket-Version": "13",
-        }
-
-        if self.headers:
-            for k, v in self.headers.items():
-                headers[k] = v
-
-        if self.subprotocols:
-            headers["Sec-WebSocket-Protocol"] = ", ".join(self.subprotocols)
-
-        req_bytes = Request.build_request("GET", path, host, headers, None)
+        req_bytes = _encode_handshake(
+            path, f"{host}:{port}", key, self.headers, self.subprotocols
+        )
         self.writer.write(req_bytes)
         await self.writer.drain()
 
-        header_data = b""
-        while b"\r\n\r\n" not in header_data:
+        header_lines: List[bytes] = []
+        while True:
             try:
                 if self.timeout:
                     line = await asyncio.wait_for(
@@ -425,11 +566,12 @@ class AsyncWebSocket:
             except asyncio.IncompleteReadError as exc:
                 raise WebSocketError("Connection closed during handshake") from exc
 
-            header_data += line
+            header_lines.append(line)
+            # readuntil returns whole lines, so the blank one ends the head
+            if line == b"\r\n" and len(header_lines) > 1:
+                break
 
-        parts = header_data.split(b"\r\n\r\n", 1)
-        headers_bytes = parts[0]
-        response = Response(headers_bytes + b"\r\n\r\n")
+        response = Response(b"".join(header_lines))
 
         if response.status_code != 101:
             raise WebSocketError(
@@ -450,7 +592,7 @@ class AsyncWebSocket:
     async def _reconnect(self) -> None:
         """Attempt to re-establish the async WebSocket connection."""
         self.connected = False
-        self._buffer = bytearray()
+        self._buffer.clear()
         if self.connection:
             with contextlib.suppress(Exception):
                 await self.connection.close()
@@ -489,39 +631,38 @@ class AsyncWebSocket:
 
         message_payload = bytearray()
         while True:
-            try:
-                if self.reader is None:
-                    raise WebSocketError("WebSocket is not connected")
+            reader = self.reader
+            if reader is None:
+                raise WebSocketError("WebSocket is not connected")
 
-                header2 = await self.reader.readexactly(2)
+            try:
+                header2 = await reader.readexactly(2)
+
+                b0 = header2[0]
+                b1 = header2[1]
+
+                fin = bool(b0 & 0x80)
+                opcode = b0 & 0x0F
+                masked = bool(b1 & 0x80)
+                payload_len = b1 & 0x7F
+
+                # Extended length and masking key arrive back to back, so
+                # fetch both with a single read
+                length_size = _EXTENDED_LENGTH_SIZE.get(payload_len, 0)
+                extras_size = length_size + 4 if masked else length_size
+                mask_key = b""
+                if extras_size:
+                    extras = await reader.readexactly(extras_size)
+                    if length_size:
+                        payload_len = int.from_bytes(extras[:length_size], "big")
+                    if masked:
+                        mask_key = extras[length_size:]
 
             except asyncio.IncompleteReadError as exc:
                 raise WebSocketError(
                     "Connection closed while reading frame header"
                 ) from exc
 
-            b0 = header2[0]
-            b1 = header2[1]
-
-            fin = bool(b0 & 0x80)
-            opcode = b0 & 0x0F
-            masked = bool(b1 & 0x80)
-            payload_len = b1 & 0x7F
-
-            if payload_len == 126:
-                if self.reader is None:
-                    raise WebSocketError("WebSocket is not connected")
-
-                header_extra = await self.reader.readexactly(2)
-                payload_len = int.from_bytes(header_extra, "big")
-
-            elif payload_len == 127:
-                if self.reader is None:
-                    raise WebSocketError("WebSocket is not connected")
-
-                header_extra = await self.reader.readexactly(8)
-                payload_len = int.from_bytes(header_extra, "big")
-
             # Validate frame size to prevent DoS
             if payload_len > self.max_frame_size:
                 raise WebSocketError(
@@ -529,17 +670,8 @@ class AsyncWebSocket:
                     f"(max: {self.max_frame_size})"
                 )
 
-            mask_key = b""
-            if masked:
-                if self.reader is None:
-                    raise WebSocketError("WebSocket is not connected")
-                mask_key = await self.reader.readexactly(4)
-
             try:
-                if self.reader is None:
-                    raise WebSocketError("WebSocket is not connected")
-
-                payload = await self.reader.readexactly(payload_len)
+                payload = await reader.readexactly(payload_len)
 
             except asyncio.IncompleteReadError as exc:
                 raise WebSocketError(
@@ -547,7 +679,7 @@ class AsyncWebSocket:
                 ) from exc
 
             if masked:
-                payload = apply_mask(bytes(payload), mask_key)
+                payload = apply_mask(payload, mask_key)
 
             if opcode == OPCODE_CLOSE:
                 await self.close()
@@ -566,18 +698,15 @@ class AsyncWebSocket:
                     break
 
             elif opcode in (OPCODE_TEXT, OPCODE_BINARY):
-                message_payload = bytearray(payload)
                 if fin:
-                    break
+                    # Unfragmented message: decode the payload as received
+                    return _decode_message(payload)
+                message_payload = bytearray(payload)
 
             else:
                 raise WebSocketError(f"Unknown opcode: {opcode}")
 
-        try:
-            return message_payload.decode("utf-8")
-
-        except UnicodeDecodeError:
-            return bytes(message_payload)
+        return _decode_message(message_payload)
 
     async def ping(self, payload: bytes = b"") -> None:
         """Async ping."""
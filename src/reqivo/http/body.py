@@ -5,7 +5,7 @@ HTTP body management (chunked, fixed-length, streaming) for Reqivo.
 
 import asyncio
 import socket
-from typing import IO, AsyncIterator, Generator, Iterator
+from typing import IO, AsyncIterator, Generator, Iterator, Union
 
 __all__ = [
     "read_exact",
@@ -14,49 +14,117 @@ __all__ = [
     "iter_write_chunked",
     "async_iter_write_chunked",
     "file_to_iterator",
+    "FILE_CHUNK_SIZE",
 ]
 
+# Bytes queued on an asyncio writer before waiting for it to drain
+_DRAIN_THRESHOLD = 64 * 1024
+
+# Default read size for file upload bodies
+FILE_CHUNK_SIZE = 64 * 1024
+
 
 def read_exact(sock: socket.socket, n: int) -> bytes:
     """Read exactly n bytes from the socket."""
-    data = b""
+    data = bytearray()
     while len(data) < n:
         chunk = sock.recv(n - len(data))
         if not chunk:
             raise EOFError("Socket closed prematurely")
+        if len(chunk) == n:
+            # Everything arrived in one recv: no copy needed
+            return chunk
 
         data += chunk
-    return data
+    return bytes(data)
+
+
+def _parse_chunk_size(line: Union[bytes, bytearray]) -> int:
+    """
+    Parse a chunk-size line such as ``b"1a;name=value\\r\\n"``.
+
+    Extensions after ``;`` are dropped and ``int()`` does the hex scan,
+    ignoring surrounding whitespace and the trailing CRLF.
+
+    Raises:
+        ValueError: If the size is not valid hexadecimal.
+    """
+    try:
+        return int(line.partition(b";")[0], 16)
+    except ValueError as exc:
+        raise ValueError(f"Invalid chunk size: {line!r}") from exc
+
+
+class _ChunkReader:
+    """
+    Read-ahead wrapper used while decoding a chunked body.
+
+    Size lines and CRLF trailers are served from a buffer filled by
+    ``recv`` calls of at least ``_RECV_SIZE`` bytes, instead of one
+    ``recv(1)`` per byte. Bytes read past the current chunk stay in the
+    buffer and start the next one.
+    """
+
+    __slots__ = ("_sock", "_buf", "_pos")
+
+    _RECV_SIZE = 4096
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._buf = bytearray()
+        self._pos = 0
+
+    def _fill(self, need: int, eof_message: str) -> None:
+        """Receive once, asking for at least ``need`` bytes."""
+        if self._pos:
+            del self._buf[: self._pos]
+            self._pos = 0
+        chunk = self._sock.recv(max(need, self._RECV_SIZE))
+        if not chunk:
+            raise EOFError(eof_message)
+        self._buf += chunk
+
+    def readline(self) -> bytearray:
+        """Return the next line, including its CRLF terminator."""
+        buf = self._buf
+        start = self._pos
+        end = buf.find(b"\r\n", start)
+        while end < 0:
+            scanned = len(buf) - self._pos
+            self._fill(1, "Socket closed during chunk header")
+            start = self._pos
+            end = buf.find(b"\r\n", start + max(scanned - 1, 0))
+        end += 2
+        self._pos = end
+        return buf[start:end]
+
+    def read(self, n: int) -> bytes:
+        """Return exactly ``n`` bytes."""
+        while len(self._buf) - self._pos < n:
+            self._fill(n - (len(self._buf) - self._pos), "Socket closed prematurely")
+        start = self._pos
+        self._pos = start + n
+        with memoryview(self._buf) as view:
+            return view[start : self._pos].tobytes()
 
 
 def iter_read_chunked(sock: socket.socket) -> Generator[bytes, None, None]:
     """Iterate over chunked transfer-encoded response."""
+    reader = _ChunkReader(sock)
     while True:
-        line = b""
-        while not line.endswith(b"\r\n"):
-            chunk = sock.recv(1)
-            if not chunk:
-                raise EOFError("Socket closed during chunk header")
-            line += chunk
-
-        try:
-            size_hex = line.split(b";")[0].strip()
-            size = int(size_hex, 16)
-
-        except ValueError as exc:
-            raise ValueError(f"Invalid chunk size: {line!r}") from exc
+        size = _parse_chunk_size(reader.readline())
 
         if size == 0:
             # End of chunks
             # Consume trailing CRLF
-            read_exact(sock, 2)
+            reader.read(2)
             break
 
-        data = read_exact(sock, size)
+        data = reader.read(size)
         yield data
 
         # Consume chunk trailer CRLF
-        read_exact(sock, 2)
+        reader.read(2)
 
 
 def read_chunked(sock: socket.socket) -> bytes:
@@ -78,8 +146,8 @@ def iter_write_chunked(sock: socket.socket, chunks: Iterator[bytes]) -> None:
     for chunk in chunks:
         if not chunk:
             continue
-        size_line = f"{len(chunk):x}\r\n".encode("ascii")
-        sock.sendall(size_line + chunk + b"\r\n")
+        # One formatting pass builds the whole frame without intermediates
+        sock.sendall(b"%x\r\n%b\r\n" % (len(chunk), chunk))
     # Terminating chunk
     sock.sendall(b"0\r\n\r\n")
 
@@ -92,29 +160,39 @@ async def async_iter_write_chunked(
 
     Each chunk is sent as ``{hex_size}\\r\\n{data}\\r\\n``.
     A final ``0\\r\\n\\r\\n`` terminator is sent after all chunks.
+    The writer is drained once at least ``_DRAIN_THRESHOLD`` bytes have
+    been queued rather than after every chunk.
 
     Args:
         writer: asyncio StreamWriter to write to.
         chunks: AsyncIterator yielding bytes chunks.
     """
+    pending = 0
     async for chunk in chunks:
         if not chunk:
             continue
-        size_line = f"{len(chunk):x}\r\n".encode("ascii")
-        writer.write(size_line + chunk + b"\r\n")
-        await writer.drain()
+        frame = b"%x\r\n%b\r\n" % (len(chunk), chunk)
+        writer.write(frame)
+        pending += len(frame)
+        if pending >= _DRAIN_THRESHOLD:
+            await writer.drain()
+            pending = 0
     # Terminating chunk
     writer.write(b"0\r\n\r\n")
     await writer.drain()
 
 
-def file_to_iterator(fileobj: IO[bytes], chunk_size: int = 8192) -> Iterator[bytes]:
+def file_to_iterator(
+    fileobj: IO[bytes], chunk_size: int = FILE_CHUNK_SIZE
+) -> Iterator[bytes]:
     """
     Convert a file-like object into a bytes iterator.
 
     Args:
         fileobj: File-like object opened in binary mode.
-        chunk_size: Number of bytes per chunk.
+        chunk_size: Number of bytes per chunk. The 64 KiB default keeps
+            read() calls few and each chunk frame a multiple of the
+            16 KiB TLS record size.
 
     Yields:
         Chunks of bytes read from the file.
@@ -3,11 +3,60 @@
 Robust HTTP header management for Reqivo.
 """
 
+import sys
 from typing import Any, Dict, Iterator, List, Mapping, Optional, TypeVar, Union, cast
 
 _T = TypeVar("_T")
 
-__all__ = ["Headers"]
+# Header names looked up by Reqivo itself and common in responses
+_COMMON_NAMES = tuple(
+    sys.intern(name)
+    for name in (
+        "accept",
+        "authorization",
+        "cache-control",
+        "connection",
+        "content-encoding",
+        "content-length",
+        "content-type",
+        "cookie",
+        "date",
+        "etag",
+        "host",
+        "keep-alive",
+        "last-modified",
+        "location",
+        "sec-websocket-accept",
+        "sec-websocket-extensions",
+        "sec-websocket-protocol",
+        "server",
+        "set-cookie",
+        "transfer-encoding",
+        "upgrade",
+        "user-agent",
+        "vary",
+        "www-authenticate",
+    )
+)
+
+# Lowercase and Title-Case spellings mapped to the interned lowercase name,
+# so lookups with these literals skip str.lower(). HttpParser uses the same
+# table, so parsed responses share these key objects.
+LOWER_HEADER_NAMES: Dict[str, str] = {
+    alias: name for name in _COMMON_NAMES for alias in (name, name.title())
+}
+LOWER_HEADER_NAMES.update(
+    (alias, sys.intern(alias.lower()))
+    for alias in (
+        "ETag",
+        "Sec-WebSocket-Accept",
+        "Sec-WebSocket-Extensions",
+        "Sec-WebSocket-Protocol",
+        "WWW-Authenticate",
+    )
+)
+
+__all__ = ["Headers", "LOWER_HEADER_NAMES"]
 
 
 class Headers(Mapping[str, str]):
@@ -19,17 +68,37 @@ class Headers(Mapping[str, str]):
     Access raw lists via get_all().
     """
 
-    __slots__ = ("_headers",)
+    __slots__ = ("_headers", "_joined")
 
-    def __init__(self, headers: Optional[Dict[str, Union[str, List[str]]]] = None):
+    def __init__(self, headers: Optional[Mapping[str, Union[str, List[str]]]] = None):
         self._headers: Dict[str, List[str]] = {}
+        # Comma-joined values of repeated headers, filled in by get()
+        self._joined: Optional[Dict[str, str]] = None
         if headers:
             for k, v in headers.items():
                 # Support both single values and lists
+                name = LOWER_HEADER_NAMES.get(k) or k.lower()
                 if isinstance(v, list):
-                    self._headers[k.lower()] = v
+                    self._headers[name] = v
                 else:
-                    self._headers[k.lower()] = [v]
+                    self._headers[name] = [v]
+
+    @classmethod
+    def _from_normalized(cls, headers: Dict[str, List[str]]) -> "Headers":
+        """
+        Adopt an already-normalized mapping without copying it.
+
+        Args:
+            headers: Mapping of lowercase header names to value lists, as
+                produced by the HTTP parser. It is used as-is.
+
+        Returns:
+            Headers instance backed by ``headers``.
+        """
+        instance = cls.__new__(cls)
+        instance._headers = headers
+        instance._joined = None
+        return instance
 
     def __getitem__(self, key: str) -> str:
         """Get header value (comma-joined if multiple, except Set-Cookie)."""
@@ -38,6 +107,12 @@ class Headers(Mapping[str, str]):
             raise KeyError(key)
         return cast(str, value)
 
+    def __contains__(self, key: object) -> bool:
+        """Check for a header (case-insensitive) without joining its values."""
+        return isinstance(key, str) and bool(
+            self._headers.get(LOWER_HEADER_NAMES.get(key) or key.lower())
+        )
+
     def __iter__(self) -> Iterator[str]:
         return iter(self._headers)
 
@@ -56,14 +131,23 @@ class Headers(Mapping[str, str]):
             Comma-joined string for multiple values (except Set-Cookie
             which returns first), or default if not found.
         """
-        values = self._headers.get(key.lower())
+        name = LOWER_HEADER_NAMES.get(key) or key.lower()
+        values = self._headers.get(name)
         if not values:
             return default
 
-        if key.lower() == "set-cookie":
+        if len(values) == 1 or name == "set-cookie":
+            # Nearly every header has one value; hand back the stored string
             return values[0]
 
-        return ", ".join(values)
+        # Headers never change after construction, so join repeats once
+        joined = self._joined
+        if joined is None:
+            joined = self._joined = {}
+        value = joined.get(name)
+        if value is None:
+            value = joined[name] = ", ".join(values)
+        return value
 
     def get_all(self, key: str) -> List[str]:
         """
@@ -75,4 +159,4 @@ class Headers(Mapping[str, str]):
         Returns:
             List of all values for the header, empty list if not found.
         """
-        return self._headers.get(key.lower(), [])
+        return self._headers.get(LOWER_HEADER_NAMES.get(key) or key.lower(), [])
@@ -8,6 +8,7 @@ Robust HTTP Parser implementation.
 from typing import Dict, List, Optional, Tuple
 
 from reqivo.exceptions import InvalidResponseError, ProtocolError
+from reqivo.http.headers import LOWER_HEADER_NAMES
 
 __all__ = ["HttpParser"]
 
@@ -47,25 +48,57 @@ class HttpParser:
             ProtocolError: If headers are too large or malformed.
             InvalidResponseError: If status line is invalid.
         """
-        # Check header size limit
-        if len(data) > self.max_header_size:
-            # This check is heuristic; ideally we check before finding \r\n\r\n
-            if b"\r\n\r\n" not in data[: self.max_header_size + 4]:
-                # +4 for the delimiter itself
+        status_code, status_line, lines, body_offset = self._split_head(data)
+        headers = self._parse_headers(lines)
+        return status_code, status_line, headers, data[body_offset:]
+
+    def parse_head(self, data: bytes) -> Tuple[int, str, Dict[str, List[str]], int]:
+        """
+        Parse the status line and headers of a raw HTTP response.
+
+        Unlike parse_response(), the body is not copied out of ``data``;
+        the offset at which it starts is returned instead. Header fields are
+        keyed by lowercase name, the layout :class:`Headers` stores, so they
+        can be wrapped later without re-normalizing.
+
+        Returns:
+            Tuple of (status_code, status_line, fields, body_offset)
+
+        Raises:
+            ProtocolError: If headers are too large or malformed.
+            InvalidResponseError: If status line is invalid.
+        """
+        status_code, status_line, lines, body_offset = self._split_head(data)
+        fields = self._parse_header_fields(lines)
+        return status_code, status_line, fields, body_offset
+
+    def _split_head(self, data: bytes) -> Tuple[int, str, List[str], int]:
+        """
+        Validate the head of a response and split it into lines.
+
+        Returns:
+            Tuple of (status_code, status_line, header_lines, body_offset)
+
+        Raises:
+            ProtocolError: If headers are too large or malformed.
+            InvalidResponseError: If status line is invalid.
+        """
+        # Only the first max_header_size bytes (+4 for the delimiter itself)
+        # may hold the head; bounding the search enforces the size limit
+        # without copying that prefix out of a large response.
+        header_end = data.find(b"\r\n\r\n", 0, self.max_header_size + 4)
+        if header_end == -1:
+            if len(data) > self.max_header_size:
                 raise ProtocolError(
                     f"Headers exceed maximum size of {self.max_header_size} bytes"
                 )
-
-        parts = data.split(b"\r\n\r\n", 1)
-        if len(parts) < 2:
             # If we don't have the double CRLF yet, it might be incomplete.
             # But if we are called with 'data' assumed to be complete headers:
             raise InvalidResponseError(
                 "Incomplete response: headers delimiter not found"
             )
 
-        header_bytes = parts[0]
-        body_bytes = parts[1]
+        header_bytes = data[:header_end]
 
         header_text = header_bytes.decode("iso-8859-1")
         lines = header_text.split("\r\n")
@@ -87,10 +120,7 @@ class HttpParser:
         except ValueError as exc:
             raise InvalidResponseError(f"Invalid status line: {status_line}") from exc
 
-        # Parse Headers
-        headers = self._parse_headers(lines[1:])
-
-        return status_code, status_line, headers, body_bytes
+        return status_code, status_line, lines[1:], header_end + 4
 
     def _parse_headers(self, lines: List[str]) -> Dict[str, List[str]]:
         """
@@ -101,33 +131,48 @@ class HttpParser:
             Dictionary mapping header names to lists of values.
             All headers (including Set-Cookie) can have multiple values.
         """
+        # Normalize Key: Title-Case
+        # We want "content-type" -> "Content-Type"
+        return {
+            "-".join([part.capitalize() for part in name.split("-")]): values
+            for name, values in self._parse_header_fields(lines).items()
+        }
+
+    def _parse_header_fields(self, lines: List[str]) -> Dict[str, List[str]]:
+        """
+        Parse header lines into a dictionary keyed by lowercase name.
+
+        This is the storage layout used by :class:`Headers`, so the result
+        can be adopted without re-normalizing any keys.
+
+        Returns:
+            Dictionary mapping lowercase header names to lists of values.
+        """
         headers: Dict[str, List[str]] = {}
+        max_line_size = self.max_line_size
+        common_name = LOWER_HEADER_NAMES.get
 
         for line in lines:
-            if not line:
-                continue
-
-            if len(line) > self.max_line_size:
+            if len(line) > max_line_size:
                 raise ProtocolError("Header line too long")
 
-            if ": " not in line:
-                # Robustness: ignore garbage lines if tolerance is desired,
-                # but strict HTTP/1.1 requires header: value.
-                # Let's skip empty or invalid lines to be robust against minor noise.
+            # One C-level scan both finds and splits on the separator. Strict
+            # HTTP/1.1 requires "name: value"; lines without it (including
+            # empty ones) are skipped to be robust against minor noise.
+            key, sep, value = line.partition(": ")
+            if not sep:
                 continue
 
-            key, value = line.split(": ", 1)
-
-            # Normalize Key: Title-Case
-            # We want "content-type" -> "Content-Type"
-            normalized_key = "-".join(
-                [part.capitalize() for part in key.strip().split("-")]
-            )
+            # Common names map straight to their interned lowercase form,
+            # shared with Headers lookups; others are normalized here
+            name = common_name(key) or key.strip().lower()
             clean_value = value.strip()
 
             # Accumulate all values in a list
-            if normalized_key not in headers:
-                headers[normalized_key] = []
-            headers[normalized_key].append(clean_value)
+            values = headers.get(name)
+            if values is None:
+                headers[name] = [clean_value]
+            else:
+                values.append(clean_value)
 
         return headers
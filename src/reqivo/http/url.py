@@ -3,19 +3,82 @@
 URL builder and parser for Reqivo.
 """
 
+import functools
+import re
 import urllib.parse
+from typing import Dict, Optional, Tuple
 
-__all__ = ["URL"]
+__all__ = ["URL", "SCHEME_INFO", "DEFAULT_SCHEME_INFO"]
+
+# Scheme -> (default port, use TLS), shared by the HTTP and WebSocket clients
+# so picking a connection target is a single dict lookup.
+SCHEME_INFO: Dict[str, Tuple[int, bool]] = {
+    "http": (80, False),
+    "https": (443, True),
+    "ws": (80, False),
+    "wss": (443, True),
+}
+
+# Unknown schemes behave like plain http.
+DEFAULT_SCHEME_INFO: Tuple[int, bool] = (80, False)
+
+
+# RFC 3986 Appendix B, narrowed to the plain ``scheme://host[:port]/path``
+# shape nearly every request uses. Anything else (userinfo, IPv6 literals,
+# non-ASCII or percent-encoded hosts, ``;params``, whitespace or control
+# characters, out-of-range ports) fails the match and goes through
+# urllib.parse instead; urlparse only lowercases a host up to its first
+# ``%``, so those hosts are left to it.
+_URL_RE = re.compile(
+    r"([A-Za-z][A-Za-z0-9+.\-]*)://"  # scheme
+    r"([-A-Za-z0-9._~!$&'()*+,;=]*)"  # host (ASCII reg-name, no pct-encoding)
+    r"(?::([0-9]{0,5}))?"  # port
+    r"((?:/[^\x00-\x20?#;]*)?)"  # path
+    r"(?:[?#][^\x00-\x20]*)?\Z"  # query and fragment
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse(url: str) -> Tuple[str, Optional[str], Optional[int], str]:
+    """
+    Split ``url`` into scheme, hostname, port and path.
+
+    Simple URLs are split with a single regex match; the rest fall back to
+    ``urlparse``, so results always match what ``urlparse`` reports.
+    Results are cached process-wide, so URLs seen again (the common case
+    with pooled connections) skip parsing entirely.
+
+    Args:
+        url: URL to parse.
+
+    Returns:
+        ``(scheme, hostname, port, path)`` with the scheme and hostname
+        lowercased.
+
+    Raises:
+        ValueError: If the URL or its port is malformed (not cached).
+    """
+    match = _URL_RE.match(url)
+    if match is not None:
+        scheme, host, port, path = match.groups()
+        if not port:
+            return scheme.lower(), host.lower() or None, None, path
+        if int(port) <= 65535:
+            return scheme.lower(), host.lower() or None, int(port), path
+    parsed = urllib.parse.urlparse(url)
+    return parsed.scheme, parsed.hostname, parsed.port, parsed.path
 
 
 class URL:
     """Utility class for URL parsing and information."""
 
-    __slots__ = ("parsed", "scheme", "host", "port", "path")
+    __slots__ = ("_url", "scheme", "host", "port", "path")
 
     def __init__(self, url: str):
-        self.parsed = urllib.parse.urlparse(url)
-        self.scheme = self.parsed.scheme
-        self.host = self.parsed.hostname
-        self.port = self.parsed.port
-        self.path = self.parsed.path
+        self._url = url
+        self.scheme, self.host, self.port, self.path = _parse(url)
+
+    @property
+    def parsed(self) -> urllib.parse.ParseResult:
+        """Full ``urlparse`` result, for the query, fragment and the rest."""
+        return urllib.parse.urlparse(self._url)
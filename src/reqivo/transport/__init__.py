@@ -7,6 +7,18 @@ TLS encryption, connection pooling for both synchronous and asynchronous operati
 """
 
 from .connection import AsyncConnection, Connection
-from .connection_pool import AsyncConnectionPool, ConnectionPool
+from .connection_pool import (
+    AsyncConnectionPool,
+    AsyncPooledConnection,
+    ConnectionPool,
+    PooledConnection,
+)
 
-__all__ = ["Connection", "ConnectionPool", "AsyncConnection", "AsyncConnectionPool"]
+__all__ = [
+    "Connection",
+    "ConnectionPool",
+    "AsyncConnection",
+    "AsyncConnectionPool",
+    "PooledConnection",
+    "AsyncPooledConnection",
+]
@@ -9,10 +9,12 @@ network operations.
 
 import asyncio
 import contextlib
+import functools
 import select
 import socket
 import ssl
-from typing import Any, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # pylint: disable=unused-import
 # pylint: disable=redefined-builtin
@@ -23,10 +25,163 @@ from reqivo.exceptions import (
     TimeoutError,
     TlsError,
 )
+from reqivo.transport.tls import create_ssl_context
 from reqivo.utils.timing import Timeout
 
 __all__ = ["Connection", "AsyncConnection"]
 
+# getaddrinfo() result: (family, type, proto, canonname, sockaddr) tuples.
+_AddrInfo = List[Tuple[Any, ...]]
+
+# How long resolved addresses are reused before getaddrinfo runs again.
+_ADDRINFO_TTL = 60.0
+
+# Upper bound on cached (host, port) entries; the cache is simply emptied
+# when it fills up.
+_ADDRINFO_CACHE_SIZE = 256
+
+# (host, port) -> (expiry on the monotonic clock, getaddrinfo result)
+_ADDRINFO_CACHE: Dict[Tuple[str, int], Tuple[float, _AddrInfo]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_ssl_context() -> ssl.SSLContext:
+    """
+    Return the TLS context shared by every connection.
+
+    ``ssl.create_default_context()`` loads the system CA store each time it
+    is called, so it is built once on first use and reused afterwards.
+    """
+    return create_ssl_context()
+
+
+def _cached_addrinfo(key: Tuple[str, int]) -> Optional[_AddrInfo]:
+    """Return the cached addresses for ``key`` if they have not expired."""
+    entry = _ADDRINFO_CACHE.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _store_addrinfo(key: Tuple[str, int], infos: _AddrInfo) -> None:
+    """Cache ``infos`` for ``key`` for the next ``_ADDRINFO_TTL`` seconds."""
+    if len(_ADDRINFO_CACHE) >= _ADDRINFO_CACHE_SIZE:
+        _ADDRINFO_CACHE.clear()
+    _ADDRINFO_CACHE[key] = (time.monotonic() + _ADDRINFO_TTL, infos)
+
+
+def _resolve(host: str, port: int) -> _AddrInfo:
+    """
+    Resolve ``host`` and ``port`` to stream socket addresses.
+
+    Results are cached for ``_ADDRINFO_TTL`` seconds so opening several
+    connections to the same host only runs the (blocking) resolver once.
+
+    Raises:
+        socket.gaierror: If the name cannot be resolved (not cached).
+    """
+    key = (host, port)
+    infos = _cached_addrinfo(key)
+    if infos is None:
+        infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        _store_addrinfo(key, infos)
+    return infos
+
+
+async def _async_resolve(host: str, port: int) -> _AddrInfo:
+    """Async counterpart of :func:`_resolve` sharing the same cache."""
+    key = (host, port)
+    infos = _cached_addrinfo(key)
+    if infos is None:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        _store_addrinfo(key, infos)
+    return infos
+
+
+def _create_connection(
+    address: Tuple[str, int], timeout: Optional[float] = None
+) -> socket.socket:
+    """
+    Connect a TCP socket to ``address``, like ``socket.create_connection``.
+
+    Addresses come from :func:`_resolve` instead of a fresh getaddrinfo
+    call. Each resolved address is tried in order; if all of them fail the
+    cache entry is dropped so the next attempt resolves the name again.
+
+    Args:
+        address: ``(host, port)`` to connect to.
+        timeout: Socket timeout for the connect, or None to block.
+
+    Returns:
+        Connected socket with ``timeout`` applied.
+
+    Raises:
+        OSError: The error from the last address tried.
+    """
+    host, port = address
+    error: Optional[OSError] = None
+    for family, socktype, proto, _, sockaddr in _resolve(host, port):
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(sockaddr)
+            return sock
+        except OSError as exc:
+            sock.close()
+            error = exc
+
+    _ADDRINFO_CACHE.pop(address, None)
+    if error is None:
+        raise OSError("getaddrinfo returns an empty list")
+    raise error
+
+
+async def _open_connection(
+    host: str, port: int, ssl: Optional[ssl.SSLContext] = None
+) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Async counterpart of :func:`_create_connection` returning asyncio streams.
+
+    Args:
+        host: Target host, also used for TLS server name verification.
+        port: Target port.
+        ssl: TLS context, or None for plain TCP.
+
+    Returns:
+        ``(reader, writer)`` as from ``asyncio.open_connection``.
+
+    Raises:
+        OSError: The error from the last address tried.
+    """
+    # pylint: disable=redefined-outer-name
+    loop = asyncio.get_running_loop()
+    error: Optional[OSError] = None
+    for family, socktype, proto, _, sockaddr in await _async_resolve(host, port):
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.setblocking(False)
+            await loop.sock_connect(sock, sockaddr)
+        except OSError as exc:
+            sock.close()
+            error = exc
+            continue
+        except BaseException:
+            sock.close()
+            raise
+        try:
+            return await asyncio.open_connection(
+                sock=sock, ssl=ssl, server_hostname=host if ssl else None
+            )
+        except BaseException:
+            sock.close()
+            raise
+
+    _ADDRINFO_CACHE.pop((host, port), None)
+    if error is None:
+        raise OSError("getaddrinfo returns an empty list")
+    raise error
+
 
 class Connection:
     """
@@ -82,12 +237,9 @@ class Connection:
             connect_to = None
 
         try:
-            raw_sock = socket.create_connection(
-                (self.host, self.port), timeout=connect_to
-            )
+            raw_sock = _create_connection((self.host, self.port), timeout=connect_to)
             if self.use_ssl:
-                context = ssl.create_default_context()
-                context.minimum_version = ssl.TLSVersion.TLSv1_2
+                context = _shared_ssl_context()
                 try:
                     self.sock = context.wrap_socket(raw_sock, server_hostname=self.host)
 
@@ -213,8 +365,7 @@ class AsyncConnection:
         """Async open."""
         ssl_context = None
         if self.use_ssl:
-            ssl_context = ssl.create_default_context()
-            ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+            ssl_context = _shared_ssl_context()
 
         if self.timeout:
             connect_to = (
@@ -227,7 +378,7 @@ class AsyncConnection:
             connect_to = None
 
         try:
-            coro = asyncio.open_connection(self.host, self.port, ssl=ssl_context)
+            coro = _open_connection(self.host, self.port, ssl=ssl_context)
             if connect_to:
                 self.reader, self.writer = await asyncio.wait_for(
                     coro, timeout=connect_to
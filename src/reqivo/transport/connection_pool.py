@@ -10,12 +10,18 @@ import asyncio
 import threading
 import time
 from collections import deque
-from typing import Deque, Dict, List, Tuple, Union
+from types import TracebackType
+from typing import Deque, Dict, Optional, Tuple, Type, Union
 
 from reqivo.transport.connection import AsyncConnection, Connection
 from reqivo.utils.timing import Timeout
 
-__all__ = ["ConnectionPool", "AsyncConnectionPool"]
+__all__ = [
+    "ConnectionPool",
+    "AsyncConnectionPool",
+    "PooledConnection",
+    "AsyncPooledConnection",
+]
 
 
 class ConnectionPool:
@@ -29,15 +35,32 @@ class ConnectionPool:
     per host.
     """
 
-    __slots__ = ("_pool", "_lock", "_semaphores", "max_size", "max_idle_time")
+    __slots__ = (
+        "_pool",
+        "_lock",
+        "_semaphores",
+        "max_size",
+        "max_idle_time",
+        "probe_after",
+    )
 
-    def __init__(self, max_size: int = 10, max_idle_time: float = 30.0) -> None:
+    def __init__(
+        self,
+        max_size: int = 10,
+        max_idle_time: float = 30.0,
+        probe_after: float = 0.05,
+    ) -> None:
         """
         Initialize connection pool.
 
         Args:
             max_size: Maximum number of connections to keep per host.
             max_idle_time: Max time (seconds) a connection can be idle.
+            probe_after: Idle time (seconds) after which a pooled connection
+                is checked with ``is_usable()`` before reuse. Connections put
+                back more recently were already checked by
+                ``put_connection()`` and are handed out without the extra
+                ``select``/``recv`` system calls. Use 0 to always check.
         """
         # Key -> List of (connection, timestamp) tuples (LIFO stack for reuse)
         self._pool: Dict[Tuple[str, int, bool], Deque[Tuple[Connection, float]]] = {}
@@ -45,6 +68,7 @@ class ConnectionPool:
         self._lock = threading.Lock()
         self.max_size = max_size
         self.max_idle_time = max_idle_time
+        self.probe_after = probe_after
 
     def get_connection(
         self,
@@ -60,30 +84,33 @@ class ConnectionPool:
         # pylint: disable=too-many-branches
         key = (host, port, use_ssl)
 
-        with self._lock:
-            if key not in self._semaphores:
-                self._semaphores[key] = threading.Semaphore(self.max_size)
+        # Look the route up once and keep its semaphore in a local; the
+        # lock is only needed the first time a route is seen
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault(
+                    key, threading.Semaphore(self.max_size)
+                )
 
         # Acquire semaphore (limits total active + idle connections)
         # Using connect timeout or default blocking?
         # Ideally we block.
-        self._semaphores[key].acquire()
+        semaphore.acquire()
 
         try:
             with self._lock:
                 # Cleanup expired connections first
-                self._cleanup_expired(key)
-
-                connections = self._pool.get(key)
+                connections = self._cleanup_expired(key)
                 if connections:
                     # Iterate to find a valid connection
                     while connections:
                         conn, last_used = connections.pop()  # Pop from right (LIFO)
 
                         # Check if connection is still fresh and usable
-                        if (
-                            time.time() - last_used < self.max_idle_time
-                            and conn.is_usable()
+                        idle = time.time() - last_used
+                        if idle < self.max_idle_time and (
+                            idle < self.probe_after or conn.is_usable()
                         ):
                             return conn
 
@@ -97,7 +124,7 @@ class ConnectionPool:
 
         except Exception:
             # If anything fails (creation), release key
-            self._semaphores[key].release()
+            semaphore.release()
             raise
 
     def put_connection(self, conn: Connection) -> None:
@@ -105,20 +132,20 @@ class ConnectionPool:
         Return a connection to the pool with timestamp.
         """
         key = (conn.host, conn.port, conn.use_ssl)
+        semaphore = self._semaphores.get(key)
 
         # If connection is bad or closed, we effectively discard it
         if not conn.sock or not conn.is_usable():
             conn.close()
             # Release the slot
-            if key in self._semaphores:
-                self._semaphores[key].release()
+            if semaphore is not None:
+                semaphore.release()
             return
 
         with self._lock:
-            if key not in self._pool:
-                self._pool[key] = deque()
-
-            queue = self._pool[key]
+            queue = self._pool.get(key)
+            if queue is None:
+                queue = self._pool[key] = deque()
 
             # If full, drop oldest
             if len(queue) >= self.max_size:
@@ -128,36 +155,62 @@ class ConnectionPool:
             # Store connection with current timestamp
             queue.append((conn, time.time()))
 
-            if key in self._semaphores:
-                self._semaphores[key].release()
+            if semaphore is not None:
+                semaphore.release()
 
-    def _cleanup_expired(self, key: Tuple[str, int, bool]) -> None:
+    def _cleanup_expired(
+        self, key: Tuple[str, int, bool]
+    ) -> Optional[Deque[Tuple[Connection, float]]]:
         """
         Remove expired connections from the pool for a specific key.
         Must be called with _lock held.
+
+        Returns:
+            The remaining idle connections for the key, or the (empty or
+            missing) entry unchanged if there was nothing to check.
         """
-        if key not in self._pool:
-            return
+        connections = self._pool.get(key)
+        if not connections:
+            return connections
 
-        connections = self._pool[key]
         current_time = time.time()
+        max_idle_time = self.max_idle_time
+        probe_after = self.probe_after
 
-        # Filter out expired connections
+        # Filter out expired connections; recently returned ones were just
+        # checked by put_connection and skip the is_usable() syscalls
         valid_connections: Deque[Tuple[Connection, float]] = deque()
         for conn, last_used in connections:
-            if current_time - last_used < self.max_idle_time and conn.is_usable():
+            idle = current_time - last_used
+            if idle < max_idle_time and (idle < probe_after or conn.is_usable()):
                 valid_connections.append((conn, last_used))
             else:
                 conn.close()
 
         self._pool[key] = valid_connections
+        return valid_connections
 
     def discard_connection(self, conn: Connection) -> None:
         """Discard a connection and release its slot."""
         conn.close()
-        key = (conn.host, conn.port, conn.use_ssl)
-        if key in self._semaphores:
-            self._semaphores[key].release()
+        semaphore = self._semaphores.get((conn.host, conn.port, conn.use_ssl))
+        if semaphore is not None:
+            semaphore.release()
+
+    def connection(
+        self,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        timeout: Union[float, Timeout, None] = None,
+    ) -> "PooledConnection":
+        """
+        Borrow a connection for the duration of a ``with`` block.
+
+        The connection is put back when the block exits normally and
+        discarded if it raises.
+        """
+        return PooledConnection(self, host, port, use_ssl, timeout)
 
     def release_connection(self, host: str, port: int, use_ssl: bool) -> None:
         """
@@ -200,10 +253,10 @@ class AsyncConnectionPool:
     __slots__ = ("_pool", "_semaphores", "max_size", "max_idle_time")
 
     def __init__(self, max_size: int = 10, max_idle_time: float = 30.0):
-        # Key -> List of (connection, timestamp) tuples
-        self._pool: Dict[Tuple[str, int, bool], List[Tuple[AsyncConnection, float]]] = (
-            {}
-        )
+        # Key -> deque of (connection, timestamp) tuples (LIFO stack for reuse)
+        self._pool: Dict[
+            Tuple[str, int, bool], Deque[Tuple[AsyncConnection, float]]
+        ] = {}
         self._semaphores: Dict[Tuple[str, int, bool], asyncio.Semaphore] = {}
         self.max_size = max_size
         self.max_idle_time = max_idle_time
@@ -220,10 +273,15 @@ class AsyncConnectionPool:
         """
         key = (host, port, use_ssl)
 
-        if key not in self._semaphores:
-            self._semaphores[key] = asyncio.Semaphore(self.max_size)
+        # One lookup on the common path; the semaphore is created the first
+        # time a route is seen and kept in a local for the release below
+        semaphore = self._semaphores.get(key)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(
+                key, asyncio.Semaphore(self.max_size)
+            )
 
-        await self._semaphores[key].acquire()
+        await semaphore.acquire()
 
         try:
             # Cleanup expired connections first
@@ -250,7 +308,7 @@ class AsyncConnectionPool:
             return conn
 
         except Exception:
-            self._semaphores[key].release()
+            semaphore.release()
             raise
 
     async def put_connection(self, conn: AsyncConnection) -> None:
@@ -258,26 +316,27 @@ class AsyncConnectionPool:
         Returns a connection to the pool for reuse with timestamp.
         """
         key = (conn.host, conn.port, conn.use_ssl)
+        semaphore = self._semaphores.get(key)
 
         if not conn.is_usable():
             await conn.close()
-            if key in self._semaphores:
-                self._semaphores[key].release()
+            if semaphore is not None:
+                semaphore.release()
             return
 
-        if key not in self._pool:
-            self._pool[key] = []
+        connections = self._pool.get(key)
+        if connections is None:
+            connections = self._pool[key] = deque()
 
-        connections = self._pool[key]
         if len(connections) >= self.max_size:
-            oldest_conn, _ = connections.pop(0)
+            oldest_conn, _ = connections.popleft()
             await oldest_conn.close()
 
         # Store connection with current timestamp
         connections.append((conn, time.time()))
 
-        if key in self._semaphores:
-            self._semaphores[key].release()
+        if semaphore is not None:
+            semaphore.release()
 
     async def _cleanup_expired(self, key: Tuple[str, int, bool]) -> None:
         """
@@ -290,7 +349,7 @@ class AsyncConnectionPool:
         current_time = time.time()
 
         # Filter out expired connections
-        valid_connections: List[Tuple[AsyncConnection, float]] = []
+        valid_connections: Deque[Tuple[AsyncConnection, float]] = deque()
         for conn, last_used in connections:
             if current_time - last_used < self.max_idle_time and conn.is_usable():
                 valid_connections.append((conn, last_used))
@@ -302,9 +361,24 @@ class AsyncConnectionPool:
     async def discard_connection(self, conn: AsyncConnection) -> None:
         """Discard async connection and release slot."""
         await conn.close()
-        key = (conn.host, conn.port, conn.use_ssl)
-        if key in self._semaphores:
-            self._semaphores[key].release()
+        semaphore = self._semaphores.get((conn.host, conn.port, conn.use_ssl))
+        if semaphore is not None:
+            semaphore.release()
+
+    def connection(
+        self,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        timeout: Union[float, Timeout, None] = None,
+    ) -> "AsyncPooledConnection":
+        """
+        Borrow a connection for the duration of an ``async with`` block.
+
+        The connection is put back when the block exits normally and
+        discarded if it raises.
+        """
+        return AsyncPooledConnection(self, host, port, use_ssl, timeout)
 
     async def release_connection(self, host: str, port: int, use_ssl: bool) -> None:
         """
@@ -333,3 +407,119 @@ class AsyncConnectionPool:
                 for _ in range(count):
                     self._semaphores[key].release()
         self._pool.clear()
+
+
+class PooledConnection:
+    """
+    Context manager holding one connection borrowed from a ConnectionPool.
+
+    Entering acquires a connection with ``get_connection``; leaving puts it
+    back, or discards it if the block raised (including on
+    ``KeyboardInterrupt`` and other ``BaseException`` subclasses, so the
+    pool slot is never leaked).
+    """
+
+    __slots__ = ("_pool", "_host", "_port", "_use_ssl", "_timeout", "_conn")
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        timeout: Union[float, Timeout, None] = None,
+    ) -> None:
+        """
+        Initialize the lease; no connection is taken until ``__enter__``.
+
+        Args:
+            pool: Pool to borrow from.
+            host: Target host.
+            port: Target port.
+            use_ssl: Whether the connection uses TLS.
+            timeout: Timeout for opening a new connection.
+        """
+        self._pool = pool
+        self._host = host
+        self._port = port
+        self._use_ssl = use_ssl
+        self._timeout = timeout
+        self._conn: Optional[Connection] = None
+
+    def __enter__(self) -> Connection:
+        conn = self._conn = self._pool.get_connection(
+            self._host, self._port, use_ssl=self._use_ssl, timeout=self._timeout
+        )
+        return conn
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        if exc_type is None:
+            self._pool.put_connection(conn)
+        else:
+            self._pool.discard_connection(conn)
+
+
+class AsyncPooledConnection:
+    """
+    Async context manager holding one connection from an AsyncConnectionPool.
+
+    Counterpart of :class:`PooledConnection` for ``async with``; a
+    cancelled task discards its connection instead of leaking the slot.
+    """
+
+    __slots__ = ("_pool", "_host", "_port", "_use_ssl", "_timeout", "_conn")
+
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        host: str,
+        port: int,
+        use_ssl: bool,
+        timeout: Union[float, Timeout, None] = None,
+    ) -> None:
+        """
+        Initialize the lease; no connection is taken until ``__aenter__``.
+
+        Args:
+            pool: Pool to borrow from.
+            host: Target host.
+            port: Target port.
+            use_ssl: Whether the connection uses TLS.
+            timeout: Timeout for opening a new connection.
+        """
+        self._pool = pool
+        self._host = host
+        self._port = port
+        self._use_ssl = use_ssl
+        self._timeout = timeout
+        self._conn: Optional[AsyncConnection] = None
+
+    async def __aenter__(self) -> AsyncConnection:
+        conn = self._conn = await self._pool.get_connection(
+            self._host, self._port, use_ssl=self._use_ssl, timeout=self._timeout
+        )
+        return conn
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        conn = self._conn
+        if conn is None:
+            return
+        self._conn = None
+        if exc_type is None:
+            await self._pool.put_connection(conn)
+        else:
+            await self._pool.discard_connection(conn)
@@ -5,7 +5,7 @@ WebSocket utilities for Reqivo.
 
 import os
 import struct
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple, Union
 
 from reqivo.exceptions import WebSocketError
 
@@ -29,12 +29,74 @@ OPCODE_CLOSE = 0x8
 OPCODE_PING = 0x9
 OPCODE_PONG = 0xA
 
+# Frame header layouts: 7-bit, 16-bit and 64-bit payload length
+_PACK_HEADER_SHORT = struct.Struct("!BB").pack
+_PACK_HEADER_MEDIUM = struct.Struct("!BBH").pack
+_PACK_HEADER_LONG = struct.Struct("!BBQ").pack
 
-def apply_mask(data: bytes, mask: bytes) -> bytes:
-    """Apply XOR mask to data."""
+# Masking keys drawn from each os.urandom() call
+_MASK_KEY_BATCH = 1024
+
+
+class _MaskKeyPool:
+    """
+    Source of random 4-byte masking keys.
+
+    Keys come from os.urandom() in batches, so sending a frame does not
+    cost a system call each time. Handing keys out through a list iterator
+    keeps them unique across threads; a concurrent refill only discards
+    unused keys.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self) -> None:
+        self._keys: Iterator[bytes] = iter(())
+
+    def reset(self) -> None:
+        """Forget pre-drawn keys (so a forked child never reuses them)."""
+        self._keys = iter(())
+
+    def next_key(self) -> bytes:
+        """Return a fresh random masking key."""
+        key = next(self._keys, None)
+        if key is None:
+            block = os.urandom(4 * _MASK_KEY_BATCH)
+            keys = iter([block[i : i + 4] for i in range(0, len(block) - 3, 4)])
+            key = next(keys)
+            self._keys = keys
+        return key
+
+
+_MASK_KEYS = _MaskKeyPool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_MASK_KEYS.reset)
+
+
+def apply_mask(data: Union[bytes, bytearray, memoryview], mask: bytes) -> bytes:
+    """
+    Apply XOR mask to data.
+
+    The payload and the mask repeated to the same length are XORed as two
+    big integers, so the work happens in C rather than in a per-byte loop.
+
+    Args:
+        data: Payload bytes (any bytes-like object).
+        mask: 4-byte masking key; an empty mask leaves the data unchanged.
+
+    Returns:
+        Masked (or unmasked) payload.
+    """
     if not mask:
-        return data
-    return bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+        return bytes(data)
+    length = len(data)
+    if not length:
+        return b""
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(
+        length, "big"
+    )
 
 
 def create_frame(payload: bytes, opcode: int, mask: bool = True) -> bytes:
@@ -44,18 +106,18 @@ def create_frame(payload: bytes, opcode: int, mask: bool = True) -> bytes:
     payload_len = len(payload)
     if payload_len <= 125:
         b1 = (0x80 if mask else 0x00) | payload_len
-        header = struct.pack("!BB", b0, b1)
+        header = _PACK_HEADER_SHORT(b0, b1)
 
     elif payload_len <= 0xFFFF:
         b1 = (0x80 if mask else 0x00) | 126
-        header = struct.pack("!BBH", b0, b1, payload_len)
+        header = _PACK_HEADER_MEDIUM(b0, b1, payload_len)
 
     else:
         b1 = (0x80 if mask else 0x00) | 127
-        header = struct.pack("!BBQ", b0, b1, payload_len)
+        header = _PACK_HEADER_LONG(b0, b1, payload_len)
 
     if mask:
-        mask_key = os.urandom(4)
+        mask_key = _MASK_KEYS.next_key()
         header += mask_key
         payload = apply_mask(payload, mask_key)
 
@@ -63,7 +125,7 @@ def create_frame(payload: bytes, opcode: int, mask: bool = True) -> bytes:
 
 
 def parse_frame_header(
-    data: bytes,
+    data: Union[bytes, bytearray],
 ) -> Optional[Tuple[int, int, bool, int, int, int, int, bool]]:
     """
     Parse WebSocket frame header.
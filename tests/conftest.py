@@ -4,6 +4,15 @@ from contextlib import contextmanager
 
 import pytest
 
+from reqivo.client.session import _parse_origin
+
+
+@pytest.fixture(autouse=True)
+def _clear_url_caches():
+    """Start every test with empty module-level URL caches."""
+    _parse_origin.cache_clear()
+    yield
+
 
 @pytest.fixture
 def timeout_context():
@@ -4,7 +4,12 @@ from unittest import mock
 
 import pytest
 
-from reqivo.http.body import iter_read_chunked, read_chunked, read_exact
+from reqivo.http.body import (
+    _parse_chunk_size,
+    iter_read_chunked,
+    read_chunked,
+    read_exact,
+)
 
 
 class TestReadExact:
@@ -29,6 +34,7 @@ class TestReadExact:
         result = read_exact(mock_sock, 11)
 
         assert result == b"Hello World"
+        assert isinstance(result, bytes)
         assert mock_sock.recv.call_count == 4
 
     def test_read_exact_socket_closed_prematurely(self):
@@ -200,6 +206,61 @@ class TestIterReadChunked:
 
         assert chunks == [b"1234567890"]
 
+    def test_iter_read_chunked_whole_body_in_one_recv(self):
+        """Test size lines are parsed from read-ahead, not one recv per byte."""
+        mock_sock = mock.Mock()
+        mock_sock.recv.side_effect = [b"5;ext=1\r\nHello\r\n6\r\n World\r\n0\r\n\r\n"]
+
+        chunks = list(iter_read_chunked(mock_sock))
+
+        assert chunks == [b"Hello", b" World"]
+        mock_sock.recv.assert_called_once_with(4096)
+
+    def test_iter_read_chunked_split_reads(self):
+        """Test CRLF and chunk data straddling recv boundaries."""
+        mock_sock = mock.Mock()
+        mock_sock.recv.side_effect = [b"a\r", b"\n01234", b"56789\r\n0\r", b"\n\r\n"]
+
+        chunks = list(iter_read_chunked(mock_sock))
+
+        assert chunks == [b"0123456789"]
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+
+    def test_iter_read_chunked_large_chunk_requests_remainder(self):
+        """Test a chunk larger than the read-ahead size is requested in full."""
+        payload = b"x" * 10000
+        mock_sock = mock.Mock()
+        mock_sock.recv.side_effect = [b"2710\r\n", payload + b"\r\n0\r\n\r\n"]
+
+        chunks = list(iter_read_chunked(mock_sock))
+
+        assert chunks == [payload]
+        assert mock_sock.recv.call_args_list[1] == mock.call(10000)
+
+
+class TestParseChunkSize:
+    """Tests for the _parse_chunk_size helper."""
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            (b"0\r\n", 0),
+            (b"a\r\n", 10),
+            (b"1F\r\n", 31),
+            (b"ff;name=value\r\n", 255),
+            (b" 10 ;ext\r\n", 16),
+        ],
+    )
+    def test_parse_chunk_size_valid(self, line, expected):
+        """Test hex sizes with optional extensions and whitespace."""
+        assert _parse_chunk_size(line) == expected
+
+    @pytest.mark.parametrize("line", [b"\r\n", b"zz\r\n", b";ext\r\n"])
+    def test_parse_chunk_size_invalid(self, line):
+        """Test that malformed size lines raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid chunk size"):
+            _parse_chunk_size(line)
+
 
 class TestReadChunked:
     """Tests for read_chunked function."""
@@ -22,12 +22,14 @@ Testing Strategy:
 import asyncio
 import socket
 import ssl
+import time
 from typing import Any
 from unittest import mock
 
 import pytest
 
 from reqivo.exceptions import ConnectTimeout, NetworkError, TlsError
+from reqivo.transport import connection as connection_module
 from reqivo.transport.connection import AsyncConnection, Connection
 from reqivo.utils.timing import Timeout
 
@@ -36,6 +38,14 @@ from reqivo.utils.timing import Timeout
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def _fresh_ssl_context() -> Any:
+    """Keep the shared TLS context (often a mock here) from leaking across tests."""
+    connection_module._shared_ssl_context.cache_clear()
+    yield
+    connection_module._shared_ssl_context.cache_clear()
+
+
 @pytest.fixture
 def basic_connection() -> Connection:
     """Create a basic TCP Connection instance for testing.
@@ -138,7 +148,7 @@ class TestConnectionInit:
 class TestConnectionOpen:
     """Tests for successful connection establishment."""
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_tcp_connection_success(
         self,
         mock_create: mock.Mock,
@@ -156,7 +166,7 @@ class TestConnectionOpen:
         mock_socket.settimeout.assert_called_once_with(None)
 
     @mock.patch("ssl.create_default_context")
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_tls_connection_success(
         self,
         mock_create: mock.Mock,
@@ -183,7 +193,26 @@ class TestConnectionOpen:
         assert result == wrapped_sock
         assert ssl_connection.sock == wrapped_sock
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("ssl.create_default_context")
+    @mock.patch("reqivo.transport.connection._create_connection")
+    def test_tls_context_shared_between_connections(
+        self, mock_create: mock.Mock, mock_ssl_context: mock.Mock
+    ) -> None:
+        """Test the TLS context is built once and reused by later connections."""
+        mock_create.return_value = mock.Mock(spec=socket.socket)
+        context = mock_ssl_context.return_value
+
+        Connection("a.example.com", 443, use_ssl=True).open()
+        Connection("b.example.com", 443, use_ssl=True).open()
+
+        mock_ssl_context.assert_called_once()
+        assert context.minimum_version == ssl.TLSVersion.TLSv1_2
+        assert context.wrap_socket.call_count == 2
+        assert context.wrap_socket.call_args.kwargs == {
+            "server_hostname": "b.example.com"
+        }
+
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_with_connect_timeout(
         self, mock_create: mock.Mock, mock_socket: mock.Mock
     ) -> None:
@@ -199,7 +228,7 @@ class TestConnectionOpen:
         # Should set read timeout after connection
         mock_socket.settimeout.assert_called_once_with(30.0)
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_with_total_timeout_only(
         self, mock_create: mock.Mock, mock_socket: mock.Mock
     ) -> None:
@@ -214,7 +243,7 @@ class TestConnectionOpen:
         mock_create.assert_called_once_with(("example.com", 80), timeout=20.0)
         mock_socket.settimeout.assert_called_once_with(20.0)
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_sets_read_timeout_after_connection(
         self, mock_create: mock.Mock, mock_socket: mock.Mock
     ) -> None:
@@ -237,7 +266,7 @@ class TestConnectionOpen:
 class TestConnectionOpenErrors:
     """Tests for connection establishment error handling."""
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_raises_connect_timeout_on_socket_timeout(
         self, mock_create: mock.Mock, basic_connection: Connection
     ) -> None:
@@ -249,7 +278,7 @@ class TestConnectionOpenErrors:
 
         assert "Timeout connecting to localhost:80" in str(exc_info.value)
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_raises_network_error_on_socket_error(
         self, mock_create: mock.Mock, basic_connection: Connection
     ) -> None:
@@ -262,7 +291,7 @@ class TestConnectionOpenErrors:
         assert "Connection error to localhost:80" in str(exc_info.value)
 
     @mock.patch("ssl.create_default_context")
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_raises_tls_error_on_ssl_error(
         self, mock_create: mock.Mock, mock_ssl_context: mock.Mock
     ) -> None:
@@ -282,7 +311,7 @@ class TestConnectionOpenErrors:
         assert "TLS Verification Error" in str(exc_info.value)
 
     @mock.patch("ssl.create_default_context")
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_raises_connect_timeout_on_tls_handshake_timeout(
         self, mock_create: mock.Mock, mock_ssl_context: mock.Mock
     ) -> None:
@@ -301,7 +330,7 @@ class TestConnectionOpenErrors:
 
         assert "Timeout during TLS handshake" in str(exc_info.value)
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_open_handles_socket_timeout_as_network_error_subtype(
         self, mock_create: mock.Mock
     ) -> None:
@@ -365,7 +394,7 @@ class TestConnectionClose:
 class TestConnectionContextManager:
     """Tests for Connection as context manager."""
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_context_manager_opens_and_closes(
         self, mock_create: mock.Mock, mock_socket: mock.Mock
     ) -> None:
@@ -381,7 +410,7 @@ class TestConnectionContextManager:
         mock_socket.close.assert_called_once()
         assert conn.sock is None
 
-    @mock.patch("socket.create_connection")
+    @mock.patch("reqivo.transport.connection._create_connection")
     def test_context_manager_closes_even_on_exception(
         self, mock_create: mock.Mock, mock_socket: mock.Mock
     ) -> None:
@@ -550,7 +579,7 @@ class TestAsyncConnectionOpen:
         mock_reader = mock.Mock(spec=asyncio.StreamReader)
         mock_writer = mock.Mock(spec=asyncio.StreamWriter)
 
-        with mock.patch("asyncio.open_connection") as mock_open:
+        with mock.patch("reqivo.transport.connection._open_connection") as mock_open:
             mock_open.return_value = (mock_reader, mock_writer)
 
             await async_connection.open()
@@ -566,7 +595,7 @@ class TestAsyncConnectionOpen:
         mock_reader = mock.Mock()
         mock_writer = mock.Mock()
 
-        with mock.patch("asyncio.open_connection") as mock_open:
+        with mock.patch("reqivo.transport.connection._open_connection") as mock_open:
             with mock.patch("ssl.create_default_context") as mock_ssl:
                 mock_context = mock.Mock()
                 mock_ssl.return_value = mock_context
@@ -577,6 +606,21 @@ class TestAsyncConnectionOpen:
                 mock_ssl.assert_called_once()
                 mock_open.assert_called_once_with("example.com", 443, ssl=mock_context)
 
+    @pytest.mark.asyncio
+    async def test_async_open_shares_tls_context_with_sync(self) -> None:
+        """Test async and sync connections use the same TLS context."""
+        with mock.patch(
+            "reqivo.transport.connection._open_connection",
+            return_value=(mock.Mock(), mock.Mock()),
+        ) as mock_open:
+            await AsyncConnection("example.com", 443, use_ssl=True).open()
+            await AsyncConnection("example.com", 443, use_ssl=True).open()
+
+        first, second = (call.kwargs["ssl"] for call in mock_open.call_args_list)
+        assert first is second is connection_module._shared_ssl_context()
+        assert isinstance(first, ssl.SSLContext)
+        assert first.minimum_version == ssl.TLSVersion.TLSv1_2
+
     @pytest.mark.asyncio
     async def test_async_open_with_timeout(self) -> None:
         """Test async connection with connect timeout."""
@@ -585,7 +629,9 @@ class TestAsyncConnectionOpen:
         mock_reader = mock.Mock()
         mock_writer = mock.Mock()
 
-        with mock.patch("asyncio.open_connection", new_callable=mock.Mock) as mock_open:
+        with mock.patch(
+            "reqivo.transport.connection._open_connection", new_callable=mock.Mock
+        ) as mock_open:
             with mock.patch("asyncio.wait_for", new_callable=mock.Mock) as mock_wait:
                 # Return a coroutine that resolves to the tuple
                 mock_wait.return_value = mock.AsyncMock(
@@ -604,7 +650,7 @@ class TestAsyncConnectionOpen:
         self, async_connection: AsyncConnection
     ) -> None:
         """Test that ConnectTimeout is raised on asyncio.TimeoutError."""
-        with mock.patch("asyncio.open_connection") as mock_open:
+        with mock.patch("reqivo.transport.connection._open_connection") as mock_open:
             mock_open.side_effect = asyncio.TimeoutError()
 
             with pytest.raises(ConnectTimeout) as exc_info:
@@ -617,7 +663,7 @@ class TestAsyncConnectionOpen:
         """Test that TlsError is raised on SSL errors during async connection."""
         conn = AsyncConnection("badssl.com", 443, use_ssl=True)
 
-        with mock.patch("asyncio.open_connection") as mock_open:
+        with mock.patch("reqivo.transport.connection._open_connection") as mock_open:
             with mock.patch("ssl.create_default_context"):
                 mock_open.side_effect = ssl.SSLError("Certificate verification failed")
 
@@ -629,7 +675,7 @@ class TestAsyncConnectionOpen:
         self, async_connection: AsyncConnection
     ) -> None:
         """Test that NetworkError is raised on other exceptions."""
-        with mock.patch("asyncio.open_connection") as mock_open:
+        with mock.patch("reqivo.transport.connection._open_connection") as mock_open:
             mock_open.side_effect = OSError("Connection refused")
 
             with pytest.raises(NetworkError) as exc_info:
@@ -737,3 +783,199 @@ class TestAsyncConnectionClose:
         conn.writer = mock_writer
 
         assert conn.is_usable() is False
+
+
+# ============================================================================
+# TEST CLASS: Address resolution cache and connect helpers
+# ============================================================================
+
+
+def _addrinfo(*hosts: str) -> list:
+    """Build getaddrinfo-style results for IPv4 addresses on port 80."""
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (host, 80)) for host in hosts]
+
+
+class TestAddressResolution:
+    """Tests for the getaddrinfo cache behind Connection.open()."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self) -> Any:
+        connection_module._ADDRINFO_CACHE.clear()
+        yield
+        connection_module._ADDRINFO_CACHE.clear()
+
+    def test_resolve_caches_addresses(self) -> None:
+        """Test repeat lookups within the TTL skip getaddrinfo."""
+        with mock.patch(
+            "socket.getaddrinfo", return_value=_addrinfo("10.0.0.1")
+        ) as gai:
+            first = connection_module._resolve("example.com", 80)
+            second = connection_module._resolve("example.com", 80)
+
+        gai.assert_called_once_with("example.com", 80, 0, socket.SOCK_STREAM)
+        assert first is second
+
+    def test_resolve_refreshes_expired_entry(self) -> None:
+        """Test entries older than the TTL are resolved again."""
+        with mock.patch(
+            "socket.getaddrinfo", return_value=_addrinfo("10.0.0.1")
+        ) as gai:
+            connection_module._resolve("example.com", 80)
+            with mock.patch(
+                "reqivo.transport.connection.time.monotonic",
+                return_value=time.monotonic() + connection_module._ADDRINFO_TTL + 1,
+            ):
+                connection_module._resolve("example.com", 80)
+
+        assert gai.call_count == 2
+
+    def test_cache_is_bounded(self) -> None:
+        """Test the cache is emptied once it reaches its size limit."""
+        with mock.patch("socket.getaddrinfo", return_value=_addrinfo("10.0.0.1")):
+            for port in range(connection_module._ADDRINFO_CACHE_SIZE + 1):
+                connection_module._resolve("example.com", port)
+
+        assert len(connection_module._ADDRINFO_CACHE) == 1
+
+    def test_create_connection_tries_next_address(self) -> None:
+        """Test a failed address falls through to the next one."""
+        bad, good = mock.Mock(spec=socket.socket), mock.Mock(spec=socket.socket)
+        bad.connect.side_effect = ConnectionRefusedError("refused")
+
+        with (
+            mock.patch(
+                "socket.getaddrinfo", return_value=_addrinfo("10.0.0.1", "10.0.0.2")
+            ),
+            mock.patch("socket.socket", side_effect=[bad, good]),
+        ):
+            sock = connection_module._create_connection(("example.com", 80), 5.0)
+
+        assert sock is good
+        bad.close.assert_called_once()
+        good.settimeout.assert_called_once_with(5.0)
+        good.connect.assert_called_once_with(("10.0.0.2", 80))
+
+    def test_create_connection_failure_drops_cache_entry(self) -> None:
+        """Test the last error is raised and the name is resolved again later."""
+        sock = mock.Mock(spec=socket.socket)
+        sock.connect.side_effect = ConnectionRefusedError("refused")
+
+        with (
+            mock.patch("socket.getaddrinfo", return_value=_addrinfo("10.0.0.1")),
+            mock.patch("socket.socket", return_value=sock),
+        ):
+            with pytest.raises(ConnectionRefusedError):
+                connection_module._create_connection(("example.com", 80))
+
+        assert ("example.com", 80) not in connection_module._ADDRINFO_CACHE
+        sock.close.assert_called_once()
+
+    def test_create_connection_empty_result(self) -> None:
+        """Test an empty getaddrinfo result raises OSError."""
+        with mock.patch("socket.getaddrinfo", return_value=[]):
+            with pytest.raises(OSError, match="empty list"):
+                connection_module._create_connection(("example.com", 80))
+
+    def test_connection_open_reuses_resolved_address(self) -> None:
+        """Test two connections to one host resolve it once."""
+        with (
+            mock.patch("socket.getaddrinfo", return_value=_addrinfo("10.0.0.1")) as gai,
+            mock.patch("socket.socket"),
+        ):
+            Connection("example.com", 80).open()
+            Connection("example.com", 80).open()
+
+        gai.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_open_connection_real_server(self) -> None:
+        """Test _open_connection connects to a local server and caches it."""
+
+        async def handle(
+            reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        ) -> None:
+            writer.write(await reader.readexactly(4))
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            loop = asyncio.get_running_loop()
+            with mock.patch.object(loop, "getaddrinfo", wraps=loop.getaddrinfo) as gai:
+                for _ in range(2):
+                    reader, writer = await connection_module._open_connection(
+                        "127.0.0.1", port
+                    )
+                    writer.write(b"ping")
+                    assert await reader.readexactly(4) == b"ping"
+                    writer.close()
+                    await writer.wait_closed()
+            gai.assert_called_once()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_async_open_connection_failure_drops_cache_entry(self) -> None:
+        """Test refused async connects raise and forget the addresses."""
+        probe = socket.socket()
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+        probe.close()
+
+        with pytest.raises(OSError):
+            await connection_module._open_connection("127.0.0.1", port)
+
+        assert ("127.0.0.1", port) not in connection_module._ADDRINFO_CACHE
+
+    @pytest.mark.asyncio
+    async def test_async_open_connection_empty_result(self) -> None:
+        """Test an empty async getaddrinfo result raises OSError."""
+        loop = asyncio.get_running_loop()
+        with mock.patch.object(loop, "getaddrinfo", mock.AsyncMock(return_value=[])):
+            with pytest.raises(OSError, match="empty list"):
+                await connection_module._open_connection("example.com", 80)
+
+    @pytest.mark.asyncio
+    async def test_async_open_connection_closes_socket_on_cancel(self) -> None:
+        """Test a connect interrupted by cancellation closes its socket."""
+        loop = asyncio.get_running_loop()
+        sock = mock.Mock(spec=socket.socket)
+        with (
+            mock.patch.object(
+                loop, "getaddrinfo", mock.AsyncMock(return_value=_addrinfo("10.0.0.1"))
+            ),
+            mock.patch("socket.socket", return_value=sock),
+            mock.patch.object(
+                loop, "sock_connect", mock.AsyncMock(side_effect=asyncio.CancelledError)
+            ),
+        ):
+            with pytest.raises(asyncio.CancelledError):
+                await connection_module._open_connection("example.com", 80)
+
+        sock.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_open_connection_closes_socket_on_tls_error(self) -> None:
+        """Test a failed TLS setup closes the connected socket."""
+        loop = asyncio.get_running_loop()
+        sock = mock.Mock(spec=socket.socket)
+        context = mock.Mock(spec=ssl.SSLContext)
+        with (
+            mock.patch.object(
+                loop, "getaddrinfo", mock.AsyncMock(return_value=_addrinfo("10.0.0.1"))
+            ),
+            mock.patch("socket.socket", return_value=sock),
+            mock.patch.object(loop, "sock_connect", mock.AsyncMock()),
+            mock.patch(
+                "asyncio.open_connection", side_effect=ssl.SSLError("handshake failed")
+            ) as open_connection,
+        ):
+            with pytest.raises(ssl.SSLError):
+                await connection_module._open_connection("example.com", 443, context)
+
+        open_connection.assert_called_once_with(
+            sock=sock, ssl=context, server_hostname="example.com"
+        )
+        sock.close.assert_called_once()
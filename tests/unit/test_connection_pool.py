@@ -9,6 +9,7 @@ Test Coverage:
     - Pool size limits enforcement
     - Thread safety for sync pool
     - Close operations (individual keys and全部)
+    - PooledConnection / AsyncPooledConnection context managers
 
 Testing Strategy:
     - Mock Connection and AsyncConnection to avoid real network I/O
@@ -18,12 +19,18 @@ Testing Strategy:
 
 import asyncio
 import threading
+from collections import deque
 from unittest import mock
 
 import pytest
 
 from reqivo.transport.connection import AsyncConnection, Connection
-from reqivo.transport.connection_pool import AsyncConnectionPool, ConnectionPool
+from reqivo.transport.connection_pool import (
+    AsyncConnectionPool,
+    AsyncPooledConnection,
+    ConnectionPool,
+    PooledConnection,
+)
 from reqivo.utils.timing import Timeout
 
 # ============================================================================
@@ -98,12 +105,12 @@ class TestConnectionPoolGetConnection:
         self, pool: ConnectionPool, mock_conn: mock.Mock
     ) -> None:
         """Test reusing existing usable connection from pool."""
-        # Put connection in pool
+        # Put connection in pool, idle long enough to be probed
         import time
         from collections import deque
 
         key = ("example.com", 80, False)
-        pool._pool[key] = deque([(mock_conn, time.time())])
+        pool._pool[key] = deque([(mock_conn, time.time() - 1)])
 
         result = pool.get_connection("example.com", 80, use_ssl=False)
 
@@ -124,7 +131,7 @@ class TestConnectionPoolGetConnection:
         key = ("example.com", 80, False)
         from collections import deque
 
-        pool._pool[key] = deque([(dead_conn, time.time())])
+        pool._pool[key] = deque([(dead_conn, time.time() - 1)])
 
         new_conn = mock.Mock(spec=Connection)
         MockConn.return_value = new_conn
@@ -135,6 +142,56 @@ class TestConnectionPoolGetConnection:
         new_conn.open.assert_called_once()
         assert result == new_conn
 
+    def test_get_connection_skips_probe_for_fresh_connection(
+        self, pool: ConnectionPool, mock_conn: mock.Mock
+    ) -> None:
+        """Test a connection returned within probe_after is not re-checked."""
+        import time
+        from collections import deque
+
+        key = ("example.com", 80, False)
+        pool._pool[key] = deque([(mock_conn, time.time())])
+
+        result = pool.get_connection("example.com", 80, use_ssl=False)
+
+        assert result is mock_conn
+        mock_conn.is_usable.assert_not_called()
+
+    @mock.patch("reqivo.transport.connection_pool.Connection")
+    def test_get_connection_probe_after_zero_always_checks(
+        self, MockConn: mock.Mock
+    ) -> None:
+        """Test probe_after=0 checks even a just-returned connection."""
+        import time
+        from collections import deque
+
+        pool = ConnectionPool(max_size=3, probe_after=0)
+        dead_conn = mock.Mock(spec=Connection)
+        dead_conn.is_usable.return_value = False
+        pool._pool[("example.com", 80, False)] = deque([(dead_conn, time.time())])
+        MockConn.return_value = new_conn = mock.Mock(spec=Connection)
+
+        assert pool.get_connection("example.com", 80, use_ssl=False) is new_conn
+        dead_conn.close.assert_called_once()
+
+    def test_get_connection_reuses_route_semaphore(
+        self, pool: ConnectionPool, mock_conn: mock.Mock
+    ) -> None:
+        """Test a route's semaphore is created once and shared by get/put."""
+        with mock.patch(
+            "reqivo.transport.connection_pool.Connection", return_value=mock_conn
+        ):
+            conn = pool.get_connection("example.com", 80, use_ssl=False)
+        semaphore = pool._semaphores[("example.com", 80, False)]
+        assert semaphore._value == 2
+
+        pool.put_connection(conn)
+        assert semaphore._value == 3
+
+        assert pool.get_connection("example.com", 80, use_ssl=False) is mock_conn
+        assert pool._semaphores[("example.com", 80, False)] is semaphore
+        assert semaphore._value == 2
+
 
 class TestConnectionPoolPutConnection:
     """Tests for put_connection method."""
@@ -308,9 +365,9 @@ class TestConnectionPoolThreadSafety:
         key = ("example.com", 80, False)
         pool._pool[key] = deque(
             [
-                (dead_conn1, time.time()),
-                (dead_conn2, time.time()),
-                (dead_conn3, time.time()),
+                (dead_conn1, time.time() - 1),
+                (dead_conn2, time.time() - 1),
+                (dead_conn3, time.time() - 1),
             ]
         )
 
@@ -432,7 +489,7 @@ class TestAsyncConnectionPoolGetConnection:
         mock_conn.is_usable.return_value = True
 
         key = ("example.com", 80, False)
-        async_pool._pool[key] = [(mock_conn, time.time())]
+        async_pool._pool[key] = deque([(mock_conn, time.time())])
 
         result = await asyncio.wait_for(
             async_pool.get_connection("example.com", 80, use_ssl=False), timeout=5.0
@@ -454,7 +511,7 @@ class TestAsyncConnectionPoolGetConnection:
         dead_conn.close = mock.AsyncMock()
 
         key = ("example.com", 80, False)
-        async_pool._pool[key] = [(dead_conn, time.time())]
+        async_pool._pool[key] = deque([(dead_conn, time.time())])
 
         new_conn = mock.Mock(spec=AsyncConnection)
         new_conn.open = mock.AsyncMock()
@@ -468,6 +525,32 @@ class TestAsyncConnectionPoolGetConnection:
         new_conn.open.assert_awaited_once()
         assert result == new_conn
 
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.transport.connection_pool.AsyncConnection")
+    async def test_get_connection_reuses_route_semaphore(
+        self, MockConn: mock.Mock, async_pool: AsyncConnectionPool
+    ) -> None:
+        """Test a route's semaphore is created once and shared by get/put."""
+        conn = mock.Mock(spec=AsyncConnection)
+        conn.host = "example.com"
+        conn.port = 80
+        conn.use_ssl = False
+        conn.open = mock.AsyncMock()
+        conn.is_usable.return_value = True
+        MockConn.return_value = conn
+
+        key = ("example.com", 80, False)
+        await async_pool.get_connection("example.com", 80, use_ssl=False)
+        semaphore = async_pool._semaphores[key]
+        assert semaphore._value == 2
+
+        await async_pool.put_connection(conn)
+        assert semaphore._value == 3
+
+        assert await async_pool.get_connection("example.com", 80, use_ssl=False) is conn
+        assert async_pool._semaphores[key] is semaphore
+        assert semaphore._value == 2
+
 
 class TestAsyncConnectionPoolPutConnection:
     """Tests for async put_connection method."""
@@ -536,6 +619,8 @@ class TestAsyncConnectionPoolPutConnection:
         assert connections[1] in pool_conns
         assert connections[2] in pool_conns
         assert connections[3] in pool_conns
+        assert isinstance(async_pool._pool[key], deque)
+        assert pool_conns == connections[1:]
 
 
 class TestAsyncConnectionPoolClose:
@@ -555,7 +640,7 @@ class TestAsyncConnectionPoolClose:
             conns.append(conn)
 
         key = ("example.com", 80, False)
-        async_pool._pool[key] = [(conn, time.time()) for conn in conns]
+        async_pool._pool[key] = deque([(conn, time.time()) for conn in conns])
 
         await asyncio.wait_for(
             async_pool.release_connection("example.com", 80, use_ssl=False), timeout=5.0
@@ -582,8 +667,8 @@ class TestAsyncConnectionPoolClose:
             mock.Mock(spec=AsyncConnection, close=mock.AsyncMock()) for _ in range(2)
         ]
 
-        async_pool._pool[key1] = [(conn, time.time()) for conn in conns1]
-        async_pool._pool[key2] = [(conn, time.time()) for conn in conns2]
+        async_pool._pool[key1] = deque([(conn, time.time()) for conn in conns1])
+        async_pool._pool[key2] = deque([(conn, time.time()) for conn in conns2])
 
         await asyncio.wait_for(async_pool.close_all(), timeout=5.0)
 
@@ -678,7 +763,7 @@ class TestAsyncConnectionPoolClose:
             conns.append(conn)
 
         key = ("example.com", 80, False)
-        async_pool._pool[key] = [(conn, time.time()) for conn in conns]
+        async_pool._pool[key] = deque([(conn, time.time()) for conn in conns])
         async_pool._semaphores[key] = asyncio.Semaphore(3)
 
         # Acquire all 3 semaphores
@@ -715,8 +800,8 @@ class TestAsyncConnectionPoolClose:
             mock.Mock(spec=AsyncConnection, close=mock.AsyncMock()) for _ in range(2)
         ]
 
-        async_pool._pool[key1] = [(conn, time.time()) for conn in conns1]
-        async_pool._pool[key2] = [(conn, time.time()) for conn in conns2]
+        async_pool._pool[key1] = deque([(conn, time.time()) for conn in conns1])
+        async_pool._pool[key2] = deque([(conn, time.time()) for conn in conns2])
 
         # Initialize semaphores and acquire them
         async_pool._semaphores[key1] = asyncio.Semaphore(2)
@@ -740,3 +825,84 @@ class TestAsyncConnectionPoolClose:
         # Semaphores should be released
         assert not async_pool._semaphores[key1].locked()
         assert not async_pool._semaphores[key2].locked()
+
+
+# ============================================================================
+# TEST CLASS: Pooled connection context managers
+# ============================================================================
+
+
+class TestPooledConnection:
+    """Tests for PooledConnection and AsyncPooledConnection."""
+
+    def test_connection_puts_back_on_success(self) -> None:
+        """Test the borrowed connection is returned when the block exits."""
+        pool = mock.Mock(spec=ConnectionPool)
+        conn = pool.get_connection.return_value
+
+        with PooledConnection(pool, "example.com", 443, True, 5.0) as borrowed:
+            assert borrowed is conn
+
+        pool.get_connection.assert_called_once_with(
+            "example.com", 443, use_ssl=True, timeout=5.0
+        )
+        pool.put_connection.assert_called_once_with(conn)
+        pool.discard_connection.assert_not_called()
+
+    def test_connection_discards_on_error(self) -> None:
+        """Test the connection is discarded when the block raises."""
+        pool = mock.Mock(spec=ConnectionPool)
+        conn = pool.get_connection.return_value
+
+        with pytest.raises(KeyboardInterrupt):
+            with PooledConnection(pool, "example.com", 80, False):
+                raise KeyboardInterrupt
+
+        pool.discard_connection.assert_called_once_with(conn)
+        pool.put_connection.assert_not_called()
+
+    def test_pool_connection_returns_lease(
+        self, pool: ConnectionPool, mock_conn: mock.Mock
+    ) -> None:
+        """Test ConnectionPool.connection() borrows from that pool."""
+        with mock.patch(
+            "reqivo.transport.connection_pool.Connection", return_value=mock_conn
+        ):
+            with pool.connection("example.com", 80, use_ssl=False) as conn:
+                assert conn is mock_conn
+
+        assert [c for c, _ in pool._pool[("example.com", 80, False)]] == [mock_conn]
+
+    @pytest.mark.asyncio
+    async def test_async_connection_puts_back_on_success(self) -> None:
+        """Test the async lease returns the connection on success."""
+        pool = mock.AsyncMock(spec=AsyncConnectionPool)
+        conn = pool.get_connection.return_value
+
+        async with AsyncPooledConnection(pool, "example.com", 80, False) as borrowed:
+            assert borrowed is conn
+
+        pool.put_connection.assert_awaited_once_with(conn)
+        pool.discard_connection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_async_connection_discards_on_cancel(self) -> None:
+        """Test a cancelled task discards its connection."""
+        pool = mock.AsyncMock(spec=AsyncConnectionPool)
+        conn = pool.get_connection.return_value
+
+        with pytest.raises(asyncio.CancelledError):
+            async with AsyncPooledConnection(pool, "example.com", 80, False):
+                raise asyncio.CancelledError
+
+        pool.discard_connection.assert_awaited_once_with(conn)
+        pool.put_connection.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_async_pool_connection_returns_lease(
+        self, async_pool: AsyncConnectionPool
+    ) -> None:
+        """Test AsyncConnectionPool.connection() borrows from that pool."""
+        lease = async_pool.connection("example.com", 80, use_ssl=False)
+        assert isinstance(lease, AsyncPooledConnection)
+        assert lease._pool is async_pool
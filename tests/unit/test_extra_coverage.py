@@ -1,7 +1,6 @@
 # tests/unit/test_extra_coverage.py
 import socket
 import unittest
-from http.cookies import CookieError, SimpleCookie
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,18 +13,12 @@ from reqivo.transport.connection import Connection
 
 def test_session_cookie_parsing_exception():
     session = Session()
-    # Mock response with headers that cause SimpleCookie.load to fail is hard,
-    # but we can mock SimpleCookie.load itself.
     response = MagicMock(spec=Response)
     response.headers.get_all.return_value = ["invalid cookie"]
 
-    with patch(
-        "reqivo.client.session.SimpleCookie.load",
-        side_effect=CookieError("Parsing error"),
-    ):
-        session._update_cookies_from_response(response)
-        # Should not raise exception because of the try-except block
-        assert session.cookies == {}
+    session._update_cookies_from_response(response)
+    # Lines without a name=value pair are skipped without raising
+    assert session.cookies == {}
 
 
 def test_connection_socket_timeout_in_error_catch():
@@ -36,7 +29,8 @@ def test_connection_socket_timeout_in_error_catch():
     #         raise ConnectTimeout(...)
 
     with patch(
-        "socket.create_connection", side_effect=socket.timeout("Custom timeout")
+        "reqivo.transport.connection._create_connection",
+        side_effect=socket.timeout("Custom timeout"),
     ):
         with pytest.raises(ConnectTimeout):
             conn.open()
@@ -50,9 +44,5 @@ async def test_async_session_cookie_parsing_exception():
     response = MagicMock(spec=Response)
     response.headers.get_all.return_value = ["invalid cookie"]
 
-    with patch(
-        "reqivo.client.session.SimpleCookie.load",
-        side_effect=CookieError("Parsing error"),
-    ):
-        session._update_cookies_from_response(response)
-        assert session.cookies == {}
+    session._update_cookies_from_response(response)
+    assert session.cookies == {}
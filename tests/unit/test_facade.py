@@ -17,6 +17,7 @@ Testing Strategy:
     - Verify constructor wiring to Session
 """
 
+import inspect
 from unittest import mock
 
 import pytest
@@ -242,7 +243,7 @@ class TestReqivoHooks:
         r = Reqivo()
         hook = lambda m, u, h: (m, u, h)
         r.on_request(hook)
-        assert r._session._pre_request_hooks == [hook]
+        assert r._session._pre_request_hooks == (hook,)
 
     def test_on_response_returns_self(self) -> None:
         """Test on_response returns self for chaining."""
@@ -256,7 +257,7 @@ class TestReqivoHooks:
         r = Reqivo()
         hook = lambda resp: resp
         r.on_response(hook)
-        assert r._session._post_response_hooks == [hook]
+        assert r._session._post_response_hooks == (hook,)
 
     def test_full_chaining(self) -> None:
         """Test chaining auth + hooks."""
@@ -494,6 +495,19 @@ class TestAsyncReqivoHTTPMethods:
             limits=None,
         )
 
+    @pytest.mark.asyncio
+    async def test_methods_return_request_coroutine(self) -> None:
+        """Test verb helpers hand back the _request coroutine unwrapped."""
+        mock_resp = mock.Mock(spec=Response)
+        sentinel_coro = mock.AsyncMock(return_value=mock_resp)()
+        with mock.patch.object(
+            AsyncSession, "_request", new=mock.Mock(return_value=sentinel_coro)
+        ):
+            awaitable = AsyncReqivo().head("https://example.com/")
+            assert inspect.iscoroutine(awaitable)
+            assert awaitable is sentinel_coro
+            assert await awaitable is mock_resp
+
 
 # ============================================================================
 # TEST CLASS: AsyncReqivo Auth (Fluent)
@@ -1,8 +1,10 @@
 """tests/unit/test_headers.py"""
 
+import sys
+
 import pytest
 
-from reqivo.http.headers import Headers
+from reqivo.http.headers import LOWER_HEADER_NAMES, Headers
 
 
 class TestHeaders:
@@ -48,12 +50,38 @@ class TestHeaders:
         assert headers.get("Content-Type") == "application/json"
         assert headers["Content-Type"] == "application/json"
 
+    def test_get_single_value_not_copied(self):
+        """Test that a single value is returned as stored, without a join."""
+        value = "".join(["application/", "json"])
+        headers = Headers({"Content-Type": [value]})
+        assert headers.get("content-type") is value
+
+    def test_common_name_aliases_are_lowercase(self):
+        """Test every pre-lowered alias maps to its own lowercase form."""
+        for alias, name in LOWER_HEADER_NAMES.items():
+            assert alias.lower() == name
+            assert name is sys.intern(name)
+
+    def test_common_name_stored_interned(self):
+        """Test common names are stored under the interned lowercase key."""
+        headers = Headers({"Sec-WebSocket-Accept": "abc", "X-Custom": "1"})
+        assert list(headers) == ["sec-websocket-accept", "x-custom"]
+        assert headers.get("Sec-Websocket-Accept") == "abc"
+        assert "SEC-WEBSOCKET-ACCEPT" in headers
+
     def test_get_duplicate_headers_joined(self):
         """Test that get() joins duplicates with commas."""
         headers = Headers({"Accept": ["text/html", "application/json"]})
         assert headers.get("Accept") == "text/html, application/json"
         assert headers["Accept"] == "text/html, application/json"
 
+    def test_get_duplicate_headers_joined_once(self):
+        """Test the joined form of a repeated header is computed once."""
+        headers = Headers({"Accept": ["text/html", "application/json"]})
+        first = headers.get("Accept")
+        assert headers["accept"] is first
+        assert headers._joined == {"accept": "text/html, application/json"}
+
     def test_get_set_cookie_special_handling(self):
         """Test that get() for Set-Cookie returns only first value (no join)."""
         headers = Headers({"Set-Cookie": ["session=123", "user=alice"]})
@@ -67,6 +95,14 @@ class TestHeaders:
         assert headers.get_all("Set-Cookie") == ["session=123", "user=alice"]
         assert headers.get_all("Non-Existent") == []
 
+    def test_contains_case_insensitive(self):
+        """Test membership checks ignore case and non-string keys."""
+        headers = Headers({"Set-Cookie": ["a=1", "b=2"]})
+        assert "set-cookie" in headers
+        assert "SET-COOKIE" in headers
+        assert "Content-Type" not in headers
+        assert 1 not in headers
+
     def test_getitem_raises_keyerror(self):
         """Test __getitem__ raises KeyError for missing header."""
         headers = Headers()
@@ -85,3 +121,12 @@ class TestHeaders:
         """Test len() returns number of headers."""
         headers = Headers({"A": "1", "B": "2"})
         assert len(headers) == 2
+
+    def test_from_normalized_adopts_mapping(self):
+        """Test _from_normalized wraps the given mapping without copying it."""
+        data = {"content-type": ["text/plain"], "set-cookie": ["a=1", "b=2"]}
+        headers = Headers._from_normalized(data)
+
+        assert headers._headers is data
+        assert headers["Content-Type"] == "text/plain"
+        assert headers.get_all("Set-Cookie") == ["a=1", "b=2"]
@@ -18,6 +18,7 @@ Testing Strategy:
     - Verify hooks receive and return correct values
 """
 
+import asyncio
 from unittest import mock
 
 import pytest
@@ -71,7 +72,6 @@ def _setup_session_mocks(
     session.pool = mock_pool
 
     MockRequest.send.return_value = mock_response
-    MockRequest.set_session_instance = mock.Mock()
     return mock_conn
 
 
@@ -84,24 +84,24 @@ class TestHooksDefaultState:
     """Tests for default hook state."""
 
     def test_session_has_empty_pre_hooks(self, session: Session) -> None:
-        """Test that Session starts with empty pre-request hooks list."""
-        assert session._pre_request_hooks == []
+        """Test that Session starts with no pre-request hooks."""
+        assert session._pre_request_hooks == ()
 
     def test_session_has_empty_post_hooks(self, session: Session) -> None:
-        """Test that Session starts with empty post-response hooks list."""
-        assert session._post_response_hooks == []
+        """Test that Session starts with no post-response hooks."""
+        assert session._post_response_hooks == ()
 
     def test_async_session_has_empty_pre_hooks(
         self, async_session: AsyncSession
     ) -> None:
-        """Test that AsyncSession starts with empty pre-request hooks list."""
-        assert async_session._pre_request_hooks == []
+        """Test that AsyncSession starts with no pre-request hooks."""
+        assert async_session._pre_request_hooks == ()
 
     def test_async_session_has_empty_post_hooks(
         self, async_session: AsyncSession
     ) -> None:
-        """Test that AsyncSession starts with empty post-response hooks list."""
-        assert async_session._post_response_hooks == []
+        """Test that AsyncSession starts with no post-response hooks."""
+        assert async_session._post_response_hooks == ()
 
 
 # ============================================================================
@@ -113,7 +113,7 @@ class TestPreRequestHooksSync:
     """Tests for sync Session pre-request hooks."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_pre_hook_modifies_headers(
         self,
         mock_urlparse: mock.Mock,
@@ -135,7 +135,7 @@ class TestPreRequestHooksSync:
         assert call_kwargs["headers"]["X-Custom"] == "hook-value"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_pre_hook_modifies_method(
         self,
         mock_urlparse: mock.Mock,
@@ -156,7 +156,7 @@ class TestPreRequestHooksSync:
         assert call_args[0] == "POST"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_pre_hook_modifies_url(
         self,
         mock_urlparse: mock.Mock,
@@ -177,7 +177,7 @@ class TestPreRequestHooksSync:
         assert "?debug=true" in call_args[1]
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_multiple_pre_hooks_fifo_order(
         self,
         mock_urlparse: mock.Mock,
@@ -219,7 +219,7 @@ class TestPostResponseHooksSync:
     """Tests for sync Session post-response hooks."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_post_hook_transforms_response(
         self,
         mock_urlparse: mock.Mock,
@@ -243,7 +243,7 @@ class TestPostResponseHooksSync:
         assert result == transformed
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_multiple_post_hooks_fifo_order(
         self,
         mock_urlparse: mock.Mock,
@@ -271,7 +271,7 @@ class TestPostResponseHooksSync:
         assert execution_order == ["A", "B"]
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_post_hook_receives_response(
         self,
         mock_urlparse: mock.Mock,
@@ -304,7 +304,7 @@ class TestHookExceptions:
     """Tests for hook exception propagation."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_pre_hook_exception_propagates(
         self,
         mock_urlparse: mock.Mock,
@@ -324,7 +324,7 @@ class TestHookExceptions:
             session.get("https://example.com/test")
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_post_hook_exception_propagates(
         self,
         mock_urlparse: mock.Mock,
@@ -344,6 +344,87 @@ class TestHookExceptions:
             session.get("https://example.com/test")
 
 
+# ============================================================================
+# TEST CLASS: Connection Release Around Post-Response Hooks
+# ============================================================================
+
+
+class TestPostHookConnectionRelease:
+    """Tests for returning the connection to the pool before post hooks."""
+
+    @pytest.mark.parametrize("stream,released_before_hook", [(False, 1), (True, 0)])
+    @mock.patch("reqivo.client.session.Request")
+    def test_connection_released_before_hooks_unless_streaming(
+        self,
+        MockRequest: mock.Mock,
+        session: Session,
+        mock_response: mock.Mock,
+        stream: bool,
+        released_before_hook: int,
+    ) -> None:
+        """Test a fully read response frees its connection before hooks run."""
+        session.pool = mock.Mock()
+        mock_response.stream = stream
+        MockRequest.send.return_value = mock_response
+        seen: list = []
+
+        def hook(response):
+            seen.append(session.pool.put_connection.call_count)
+            return response
+
+        session.add_post_response_hook(hook)
+        session.get("https://example.com/")
+
+        assert seen == [released_before_hook]
+        session.pool.put_connection.assert_called_once()
+
+    @mock.patch("reqivo.client.session.Request")
+    def test_released_connection_not_discarded_on_hook_error(
+        self, MockRequest: mock.Mock, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test a hook failure does not discard a connection already pooled."""
+        session.pool = mock.Mock()
+        mock_response.stream = False
+        MockRequest.send.return_value = mock_response
+
+        def failing_hook(response):
+            raise ValueError("post hook failed")
+
+        session.add_post_response_hook(failing_hook)
+
+        with pytest.raises(ValueError, match="post hook failed"):
+            session.get("https://example.com/")
+
+        session.pool.put_connection.assert_called_once()
+        session.pool.discard_connection.assert_not_called()
+
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_connection_released_before_hooks(
+        self,
+        mock_send: mock.AsyncMock,
+        async_session: AsyncSession,
+        mock_response: mock.Mock,
+    ) -> None:
+        """Test AsyncSession frees the connection before awaiting hooks."""
+        async_session.pool = mock.AsyncMock()
+        mock_response.stream = False
+        mock_send.return_value = mock_response
+        seen: list = []
+
+        async def hook(response):
+            seen.append(async_session.pool.put_connection.await_count)
+            raise ValueError("post hook failed")
+
+        async_session.add_post_response_hook(hook)
+
+        with pytest.raises(ValueError, match="post hook failed"):
+            await async_session.get("https://example.com/")
+
+        assert seen == [1]
+        async_session.pool.discard_connection.assert_not_awaited()
+
+
 # ============================================================================
 # TEST CLASS: AsyncSession Hooks
 # ============================================================================
@@ -354,7 +435,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_pre_hook_sync(
         self,
         mock_urlparse: mock.Mock,
@@ -388,7 +469,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_pre_hook_async(
         self,
         mock_urlparse: mock.Mock,
@@ -422,7 +503,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_post_hook_sync(
         self,
         mock_urlparse: mock.Mock,
@@ -457,7 +538,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_post_hook_async(
         self,
         mock_urlparse: mock.Mock,
@@ -492,7 +573,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_hook_exception_propagates(
         self,
         mock_urlparse: mock.Mock,
@@ -524,7 +605,7 @@ class TestAsyncSessionHooks:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_multiple_hooks_fifo(
         self,
         mock_urlparse: mock.Mock,
@@ -598,6 +679,23 @@ class TestHookRegistration:
             session.add_pre_request_hook(hook)
         assert len(session._pre_request_hooks) == 3
 
+    @mock.patch("reqivo.client.session.Request")
+    def test_hook_added_after_request_runs(
+        self, MockRequest: mock.Mock, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test hooks registered between requests apply to later requests."""
+        session.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+        calls: list = []
+
+        session.add_pre_request_hook(lambda m, u, h: (calls.append(1), (m, u, h))[1])
+        session.get("https://example.com/")
+        session.add_pre_request_hook(lambda m, u, h: (calls.append(2), (m, u, h))[1])
+        session.get("https://example.com/")
+
+        assert isinstance(session._pre_request_hooks, tuple)
+        assert calls == [1, 1, 2]
+
     def test_async_add_pre_request_hook(self, async_session: AsyncSession) -> None:
         """Test adding a pre-request hook to AsyncSession."""
 
@@ -615,3 +713,50 @@ class TestHookRegistration:
 
         async_session.add_post_response_hook(my_hook)
         assert len(async_session._post_response_hooks) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_hooks_stored_as_coroutine_functions(
+        self, async_session: AsyncSession
+    ) -> None:
+        """Test AsyncSession wraps sync hooks and keeps async ones as-is."""
+
+        def sync_hook(method, url, headers):
+            return method.lower(), url, headers
+
+        async def async_hook(response):
+            return response
+
+        async_session.add_pre_request_hook(sync_hook)
+        async_session.add_post_response_hook(async_hook)
+
+        (wrapped,) = async_session._pre_request_hooks
+        assert wrapped is not sync_hook
+        assert asyncio.iscoroutinefunction(wrapped)
+        assert await wrapped("GET", "/x", {}) == ("get", "/x", {})
+        assert async_session._post_response_hooks == (async_hook,)
+
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_request_skips_per_call_introspection(
+        self,
+        mock_send: mock.AsyncMock,
+        async_session: AsyncSession,
+        mock_response: mock.Mock,
+    ) -> None:
+        """Test requests do not inspect hooks again after registration."""
+        async_session.pool = mock.AsyncMock()
+        mock_send.return_value = mock_response
+
+        async def async_hook(response):
+            return response
+
+        async_session.add_pre_request_hook(lambda m, u, h: (m, u, h))
+        async_session.add_post_response_hook(async_hook)
+
+        with mock.patch(
+            "reqivo.client.session.asyncio.iscoroutinefunction"
+        ) as mock_check:
+            response = await async_session.get("https://example.com/test")
+
+        mock_check.assert_not_called()
+        assert response is mock_response
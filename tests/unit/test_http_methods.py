@@ -13,17 +13,19 @@ Test Coverage:
 
 Testing Strategy:
     - Mock Request.send / AsyncRequest.send to avoid real HTTP calls
-    - Mock urlparse and ConnectionPool for Session tests
+    - Mock urlsplit and ConnectionPool for Session tests
     - Verify correct method string and kwargs are passed through
 """
 
+import urllib.parse
+from typing import Type, Union
 from unittest import mock
 
 import pytest
 
 from reqivo.client.request import AsyncRequest, Request
 from reqivo.client.response import Response
-from reqivo.client.session import AsyncSession, Session
+from reqivo.client.session import AsyncSession, Session, _parse_origin
 from reqivo.http.headers import Headers
 
 # ============================================================================
@@ -71,7 +73,6 @@ def _setup_session_mocks(
     session.pool = mock_pool
 
     MockRequest.send.return_value = mock_response
-    MockRequest.set_session_instance = mock.Mock()
     return mock_conn
 
 
@@ -84,7 +85,7 @@ class TestSessionHttpMethods:
     """Tests for Session put, delete, patch, head, options methods."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_put_sends_correct_method(
         self,
         mock_urlparse: mock.Mock,
@@ -101,7 +102,7 @@ class TestSessionHttpMethods:
         assert call_args[1]["body"] == '{"name": "test"}'
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_delete_sends_correct_method(
         self,
         mock_urlparse: mock.Mock,
@@ -117,7 +118,7 @@ class TestSessionHttpMethods:
         assert call_args[0][0] == "DELETE"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_delete_with_body(
         self,
         mock_urlparse: mock.Mock,
@@ -133,7 +134,7 @@ class TestSessionHttpMethods:
         assert call_args[1]["body"] == '{"reason": "obsolete"}'
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_patch_sends_correct_method(
         self,
         mock_urlparse: mock.Mock,
@@ -150,7 +151,7 @@ class TestSessionHttpMethods:
         assert call_args[1]["body"] == '{"name": "updated"}'
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_head_sends_correct_method(
         self,
         mock_urlparse: mock.Mock,
@@ -166,7 +167,7 @@ class TestSessionHttpMethods:
         assert call_args[0][0] == "HEAD"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_head_does_not_send_body(
         self,
         mock_urlparse: mock.Mock,
@@ -182,7 +183,7 @@ class TestSessionHttpMethods:
         assert call_args[1]["body"] is None
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_options_sends_correct_method(
         self,
         mock_urlparse: mock.Mock,
@@ -198,7 +199,7 @@ class TestSessionHttpMethods:
         assert call_args[0][0] == "OPTIONS"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_options_does_not_send_body(
         self,
         mock_urlparse: mock.Mock,
@@ -214,7 +215,7 @@ class TestSessionHttpMethods:
         assert call_args[1]["body"] is None
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_put_passes_custom_headers(
         self,
         mock_urlparse: mock.Mock,
@@ -234,7 +235,7 @@ class TestSessionHttpMethods:
         assert "Content-Type" in call_kwargs["headers"]
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_patch_passes_timeout(
         self,
         mock_urlparse: mock.Mock,
@@ -250,7 +251,7 @@ class TestSessionHttpMethods:
         assert call_kwargs["timeout"] == 30
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_delete_passes_limits(
         self,
         mock_urlparse: mock.Mock,
@@ -276,7 +277,7 @@ class TestSessionRequestConsolidation:
     """Tests verifying all HTTP methods use the shared _request() path."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_all_methods_use_request_send(
         self,
         mock_urlparse: mock.Mock,
@@ -310,7 +311,7 @@ class TestSessionRequestConsolidation:
             assert call_args[0][0] == expected_method
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_all_methods_inject_auth(
         self,
         mock_urlparse: mock.Mock,
@@ -336,7 +337,7 @@ class TestSessionRequestConsolidation:
             ), f"{method_name} missing Authorization header"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_all_methods_inject_cookies(
         self,
         mock_urlparse: mock.Mock,
@@ -406,6 +407,157 @@ class TestBaseUrlResolution:
         resolved = s._resolve_url("https://other.com/data")
         assert resolved == "https://other.com/data"
 
+    @pytest.mark.parametrize(
+        "base_url",
+        [
+            "https://api.example.com",
+            "https://api.example.com/v2/",
+            "http://api.example.com:8080/v2/items?x=1#frag",
+            "https://api.example.com/v2",
+            "https://api.example.com/a//b/",
+            "https://api.example.com/a/./b/",
+            "wss://stream.example.com/ws/",
+            "/api/v2/",
+        ],
+    )
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/users",
+            "/users?page=2#top",
+            "users",
+            "../users",
+            "/a/./b/../c",
+            "//cdn.example.com/lib.js",
+            "",
+            "?q=1",
+            "https://other.com/data",
+            "HTTPS://other.com/data",
+            "ftp://files.example.com/f",
+            "mailto:user@example.com",
+            "a1+b.c-d:rest",
+            "1abc:x",
+            "a_b:c",
+            "items:42",
+            "users/42",
+            "users;v=1",
+            "users?x=1#f",
+            "a//b",
+            "./users",
+            ".hidden",
+            "users/./x",
+            "users/..",
+            "#frag",
+        ],
+    )
+    @pytest.mark.parametrize("session_cls", [Session, AsyncSession])
+    def test_resolve_url_matches_reference(
+        self, session_cls: Type[Union[Session, AsyncSession]], base_url: str, url: str
+    ) -> None:
+        """Test the cached fast paths agree with urlparse/urljoin resolution."""
+        s = session_cls(base_url=base_url)
+        if urllib.parse.urlparse(url).scheme:
+            expected = url
+        else:
+            expected = urllib.parse.urljoin(base_url, url)
+        assert s._resolve_url(url) == expected
+
+    def test_base_url_reassignment_refreshes_cached_origin(self) -> None:
+        """Test setting base_url after construction updates resolution."""
+        s = Session(base_url="https://api.example.com")
+        s.base_url = "https://other.example.com/v1/"
+        assert s._base_origin == "https://other.example.com"
+        assert s._resolve_url("/ping") == "https://other.example.com/ping"
+
+        s.base_url = None
+        assert s._base_origin is None
+        assert s._resolve_url("/ping") == "/ping"
+
+    def test_resolve_url_absolute_path_skips_urlsplit(self) -> None:
+        """Test absolute paths are joined onto the cached origin."""
+        s = AsyncSession(base_url="https://api.example.com/v2/")
+        with mock.patch("reqivo.client.session.urllib.parse.urlsplit") as parse:
+            assert s._resolve_url("/items") == "https://api.example.com/items"
+            assert s._resolve_url("https://x.com/") == "https://x.com/"
+            assert s._resolve_url("wss://x.com/ws") == "wss://x.com/ws"
+        parse.assert_not_called()
+
+    def test_resolve_url_relative_segment_skips_urljoin(self) -> None:
+        """Test plain relative segments are appended to the cached base dir."""
+        s = Session(base_url="https://api.example.com/v2/items")
+        assert s._base_dir == "https://api.example.com/v2/"
+        with mock.patch("reqivo.client.session.urllib.parse.urljoin") as join:
+            assert s._resolve_url("users/7") == "https://api.example.com/v2/users/7"
+        join.assert_not_called()
+
+    def test_base_dir_not_cached_for_unnormalized_base(self) -> None:
+        """Test bases urljoin would normalize fall back to urljoin."""
+        s = Session(base_url="https://api.example.com/a/../b/")
+        assert s._base_dir is None
+        assert s._resolve_url("users") == "https://api.example.com/b/users"
+
+    @mock.patch("reqivo.client.session.Request")
+    def test_request_parses_url_once(
+        self, MockRequest: mock.Mock, mock_response: mock.Mock
+    ) -> None:
+        """Test a request with base_url splits the resolved URL exactly once."""
+        s = Session(base_url="https://api.example.com")
+        s.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+
+        with mock.patch(
+            "reqivo.client.session.urllib.parse.urlsplit",
+            wraps=urllib.parse.urlsplit,
+        ) as spy:
+            s.get("/users")
+            s.get("https://other.example.com/data")
+
+        assert spy.call_count == 2
+        s.pool.get_connection.assert_called_with(
+            "other.example.com", 443, use_ssl=True, timeout=5
+        )
+
+    @mock.patch("reqivo.client.session.Request")
+    def test_repeat_url_reuses_cached_endpoint(
+        self, MockRequest: mock.Mock, mock_response: mock.Mock
+    ) -> None:
+        """Test repeated requests to one URL split it only the first time."""
+        s = Session()
+        s.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+
+        with mock.patch(
+            "reqivo.client.session.urllib.parse.urlsplit",
+            wraps=urllib.parse.urlsplit,
+        ) as spy:
+            s.get("http://API.Example.com:8080/items")
+            s.get("http://API.Example.com:8080/items")
+
+        assert spy.call_count == 1
+        s.pool.get_connection.assert_called_with(
+            "api.example.com", 8080, use_ssl=False, timeout=5
+        )
+
+    def test_origin_cache_shared_across_sessions(self) -> None:
+        """Test a URL parsed by one session is reused by another."""
+        with mock.patch("reqivo.client.session.Request"):
+            first, second = Session(), Session()
+            first.pool, second.pool = mock.Mock(), mock.Mock()
+            first.get("https://example.com/x")
+            second.get("https://example.com/x")
+
+        info = _parse_origin.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_invalid_url_is_not_cached(self) -> None:
+        """Test URLs without a host raise every time and are not cached."""
+        s = Session()
+        s.pool = mock.Mock()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid URL"):
+                s.get("http:///nohost")
+        assert _parse_origin.cache_info().currsize == 0
+
     @mock.patch("reqivo.client.session.Request")
     @mock.patch("reqivo.client.session.ConnectionPool")
     def test_session_get_with_base_url_and_relative(
@@ -423,7 +575,6 @@ class TestBaseUrlResolution:
         s.pool = mock_pool_instance
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         s.get("/users")
 
@@ -456,7 +607,7 @@ class TestDefaultTimeout:
         assert s.default_timeout is None
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_default_timeout_used_when_not_overridden(
         self,
         mock_urlparse: mock.Mock,
@@ -478,7 +629,6 @@ class TestDefaultTimeout:
         s.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         s.get("https://example.com/test")
 
@@ -486,7 +636,7 @@ class TestDefaultTimeout:
         assert call_kwargs["timeout"] == 15
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_per_request_timeout_overrides_default(
         self,
         mock_urlparse: mock.Mock,
@@ -508,7 +658,6 @@ class TestDefaultTimeout:
         s.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         s.get("https://example.com/test", timeout=60)
 
@@ -536,7 +685,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_put(
         self,
         mock_urlparse: mock.Mock,
@@ -567,7 +716,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_delete(
         self,
         mock_urlparse: mock.Mock,
@@ -596,7 +745,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_patch(
         self,
         mock_urlparse: mock.Mock,
@@ -628,7 +777,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_head(
         self,
         mock_urlparse: mock.Mock,
@@ -657,7 +806,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_options(
         self,
         mock_urlparse: mock.Mock,
@@ -686,7 +835,7 @@ class TestAsyncSessionHttpMethods:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_default_timeout_fallback(
         self,
         mock_urlparse: mock.Mock,
@@ -903,3 +1052,18 @@ class TestAsyncRequestHttpMethods:
             assert (
                 call_args[0] == expected_method
             ), f"AsyncRequest.{method_name} should pass '{expected_method}'"
+
+    @pytest.mark.asyncio
+    async def test_async_request_methods_return_send_coroutine(self) -> None:
+        """Test that verb helpers return the send() coroutine without wrapping it."""
+        mock_resp = mock.Mock(spec=Response)
+        sentinel_coro = mock.AsyncMock(return_value=mock_resp)()
+
+        with mock.patch.object(
+            AsyncRequest, "send", new=mock.Mock(return_value=sentinel_coro)
+        ) as mock_send:
+            awaitable = AsyncRequest.head("https://example.com/resource")
+
+            assert awaitable is sentinel_coro
+            assert await awaitable is mock_resp
+            mock_send.assert_called_once()
@@ -273,6 +273,39 @@ class TestParseResponseErrors:
 
         assert "Headers exceed maximum size" in str(exc_info.value)
 
+    def test_headers_too_large_even_if_delimiter_follows(
+        self, strict_parser: HttpParser
+    ) -> None:
+        """Test a delimiter past the size limit does not make the head valid."""
+        data = b"HTTP/1.1 200 OK\r\nX-Big: " + b"A" * 300 + b"\r\n\r\nbody"
+
+        with pytest.raises(ProtocolError, match="Headers exceed maximum size"):
+            strict_parser.parse_head(data)
+
+    def test_small_head_with_large_body_is_accepted(
+        self, strict_parser: HttpParser
+    ) -> None:
+        """Test only the head counts against max_header_size."""
+        head = b"HTTP/1.1 200 OK\r\nContent-Length: 4096\r\n\r\n"
+        data = head + b"B" * 4096
+
+        status_code, _, fields, body_offset = strict_parser.parse_head(data)
+
+        assert status_code == 200
+        assert fields == {"content-length": ["4096"]}
+        assert body_offset == len(head)
+
+    def test_delimiter_ending_at_size_limit_is_accepted(self) -> None:
+        """Test a head of exactly max_header_size bytes plus CRLFCRLF parses."""
+        prefix = b"HTTP/1.1 200 OK\r\nX-Pad: "
+        head = prefix + b"p" * (64 - len(prefix))
+        parser = HttpParser(max_header_size=64)
+
+        _, _, fields, body_offset = parser.parse_head(head + b"\r\n\r\n" + b"x" * 100)
+
+        assert body_offset == 68
+        assert fields["x-pad"] == ["p" * (64 - len(prefix))]
+
     def test_parse_response_raises_on_missing_delimiter(
         self, parser: HttpParser
     ) -> None:
@@ -589,3 +622,56 @@ class TestParseResponseIntegration:
         assert status_code == 404
         assert headers["Content-Type"] == ["text/html"]
         assert body == html_body
+
+
+# ============================================================================
+# TEST CLASS: parse_head()
+# ============================================================================
+
+
+class TestParseHead:
+    """Tests for parse_head(), which returns raw fields and the body offset."""
+
+    def test_parse_head_returns_body_offset(self, parser: HttpParser) -> None:
+        """Test that the returned offset points at the first body byte."""
+        data = b"HTTP/1.1 200 OK\r\nServer: test\r\n\r\nbody\r\n\r\nmore"
+
+        status_code, status_line, headers, offset = parser.parse_head(data)
+
+        assert status_code == 200
+        assert status_line == "HTTP/1.1 200 OK"
+        assert headers == {"server": ["test"]}
+        assert data[offset:] == b"body\r\n\r\nmore"
+
+    def test_parse_head_incomplete_headers(self, parser: HttpParser) -> None:
+        """Test that a missing header delimiter raises InvalidResponseError."""
+        with pytest.raises(InvalidResponseError):
+            parser.parse_head(b"HTTP/1.1 200 OK\r\nServer: test\r\n")
+
+    def test_parse_head_common_names_interned(self, parser: HttpParser) -> None:
+        """Test common header names are returned as shared interned strings."""
+        data = b"HTTP/1.1 200 OK\r\nContent-Type: a\r\nX-Other: b\r\n\r\n"
+
+        _, _, first, _ = parser.parse_head(data)
+        _, _, second, _ = parser.parse_head(data)
+
+        (ct_first, other_first), (ct_second, other_second) = first, second
+        assert ct_first == "content-type"
+        assert ct_first is ct_second
+        assert other_first == other_second == "x-other"
+
+    def test_parse_response_common_names_title_cased(self, parser: HttpParser) -> None:
+        """Test parse_response() still Title-Cases common and other names."""
+        data = b"HTTP/1.1 200 OK\r\nwww-authenticate: a\r\nx-b3-id: b\r\n\r\n"
+
+        _, _, headers, _ = parser.parse_response(data)
+
+        assert headers == {"Www-Authenticate": ["a"], "X-B3-Id": ["b"]}
+
+    def test_parse_head_merges_case_variants(self, parser: HttpParser) -> None:
+        """Test that names differing only in case share one value list."""
+        data = b"HTTP/1.1 200 OK\r\nX-Tag: a\r\nx-tag: b\r\n\r\n"
+
+        _, _, headers, _ = parser.parse_head(data)
+
+        assert headers == {"x-tag": ["a", "b"]}
@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from reqivo.client.request import AsyncRequest, Request
+from reqivo.client.request import (
+    AsyncRequest,
+    Request,
+    _encode_head,
+    _header_line,
+    validate_header,
+)
 from reqivo.client.response import Response
 from reqivo.exceptions import NetworkError, RedirectLoopError, RequestError
 from reqivo.http.headers import Headers
@@ -148,6 +154,78 @@ def test_build_request_null_byte_in_header_key():
         Request.build_request("GET", "/", "host", {"X-Bad\x00Key": "value"}, None)
 
 
+def test_build_request_reuses_formatted_header_lines():
+    """Test repeated headers are validated and formatted only once."""
+    _header_line.cache_clear()
+    headers = {"X-Token": "abc"}
+
+    first = Request.build_request("GET", "/a", "host", headers, None)
+    second = Request.build_request("GET", "/b", "host", headers, None)
+
+    assert first.replace(b"/a", b"/b") == second
+    assert b"X-Token: abc\r\n" in first
+    info = _header_line.cache_info()
+    assert info.misses == 4
+    assert info.hits == 4
+
+
+def test_build_request_reuses_encoded_head():
+    """Test an identical request line and headers are encoded only once."""
+    _encode_head.cache_clear()
+    headers = {"X-Token": "abc"}
+
+    first = Request.build_request("POST", "/poll", "host", headers, b"1")
+    second = Request.build_request("POST", "/poll", "host", headers, b"2")
+
+    assert first[:-1] == second[:-1]
+    assert first.endswith(b"\r\n\r\n1")
+    assert _encode_head.cache_info().hits == 1
+
+    Request.build_request("POST", "/poll", "host", {"X-Token": "xyz"}, b"1")
+    assert _encode_head.cache_info().misses == 2
+
+
+@pytest.mark.parametrize("name", ["Authorization", "cookie", "Proxy-Authorization"])
+def test_build_request_does_not_cache_credentials(name):
+    """Test credential headers never enter the line or head caches."""
+    _header_line.cache_clear()
+    _encode_head.cache_clear()
+
+    raw = Request.build_request("GET", "/", "host", {name: "secret"}, None)
+
+    assert f"{name}: secret\r\n".encode() in raw
+    assert _header_line.cache_info().currsize == 3
+    assert _encode_head.cache_info().currsize == 0
+
+
+def test_build_request_rejects_invalid_credential_header():
+    """Test uncached credential headers are still validated."""
+    with pytest.raises(ValueError, match="Invalid character"):
+        Request.build_request("GET", "/", "host", {"Cookie": "a\r\nb"}, None)
+
+
+@pytest.mark.parametrize(
+    "name,value,match",
+    [
+        ("Host", "a\r\nX-Evil: 1", "Invalid character"),
+        ("X-A\nB", "v", "Invalid character"),
+        ("X-Null", "a\x00b", "Null byte"),
+    ],
+)
+def test_validate_header_rejects_injection(name, value, match):
+    """Test validate_header() applies the header line checks."""
+    validate_header("Host", "example.com")
+    with pytest.raises(ValueError, match=match):
+        validate_header(name, value)
+
+
+def test_build_request_invalid_header_rejected_every_time():
+    """Test a rejected header is not cached as valid."""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid character"):
+            Request.build_request("GET", "/", "host", {"X-Bad": "a\r\nb"}, None)
+
+
 def test_send_socket_timeout_error():
     """Test handling of socket.timeout during recv."""
     import socket
@@ -279,15 +357,40 @@ def test_send_with_session_cookie_update():
 
         # Create a mock session
         mock_session = MagicMock(spec=Session)
-        Request.set_session_instance(mock_session)
+        resp = Request.send("GET", "http://example.com/", session=mock_session)
+
+        # Verify session's cookie update method was called
+        mock_session._update_cookies_from_response.assert_called_once()
+
+
+def test_send_without_headers_uses_shared_empty_mapping():
+    """Test header-less sends pass the shared read-only mapping down."""
+    from reqivo.client.request import _EMPTY_HEADERS
+
+    with patch.object(Request, "_perform_request") as mock_perform:
+        mock_perform.return_value.status_code = 200
+        Request.send("GET", "http://example.com/")
+
+    assert mock_perform.call_args[0][2] is _EMPTY_HEADERS
 
-        try:
-            resp = Request.send("GET", "http://example.com/")
 
-            # Verify session's cookie update method was called
-            mock_session._update_cookies_from_response.assert_called_once()
-        finally:
-            Request.set_session_instance(None)
+def test_send_with_explicit_session_updates_cookies():
+    """Test cookies are stored in the session passed to send()."""
+    from reqivo.client.session import Session
+
+    mock_response = b"HTTP/1.1 200 OK\r\nSet-Cookie: session=abc123\r\n\r\n"
+
+    with patch("reqivo.client.request.Connection") as mock_conn_cls:
+        mock_conn = mock_conn_cls.return_value
+        mock_sock = MagicMock()
+        mock_conn.sock = mock_sock
+        mock_sock.recv.side_effect = [mock_response, b""]
+
+        session = Session()
+        Request.send("GET", "http://example.com/", session=session)
+
+    assert session.cookies == {"session": "abc123"}
+    assert not hasattr(Request, "set_session_instance")
 
 
 # ============================================================================
@@ -647,23 +750,6 @@ class TestAsyncRequest:
             limits=None,
         )
 
-    def test_async_set_session_instance(self):
-        """Test AsyncRequest.set_session_instance() sets class variable."""
-        from reqivo.client.session import AsyncSession
-
-        mock_session = MagicMock(spec=AsyncSession)
-
-        # Initially None
-        assert AsyncRequest._session_instance is None
-
-        # Set session instance (covers line 219)
-        AsyncRequest.set_session_instance(mock_session)
-        assert AsyncRequest._session_instance == mock_session
-
-        # Clear it
-        AsyncRequest.set_session_instance(None)
-        assert AsyncRequest._session_instance is None
-
     @pytest.mark.asyncio
     @patch("reqivo.client.request.AsyncConnection")
     async def test_async_send_updates_session_cookies(self, mock_conn_cls):
@@ -704,20 +790,13 @@ class TestAsyncRequest:
 
         mock_conn.close = async_close
 
-        # Set session instance
-        AsyncRequest.set_session_instance(mock_session)
-
-        try:
-            # Send request
-            resp = await AsyncRequest.send("GET", "http://example.com/")
-
-            # Verify session cookies were updated (covers line 290)
-            mock_session._update_cookies_from_response.assert_called_once()
-            assert resp.status_code == 200
+        resp = await AsyncRequest.send(
+            "GET", "http://example.com/", session=mock_session
+        )
 
-        finally:
-            # Clean up
-            AsyncRequest.set_session_instance(None)
+        # Verify session cookies were updated
+        mock_session._update_cookies_from_response.assert_called_once()
+        assert resp.status_code == 200
 
     @pytest.mark.asyncio
     @patch("reqivo.client.request.AsyncConnection")
@@ -887,12 +966,13 @@ class TestAsyncRequest:
 
         mock_reader.read = async_read
 
-        resp = await AsyncRequest.send(
-            "GET", "http://example.com/", headers={"Authorization": "Bearer token"}
-        )
+        headers = {"Authorization": "Bearer token"}
+        resp = await AsyncRequest.send("GET", "http://example.com/", headers=headers)
 
         assert resp.status_code == 200
-        # Authorization should have been stripped in second request
+        # Authorization is stripped from the second request only; the
+        # caller's dict is left untouched
+        assert headers == {"Authorization": "Bearer token"}
 
     @pytest.mark.asyncio
     @patch("reqivo.client.request.AsyncConnection")
@@ -5,8 +5,27 @@ from unittest import mock
 
 import pytest
 
-from reqivo.client.response import Response, ResponseParseError
+from reqivo.client.response import (
+    _F_CHUNKED,
+    _F_CONSUMED,
+    _F_STREAM,
+    Response,
+    ResponseParseError,
+)
 from reqivo.exceptions import InvalidResponseError
+from reqivo.http.headers import Headers
+
+
+def _recv_into_from(chunks):
+    """Build a recv_into side effect that serves ``chunks`` in order."""
+    pending = iter(chunks)
+
+    def recv_into(buf, nbytes=0):
+        data = next(pending)
+        buf[: len(data)] = data
+        return len(data)
+
+    return recv_into
 
 
 def test_response_initialization():
@@ -99,7 +118,7 @@ def test_response_unexpected_parse_error(monkeypatch):
     def mock_parse(self, data):
         raise RuntimeError("Unexpected boom")
 
-    monkeypatch.setattr(HttpParser, "parse_response", mock_parse)
+    monkeypatch.setattr(HttpParser, "parse_head", mock_parse)
 
     with pytest.raises(ResponseParseError, match="Unexpected error parsing response"):
         Response(b"some data")
@@ -176,7 +195,7 @@ def test_response_iter_content_with_content_length():
         def __init__(self):
             self.sock = mock.Mock()
             # Simulate reading additional content
-            self.sock.recv.side_effect = [b"More ", b"data", b""]
+            self.sock.recv_into.side_effect = _recv_into_from([b"More ", b"data", b""])
 
         def close(self):
             pass
@@ -197,7 +216,9 @@ def test_response_iter_content_no_length_no_chunked():
         def __init__(self):
             self.sock = mock.Mock()
             # Read until the connection closes
-            self.sock.recv.side_effect = [b"Some ", b"content", b""]
+            self.sock.recv_into.side_effect = _recv_into_from(
+                [b"Some ", b"content", b""]
+            )
 
         def close(self):
             pass
@@ -239,7 +260,7 @@ def test_response_iter_content_invalid_content_length():
     class MockConnection:
         def __init__(self):
             self.sock = mock.Mock()
-            self.sock.recv.side_effect = [b"data", b""]
+            self.sock.recv_into.side_effect = _recv_into_from([b"data", b""])
 
         def close(self):
             pass
@@ -259,7 +280,7 @@ def test_response_iter_content_custom_chunk_size():
     class MockConnection:
         def __init__(self):
             self.sock = mock.Mock()
-            self.sock.recv.side_effect = [b"AB", b"CD", b""]
+            self.sock.recv_into.side_effect = _recv_into_from([b"AB", b"CD", b""])
             self.closed = False
 
         def close(self):
@@ -311,3 +332,294 @@ def test_response_iter_content_when_already_consumed():
     # Now calling iter_content() on consumed response should yield body (lines 125-126)
     chunks = list(resp.iter_content())
     assert chunks == [b"StreamData"]
+
+
+def test_response_text_streaming_content_length_stops_at_length():
+    """Test text() on a stream reads exactly the remaining Content-Length bytes."""
+
+    class MockConnection:
+        def __init__(self):
+            self.sock = mock.Mock()
+            self.sock.recv.side_effect = [b"lo, ", b"World!", b"EXTRA"]
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    conn = MockConnection()
+    raw = b"HTTP/1.1 200 OK\r\nContent-Length: 13\r\n\r\nHel"
+    resp = Response(raw, connection=conn, stream=True)
+
+    assert resp.text() == "Hello, World!"
+    assert conn.sock.recv.call_count == 2
+    assert conn.closed is True
+    assert resp._consumed is True
+
+
+def test_response_text_streaming_content_length_premature_eof():
+    """Test text() on a stream returns what was read if the peer closes early."""
+
+    class MockConnection:
+        def __init__(self):
+            self.sock = mock.Mock()
+            self.sock.recv.side_effect = [b"abc", b""]
+
+        def close(self):
+            pass
+
+    conn = MockConnection()
+    raw = b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\n"
+    resp = Response(raw, connection=conn, stream=True)
+
+    assert resp.text() == "abc"
+
+
+def test_response_text_streaming_chunked():
+    """Test text() on a chunked stream drains the whole chunked body."""
+
+    class MockConnection:
+        def __init__(self):
+            self.sock = mock.Mock()
+            self.sock.recv.side_effect = [
+                b"3",
+                b"\r",
+                b"\n",
+                b"abc",
+                b"\r\n",
+                b"0",
+                b"\r",
+                b"\n",
+                b"\r\n",
+            ]
+
+        def close(self):
+            pass
+
+    conn = MockConnection()
+    raw = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+    resp = Response(raw, connection=conn, stream=True)
+
+    assert resp.text() == "abc"
+    assert resp.body == b"abc"
+
+
+def test_response_text_streaming_without_connection():
+    """Test text() on a stream without a connection returns the buffered body."""
+    raw = b"HTTP/1.1 200 OK\r\n\r\nbuffered"
+    resp = Response(raw, stream=True)
+
+    assert resp.text() == "buffered"
+    assert resp._consumed is True
+
+
+def test_response_stashes_body_framing_headers():
+    """Test that body framing headers are captured once at parse time."""
+    raw = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"content-type: text/html; charset=latin-1\r\n"
+        b"Transfer-Encoding: Chunked\r\n"
+        b"Content-Length: 42\r\n\r\n"
+    )
+    resp = Response(raw)
+
+    assert resp._content_type == "text/html; charset=latin-1"
+    assert resp._flags & _F_CHUNKED
+    assert resp._content_length == "42"
+
+
+def test_response_framing_headers_default_when_absent():
+    """Test defaults for body framing headers when the server omits them."""
+    resp = Response(b"HTTP/1.1 204 No Content\r\n\r\n")
+
+    assert resp._content_type == ""
+    assert not resp._flags & _F_CHUNKED
+    assert resp._content_length is None
+
+
+def test_response_text_invalid_utf8_falls_back_to_replace():
+    """Test text() replaces undecodable bytes after the strict UTF-8 attempt."""
+    raw = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=UTF-8\r\n\r\nok\xff"
+    resp = Response(raw)
+
+    assert resp.text() == "ok�"
+
+
+def test_response_text_legacy_encoding_uses_replace_directly():
+    """Test text() decodes non-UTF-8 charsets without the strict attempt."""
+    raw = b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=latin-1\r\n\r\ncaf\xe9"
+    resp = Response(raw)
+
+    assert resp.text() == "café"
+
+
+def test_response_body_is_materialized_lazily_from_raw():
+    """Test body is a view over raw until first accessed, then cached."""
+    raw = b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nHello"
+    resp = Response(raw)
+
+    assert resp._body is None
+    assert resp._body_view.obj is raw
+    assert resp.text() == "Hello"
+    assert resp._body is None
+
+    body = resp.body
+    assert body == b"Hello"
+    assert resp.body is body
+
+
+def test_response_body_setter_replaces_view():
+    """Test assigning body keeps the bytes and its view in sync."""
+    resp = Response(b"HTTP/1.1 200 OK\r\n\r\nold")
+    resp.body = b"new"
+
+    assert resp.body == b"new"
+    assert resp.text() == "new"
+    assert list(resp.iter_content()) == [b"new"]
+
+
+def test_response_reuses_parser_per_limits():
+    """Test that responses with equal limits share a cached HttpParser."""
+    from reqivo.client.response import _parser_for
+
+    first = _parser_for((("max_line_size", 100),))
+    assert _parser_for((("max_line_size", 100),)) is first
+    assert _parser_for(()) is not first
+    assert first.max_line_size == 100
+
+    raw = b"HTTP/1.1 200 OK\r\nX-Test: 1\r\n\r\n"
+    Response(raw, limits={"max_line_size": 100, "max_field_count": 5})
+    Response(raw, limits={"max_field_count": 5, "max_line_size": 100})
+    assert _parser_for.cache_info().hits >= 1
+
+
+def test_response_iter_content_reuses_receive_buffer():
+    """Test iter_content reads into one buffer and yields independent bytes."""
+
+    class MockConnection:
+        def __init__(self):
+            self.sock = mock.Mock()
+            self.sock.recv_into.side_effect = _recv_into_from([b"first", b"2nd", b""])
+
+        def close(self):
+            pass
+
+    conn = MockConnection()
+    resp = Response(b"HTTP/1.1 200 OK\r\n\r\n", connection=conn, stream=True)
+
+    chunks = list(resp.iter_content(chunk_size=8))
+
+    assert chunks == [b"first", b"2nd"]
+    assert all(type(chunk) is bytes for chunk in chunks)
+    buffers = {id(call.args[0]) for call in conn.sock.recv_into.call_args_list}
+    assert len(buffers) == 1
+    conn.sock.recv.assert_not_called()
+
+
+def test_response_json_decodes_utf8_bytes_directly():
+    """Test json() parses UTF-8 bodies from bytes without calling text()."""
+    raw = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n"
+        + '{"name": "café"}'.encode("utf-8")
+    )
+    resp = Response(raw)
+
+    with mock.patch.object(Response, "text") as mock_text:
+        assert resp.json() == {"name": "café"}
+    mock_text.assert_not_called()
+
+
+def test_response_json_invalid_utf8_falls_back_to_text():
+    """Test json() falls back to the replacing text() decode on bad UTF-8."""
+    raw = b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"ok\xff"'
+    resp = Response(raw)
+
+    assert resp.json() == "ok�"
+
+
+def test_response_json_declared_legacy_charset_uses_text():
+    """Test json() honours a non-UTF-8 charset by decoding through text()."""
+    raw = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json; charset=latin-1\r\n\r\n"
+        b'"caf\xe9"'
+    )
+    resp = Response(raw)
+
+    assert resp.json() == "café"
+
+
+def test_response_json_streaming():
+    """Test json() buffers a streamed body before parsing it."""
+
+    class MockConnection:
+        def __init__(self):
+            self.sock = mock.Mock()
+            self.sock.recv.side_effect = [b'{"a": ', b"1}", b""]
+
+        def close(self):
+            pass
+
+    conn = MockConnection()
+    resp = Response(b"HTTP/1.1 200 OK\r\n\r\n", connection=conn, stream=True)
+
+    assert resp.json() == {"a": 1}
+    assert resp._consumed is True
+
+
+def test_response_flags_bitfield():
+    """Test stream/consumed state is packed into the _flags bitfield."""
+    resp = Response(b"HTTP/1.1 200 OK\r\n\r\n", stream=True)
+
+    assert resp._flags == _F_STREAM
+    assert resp.stream is True
+    assert resp._consumed is False
+
+    resp._consumed = True
+    assert resp._flags == _F_STREAM | _F_CONSUMED
+    assert resp._consumed is True
+
+    resp._consumed = False
+    assert resp._flags == _F_STREAM
+
+    assert Response(b"HTTP/1.1 200 OK\r\n\r\n")._flags == 0
+
+
+def test_response_headers_built_lazily():
+    """Test the Headers wrapper is only created when headers are accessed."""
+    raw = b"HTTP/1.1 200 OK\r\nX-Custom: 1\r\nX-Custom: 2\r\n\r\n"
+    resp = Response(raw)
+
+    assert resp._headers is None
+    headers = resp.headers
+    assert headers["X-Custom"] == "1, 2"
+    assert headers._headers is resp._header_fields
+    assert resp.headers is headers
+
+
+def test_response_headers_setter_overrides_parsed_headers():
+    """Test assigning headers replaces the lazily built instance."""
+    resp = Response(b"HTTP/1.1 200 OK\r\nA: 1\r\n\r\n")
+    resp.headers = Headers({"B": "2"})
+
+    assert resp.headers.get("B") == "2"
+    assert resp.headers.get("A") is None
+
+
+def test_response_headers_setter_refreshes_framing_and_charset():
+    """Test replaced headers drive text() decoding and chunked framing."""
+    resp = Response(
+        b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; charset=utf-8\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n\xe9"
+    )
+    resp.headers = Headers(
+        {"Content-Type": "text/plain; charset=latin-1", "Content-Length": "1"}
+    )
+
+    assert resp._content_length == "1"
+    assert not resp._flags & _F_CHUNKED
+    assert resp.text() == "é"
+
+    resp.headers = Headers({"Transfer-Encoding": "gzip, Chunked"})
+
+    assert resp._content_type == ""
+    assert resp._content_length is None
+    assert resp._flags & _F_CHUNKED
@@ -17,15 +17,17 @@ Testing Strategy:
     - Validate proper cleanup on errors
 """
 
-from http.cookies import CookieError
-from typing import Dict
+import asyncio
+import http.cookies
+from typing import Any, Callable, Dict, Type, Union
 from unittest import mock
 
 import pytest
 
 from reqivo.client.response import Response
-from reqivo.client.session import AsyncSession, Session
+from reqivo.client.session import AsyncSession, Session, _parse_set_cookie
 from reqivo.http.headers import Headers
+from reqivo.transport.connection_pool import AsyncConnectionPool, ConnectionPool
 
 # ============================================================================
 # FIXTURES
@@ -69,6 +71,32 @@ class TestSessionInit:
         assert session._bearer_token is None
         assert session.pool is not None
 
+    def test_sessions_get_their_own_pool(self) -> None:
+        """Test sessions without an explicit pool do not share connections."""
+        first, second = Session(), Session()
+        assert isinstance(first.pool, ConnectionPool)
+        assert first.pool is not second.pool
+
+    def test_init_with_explicit_pool(self) -> None:
+        """Test an explicit pool is used as given and can be shared."""
+        pool = ConnectionPool(max_size=2)
+        s = Session(pool=pool)
+        assert s.pool is pool
+        assert Session(pool=pool).pool is pool
+
+    def test_close_closes_default_pool(self) -> None:
+        """Test close() releases the connections of the session's own pool."""
+        s = Session()
+        with mock.patch.object(ConnectionPool, "close_all") as close_all:
+            s.close()
+        close_all.assert_called_once()
+
+    def test_async_init_with_explicit_pool(self) -> None:
+        """Test AsyncSession accepts an explicit pool."""
+        pool = AsyncConnectionPool(max_size=2)
+        assert AsyncSession(pool=pool).pool is pool
+        assert AsyncSession().pool is not pool
+
     def test_init_with_base_url(self) -> None:
         """Test Session initialization with base_url."""
         s = Session(base_url="https://api.example.com")
@@ -107,6 +135,27 @@ class TestSessionInit:
         session.set_bearer_token("new_token")
         assert session._basic_auth is None
 
+    @mock.patch("reqivo.client.session.Request")
+    def test_auth_header_built_once_on_set(
+        self, MockRequest: mock.Mock, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test the Authorization value is computed by set_* and then reused."""
+        session.set_basic_auth("user", "pass")
+        assert session._auth_header == "Basic dXNlcjpwYXNz"
+
+        session.set_bearer_token("token123")
+        assert session._auth_header == "Bearer token123"
+
+        session.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+        with mock.patch("reqivo.client.session.build_bearer_auth_header") as build:
+            session.get("https://example.com/")
+            session.get("https://example.com/")
+
+        build.assert_not_called()
+        headers = MockRequest.send.call_args[1]["headers"]
+        assert headers["Authorization"] == "Bearer token123"
+
 
 # ============================================================================
 # TEST CLASS: Cookie Management
@@ -150,6 +199,363 @@ class TestSessionCookies:
         session._update_cookies_from_response(mock_response)
         assert session.cookies == {}
 
+    def test_update_cookies_skips_get_all_without_set_cookie(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test responses without Set-Cookie never reach get_all()."""
+        mock_response.headers = Headers({"Content-Type": "text/plain"})
+        with mock.patch.object(Headers, "get_all") as get_all:
+            session._update_cookies_from_response(mock_response)
+        get_all.assert_not_called()
+        assert session.cookies == {}
+
+    def test_cookie_header_cached_until_jar_changes(self, session: Session) -> None:
+        """Test the Cookie header is reused until the jar is mutated."""
+        session.cookies = {"a": "1"}
+        first = session._build_cookie_header()
+        assert session._build_cookie_header() is first
+
+        session.cookies["a"] = "1"  # same value: no invalidation
+        assert session._build_cookie_header() is first
+
+        session.cookies["b"] = "2"
+        assert session._build_cookie_header() == "a=1; b=2"
+
+        del session.cookies["a"]
+        assert session._build_cookie_header() == "b=2"
+
+        session.cookies.update(c="3")
+        assert session._build_cookie_header() == "b=2; c=3"
+
+        session.cookies |= {"d": "4"}
+        assert session._build_cookie_header() == "b=2; c=3; d=4"
+
+        session.cookies.pop("b")
+        session.cookies.setdefault("e", "5")
+        assert session._build_cookie_header() == "c=3; d=4; e=5"
+
+        session.cookies.popitem()
+        assert session._build_cookie_header() == "c=3; d=4"
+
+        session.cookies.clear()
+        assert session._build_cookie_header() == ""
+
+    @pytest.mark.parametrize(
+        "line,expected",
+        [
+            ("sid=abc", ("sid", "abc")),
+            ("sid=abc; Path=/; HttpOnly", ("sid", "abc")),
+            (" sid = abc ; Secure", ("sid", "abc")),
+            ('token="quoted value"; Path=/', ("token", "quoted value")),
+            ("empty=; Max-Age=0", ("empty", "")),
+            ("pair=a=b", ("pair", "a=b")),
+            ("no_equals_sign", None),
+            ("=value", None),
+            ("; Path=/", None),
+            ("bad name=1", None),
+            ('bad"name=1', None),
+            ("a[b]=1", None),
+            ("__Host-id=1; Secure", ("__Host-id", "1")),
+            ("sid=abc;", ("sid", "abc")),
+            ('q="x;y"; Path=/', ("q", "x;y")),
+            ('q="x\\"y"', ("q", 'x"y')),
+            ('q="\\073z"', ("q", ";z")),
+            ('q="unterminated', ("q", "unterminated")),
+        ],
+    )
+    def test_parse_set_cookie(self, line: str, expected: object) -> None:
+        """Test extraction of the name/value pair from Set-Cookie lines."""
+        assert _parse_set_cookie(line) == expected
+
+    def test_parse_set_cookie_simple_values_skip_simplecookie(self) -> None:
+        """Test SimpleCookie is only used for quoted values needing it."""
+        with mock.patch("reqivo.client.session.http.cookies.SimpleCookie") as cls:
+            assert _parse_set_cookie('sid="abc"; Path=/') == ("sid", "abc")
+            assert _parse_set_cookie("sid=abc") == ("sid", "abc")
+        cls.assert_not_called()
+
+    def test_parse_set_cookie_simplecookie_error_uses_regex_pair(self) -> None:
+        """Test a CookieError from the quoted fallback keeps the regex pair."""
+        parser = mock.Mock()
+        parser.load.side_effect = http.cookies.CookieError("bad")
+        assert _parse_set_cookie('q="x;y"; Path=/', parser) == ("q", "x")
+
+    def test_update_cookies_reuses_session_cookie_parser(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test the quoted-value fallback reuses the session's SimpleCookie."""
+        parser = session._cookie_parser
+        mock_response.headers = Headers(
+            {"Set-Cookie": ['q="x;y"; Path=/', 'r="a\\"b"']}
+        )
+        with mock.patch("reqivo.client.session.http.cookies.SimpleCookie") as cls:
+            session._update_cookies_from_response(mock_response)
+            assert session.cookies == {"q": "x;y", "r": 'a"b'}
+        cls.assert_not_called()
+        assert session._cookie_parser is parser
+        assert list(parser) == ["r"]
+
+    def test_set_cookie_parsed_only_when_jar_is_needed(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test Set-Cookie lines are queued and parsed on first jar use."""
+        mock_response.headers = Headers({"Set-Cookie": ["a=1", "b=2"]})
+        with mock.patch(
+            "reqivo.client.session._parse_set_cookie", wraps=_parse_set_cookie
+        ) as parse:
+            session._update_cookies_from_response(mock_response)
+            parse.assert_not_called()
+
+            assert session._merge_headers(None)["Cookie"] == "a=1; b=2"
+            assert parse.call_count == 2
+
+            assert session.cookies == {"a": "1", "b": "2"}
+            assert parse.call_count == 2
+
+    def test_pending_set_cookies_keep_arrival_order(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test later responses win when queued cookies share a name."""
+        mock_response.headers = Headers({"Set-Cookie": "a=1"})
+        session._update_cookies_from_response(mock_response)
+        mock_response.headers = Headers({"Set-Cookie": "a=2"})
+        session._update_cookies_from_response(mock_response)
+        assert session.cookies == {"a": "2"}
+
+    def test_cookies_setter_drops_pending_set_cookies(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test assigning the jar supersedes cookies not yet parsed."""
+        mock_response.headers = Headers({"Set-Cookie": "a=1"})
+        session._update_cookies_from_response(mock_response)
+        session.cookies = {"b": "2"}
+        assert session.cookies == {"b": "2"}
+
+    @mock.patch("reqivo.client.session.Request")
+    def test_pending_set_cookies_sent_on_next_request(
+        self, MockRequest: mock.MagicMock, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test queued cookies make the next request carry a Cookie header."""
+        session.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+        mock_response.headers = Headers({"Set-Cookie": "sid=abc"})
+        session._update_cookies_from_response(mock_response)
+
+        session.get("http://example.com/")
+
+        assert MockRequest.send.call_args[1]["headers"] == {"Cookie": "sid=abc"}
+
+    def test_update_cookies_multiple_set_cookie_headers(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test each Set-Cookie header contributes its own cookie."""
+        mock_response.headers = Headers(
+            {"Set-Cookie": ["a=1; Path=/", "b=2; HttpOnly", "garbage"]}
+        )
+        session._update_cookies_from_response(mock_response)
+        assert session.cookies == {"a": "1", "b": "2"}
+
+    def test_cookie_header_invalidated_by_response_cookies(
+        self, session: Session, mock_response: mock.Mock
+    ) -> None:
+        """Test Set-Cookie updates invalidate the cached Cookie header."""
+        session.cookies = {"a": "1"}
+        assert session._build_cookie_header() == "a=1"
+
+        mock_response.headers = Headers({"Set-Cookie": "a=2; Path=/"})
+        session._update_cookies_from_response(mock_response)
+        assert session._build_cookie_header() == "a=2"
+
+    def test_cookies_setter_copies_into_jar(self, session: Session) -> None:
+        """Test assigning cookies keeps a plain-dict view and equality."""
+        source = {"a": "1"}
+        session.cookies = source
+        source["b"] = "2"
+
+        assert session.cookies == {"a": "1"}
+        assert isinstance(session.cookies, dict)
+
+
+# ============================================================================
+# TEST CLASS: Prebuilt Session Headers
+# ============================================================================
+
+
+class TestSessionBaseHeaders:
+    """Tests for the cached merge of session headers, auth and cookies."""
+
+    def test_base_headers_cached_between_calls(self, session: Session) -> None:
+        """Test the merged base headers are reused while nothing changes."""
+        session.headers["Accept"] = "application/json"
+        session.set_bearer_token("tok")
+        session.cookies = {"sid": "1"}
+
+        base = session._get_base_headers()
+        assert base == {
+            "Accept": "application/json",
+            "Authorization": "Bearer tok",
+            "Cookie": "sid=1",
+        }
+        assert session._get_base_headers() is base
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda s: s.headers.update({"X-New": "1"}),
+            lambda s: s.headers.pop("Accept"),
+            lambda s: setattr(s, "headers", {"X-New": "1"}),
+            lambda s: s.cookies.__setitem__("other", "2"),
+            lambda s: setattr(s, "cookies", {}),
+            lambda s: s.set_basic_auth("user", "pass"),
+        ],
+    )
+    @pytest.mark.parametrize("session_cls", [Session, AsyncSession])
+    def test_base_headers_rebuilt_after_change(
+        self,
+        session_cls: Type[Union[Session, AsyncSession]],
+        mutate: Callable[[Union[Session, AsyncSession]], object],
+    ) -> None:
+        """Test headers, cookie and credential changes invalidate the cache."""
+        session = session_cls()
+        session.headers["Accept"] = "application/json"
+        session.set_bearer_token("tok")
+        session.cookies = {"sid": "1"}
+        base = session._get_base_headers()
+
+        mutate(session)
+
+        rebuilt = session._get_base_headers()
+        assert rebuilt is not base
+        expected = dict(session.headers)
+        expected["Authorization"] = session._auth_header
+        if session.cookies:
+            expected["Cookie"] = session._build_cookie_header()
+        assert rebuilt == expected
+
+    @pytest.mark.parametrize("session_cls", [Session, AsyncSession])
+    def test_base_headers_pick_up_pending_set_cookies(
+        self,
+        session_cls: Type[Union[Session, AsyncSession]],
+        mock_response: mock.Mock,
+    ) -> None:
+        """Test queued Set-Cookie lines refresh the cached Cookie header."""
+        session = session_cls()
+        session.cookies = {"sid": "1"}
+        base = session._get_base_headers()
+
+        mock_response.headers = Headers({"Set-Cookie": "sid=2; Path=/"})
+        session._update_cookies_from_response(mock_response)
+
+        rebuilt = session._get_base_headers()
+        assert rebuilt is not base
+        assert rebuilt == {"Cookie": "sid=2"}
+        assert session._merge_headers(None) == {"Cookie": "sid=2"}
+
+    def test_merge_headers_returns_private_copy(self, session: Session) -> None:
+        """Test callers can mutate the merged headers without touching the cache."""
+        session.headers["Accept"] = "text/html"
+        merged = session._merge_headers(None)
+        merged["Accept"] = "changed"
+        del merged["Accept"]
+
+        assert session._get_base_headers() == {"Accept": "text/html"}
+
+    def test_merge_headers_session_credentials_take_precedence(
+        self, session: Session
+    ) -> None:
+        """Test per-call headers override session headers but not auth/cookies."""
+        session.headers = {"Accept": "text/html", "X-Keep": "1"}
+        session.set_bearer_token("tok")
+        session.cookies = {"sid": "1"}
+
+        merged = session._merge_headers(
+            {"Accept": "application/json", "Authorization": "x", "Cookie": "y"}
+        )
+
+        assert merged == {
+            "Accept": "application/json",
+            "X-Keep": "1",
+            "Authorization": "Bearer tok",
+            "Cookie": "sid=1",
+        }
+
+    def test_merge_headers_copies_per_call_headers(self, session: Session) -> None:
+        """Test the caller's dict is never handed out or mutated."""
+        per_call = {"X-Call": "1"}
+
+        merged = session._merge_headers(per_call)
+        merged["X-Hook"] = "2"
+        session.headers["Accept"] = "a"
+        session._merge_headers(per_call)["X-Hook"] = "3"
+
+        assert merged is not per_call
+        assert per_call == {"X-Call": "1"}
+
+    def test_credential_headers_follow_session_state(self, session: Session) -> None:
+        """Test the per-call merge picks up cleared cookies and new credentials."""
+        session.cookies = {"sid": "1"}
+        assert session._merge_headers({"Cookie": "x"})["Cookie"] == "sid=1"
+        assert session._credential_headers == {"Cookie": "sid=1"}
+
+        session.cookies.clear()
+        session.set_bearer_token("tok")
+
+        assert session._merge_headers({"Cookie": "x"}) == {
+            "Cookie": "x",
+            "Authorization": "Bearer tok",
+        }
+        assert session._credential_headers == {"Authorization": "Bearer tok"}
+
+    @pytest.mark.parametrize(
+        "configure,expected",
+        [
+            (lambda s: None, None),
+            (lambda s: s.headers.update({"Accept": "a"}), {"Accept": "a"}),
+            (lambda s: s.cookies.update({"sid": "1"}), {"Cookie": "sid=1"}),
+            (lambda s: s.set_bearer_token("t"), {"Authorization": "Bearer t"}),
+            (lambda s: s.add_pre_request_hook(lambda m, u, h: (m, u, h)), {}),
+        ],
+    )
+    @mock.patch("reqivo.client.session.Request")
+    def test_bare_request_passes_no_headers(
+        self,
+        MockRequest: mock.Mock,
+        session: Session,
+        configure: Callable[[Session], object],
+        expected: object,
+    ) -> None:
+        """Test headers are only merged when there is something to merge."""
+        session.pool = mock.Mock()
+        configure(session)
+
+        session.get("https://example.com/")
+
+        assert MockRequest.send.call_args[1]["headers"] == expected
+
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_bare_request_passes_no_headers(
+        self, mock_send: mock.AsyncMock, async_session: AsyncSession
+    ) -> None:
+        """Test AsyncSession skips the header merge for a bare request."""
+        async_session.pool = mock.AsyncMock()
+
+        await async_session.get("https://example.com/")
+
+        assert mock_send.call_args[1]["headers"] is None
+
+    def test_async_session_merge_headers(self, async_session: AsyncSession) -> None:
+        """Test AsyncSession shares the same cached merge behaviour."""
+        async_session.headers["Accept"] = "text/html"
+        async_session.set_basic_auth("user", "pass")
+
+        assert async_session._get_base_headers() is async_session._get_base_headers()
+        assert async_session._merge_headers({"X-Call": "1"}) == {
+            "Accept": "text/html",
+            "Authorization": "Basic dXNlcjpwYXNz",
+            "X-Call": "1",
+        }
+
 
 # ============================================================================
 # TEST CLASS: Session GET/POST
@@ -160,7 +566,7 @@ class TestSessionRequests:
     """Tests for Session request methods."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_get_basic_request(
         self,
         mock_urlparse: mock.Mock,
@@ -182,7 +588,6 @@ class TestSessionRequests:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         # Execute
         result = session.get("https://example.com/test")
@@ -193,8 +598,38 @@ class TestSessionRequests:
         mock_pool.put_connection.assert_called_once_with(mock_conn)
         MockRequest.send.assert_called_once()
 
+    @pytest.mark.parametrize(
+        "url,port,use_ssl",
+        [
+            ("http://example.com/", 80, False),
+            ("https://example.com/", 443, True),
+            ("https://example.com:8443/", 8443, True),
+            ("http://example.com:8080/", 8080, False),
+            ("ftp://example.com/", 80, False),
+        ],
+    )
+    @mock.patch("reqivo.client.session.Request")
+    def test_request_scheme_port_and_tls_dispatch(
+        self,
+        MockRequest: mock.Mock,
+        session: Session,
+        mock_response: mock.Mock,
+        url: str,
+        port: int,
+        use_ssl: bool,
+    ) -> None:
+        """Test default port and TLS flag are derived from the URL scheme."""
+        session.pool = mock.Mock()
+        MockRequest.send.return_value = mock_response
+
+        session.get(url)
+
+        session.pool.get_connection.assert_called_once_with(
+            "example.com", port, use_ssl=use_ssl, timeout=5
+        )
+
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_get_includes_basic_auth_header(
         self,
         mock_urlparse: mock.Mock,
@@ -215,7 +650,6 @@ class TestSessionRequests:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.set_basic_auth("user", "pass")
         session.get("https://example.com/test")
@@ -226,7 +660,7 @@ class TestSessionRequests:
         assert call_kwargs["headers"]["Authorization"].startswith("Basic ")
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_get_includes_cookies_in_header(
         self,
         mock_urlparse: mock.Mock,
@@ -247,7 +681,6 @@ class TestSessionRequests:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.cookies = {"session_id": "abc123"}
         session.get("https://example.com/test")
@@ -257,7 +690,7 @@ class TestSessionRequests:
         assert "session_id=abc123" in call_kwargs["headers"]["Cookie"]
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_get_raises_on_invalid_url(
         self, mock_urlparse: mock.Mock, MockRequest: mock.Mock, session: Session
     ) -> None:
@@ -273,7 +706,7 @@ class TestSessionRequests:
         assert "Invalid URL" in str(exc_info.value)
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_get_closes_connection_on_error(
         self, mock_urlparse: mock.Mock, MockRequest: mock.Mock, session: Session
     ) -> None:
@@ -289,7 +722,6 @@ class TestSessionRequests:
         mock_pool.get_connection.return_value = mock_conn
         session.pool = mock_pool
 
-        MockRequest.set_session_instance = mock.Mock()
         MockRequest.send.side_effect = Exception("Network error")
 
         with pytest.raises(Exception):
@@ -298,7 +730,7 @@ class TestSessionRequests:
         mock_pool.discard_connection.assert_called_once_with(mock_conn)
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_post_sends_body(
         self,
         mock_urlparse: mock.Mock,
@@ -319,7 +751,6 @@ class TestSessionRequests:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         body_data = '{"key": "value"}'
         session.post("https://example.com/api", body=body_data)
@@ -372,6 +803,7 @@ class TestAsyncSession:
         async_session.set_bearer_token("token")
         assert async_session._basic_auth is None
         assert async_session._bearer_token == "token"
+        assert async_session._auth_header == "Bearer token"
 
     def test_async_build_cookie_header(self, async_session: AsyncSession) -> None:
         """Test async cookie header building."""
@@ -390,7 +822,7 @@ class TestAsyncSession:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_get(
         self,
         mock_urlparse: mock.Mock,
@@ -426,9 +858,26 @@ class TestAsyncSession:
         await async_session.close()
         mock_pool.close_all.assert_awaited_once()
 
+    def test_async_sessions_get_their_own_pool(self) -> None:
+        """Test async sessions without an explicit pool do not share one."""
+        first, second = AsyncSession(), AsyncSession()
+        assert isinstance(first.pool, AsyncConnectionPool)
+        assert first.pool is not second.pool
+
+    @pytest.mark.asyncio
+    async def test_async_close_closes_default_pool(self) -> None:
+        """Test close() releases the connections of the session's own pool."""
+        async_session = AsyncSession()
+        with mock.patch.object(
+            AsyncConnectionPool, "close_all", new_callable=mock.AsyncMock
+        ) as close_all:
+            await async_session.close()
+
+        close_all.assert_awaited_once()
+
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_post(
         self,
         mock_urlparse: mock.Mock,
@@ -459,7 +908,7 @@ class TestAsyncSession:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_request_with_basic_auth(
         self,
         mock_urlparse: mock.Mock,
@@ -492,7 +941,7 @@ class TestAsyncSession:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_request_with_bearer_token(
         self,
         mock_urlparse: mock.Mock,
@@ -525,7 +974,7 @@ class TestAsyncSession:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_request_with_cookies(
         self,
         mock_urlparse: mock.Mock,
@@ -559,6 +1008,32 @@ class TestAsyncSession:
         assert "session_id=abc123" in cookie_header
         assert "user=test" in cookie_header
 
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_set_cookie_sent_on_next_request(
+        self,
+        mock_send: mock.AsyncMock,
+        async_session: AsyncSession,
+        mock_response: mock.Mock,
+    ) -> None:
+        """Test a Set-Cookie response is parsed into the next request's Cookie."""
+        async_session.pool = mock.AsyncMock()
+        mock_response.headers = Headers({"Set-Cookie": ["sid=abc; Path=/", "b=2"]})
+
+        async def send(*args: object, **kwargs: Any) -> mock.Mock:
+            # AsyncRequest.send hands each response to the session it is given
+            kwargs["session"]._update_cookies_from_response(mock_response)
+            return mock_response
+
+        mock_send.side_effect = send
+        await async_session.get("https://example.com/login")
+        assert async_session._pending_set_cookies == ["sid=abc; Path=/", "b=2"]
+
+        await async_session.get("https://example.com/me")
+
+        assert mock_send.call_args[1]["headers"] == {"Cookie": "sid=abc; b=2"}
+        assert async_session.cookies == {"sid": "abc", "b": "2"}
+
     @pytest.mark.asyncio
     async def test_async_request_invalid_url(self, async_session: AsyncSession) -> None:
         """Test async request with invalid URL (no hostname)."""
@@ -567,7 +1042,7 @@ class TestAsyncSession:
 
     @pytest.mark.asyncio
     @mock.patch("reqivo.client.session.AsyncRequest")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     async def test_async_request_exception_closes_connection(
         self,
         mock_urlparse: mock.Mock,
@@ -590,7 +1065,6 @@ class TestAsyncSession:
         MockAsyncRequest.send = mock.AsyncMock(
             side_effect=RuntimeError("Request failed")
         )
-        MockAsyncRequest.set_session_instance = mock.Mock()
 
         with pytest.raises(RuntimeError, match="Request failed"):
             await async_session.get("https://example.com/test")
@@ -598,6 +1072,74 @@ class TestAsyncSession:
         # Verify connection was closed on exception
         mock_pool.discard_connection.assert_awaited_once_with(mock_conn)
 
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_send_many(
+        self, mock_send: mock.AsyncMock, async_session: AsyncSession
+    ) -> None:
+        """Test send_many runs every request and keeps the input order."""
+        mock_pool = mock.AsyncMock()
+        async_session.pool = mock_pool
+
+        async def fake_send(method: str, url: str, **kwargs: object) -> mock.Mock:
+            await asyncio.sleep(0.01 if url.endswith("/a") else 0)
+            resp = mock.Mock(spec=Response)
+            resp.headers = Headers()
+            resp.stream = False
+            resp.url = f"{method} {url} {kwargs['body']}"
+            return resp
+
+        mock_send.side_effect = fake_send
+
+        responses = await async_session.send_many(
+            [
+                {"method": "GET", "url": "http://example.com/a"},
+                {"method": "POST", "url": "http://example.com/b", "body": b"x"},
+            ]
+        )
+
+        assert [r.url for r in responses] == [
+            "GET http://example.com/a None",
+            "POST http://example.com/b b'x'",
+        ]
+        assert mock_pool.get_connection.await_count == 2
+        assert mock_pool.put_connection.await_count == 2
+
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest.send", new_callable=mock.AsyncMock)
+    async def test_async_send_many_propagates_errors(
+        self,
+        mock_send: mock.AsyncMock,
+        async_session: AsyncSession,
+        mock_response: mock.Mock,
+    ) -> None:
+        """Test send_many raises the first failure and still releases the rest."""
+        mock_pool = mock.AsyncMock()
+        async_session.pool = mock_pool
+
+        async def fake_send(method: str, url: str, **kwargs: object) -> mock.Mock:
+            if url.endswith("/bad"):
+                raise RuntimeError("boom")
+            return mock_response
+
+        mock_send.side_effect = fake_send
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await async_session.send_many(
+                [
+                    {"method": "GET", "url": "http://example.com/ok"},
+                    {"method": "GET", "url": "http://example.com/bad"},
+                ]
+            )
+
+        mock_pool.put_connection.assert_awaited_once()
+        mock_pool.discard_connection.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_send_many_empty(self, async_session: AsyncSession) -> None:
+        """Test send_many with no requests returns an empty list."""
+        assert await async_session.send_many([]) == []
+
 
 class TestSessionExceptionHandling:
     """Tests for sync Session exception handling."""
@@ -640,11 +1182,11 @@ class TestSessionExceptionHandling:
         # Should not raise exception
         session._update_cookies_from_response(mock_response)
 
-        # Cookies dict should remain unchanged or handle gracefully
-        # (The implementation catches exceptions and continues)
+        # Lines without a name=value pair are skipped
+        assert session.cookies == {}
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_get_with_bearer_token(
         self,
         mock_urlparse: mock.Mock,
@@ -669,7 +1211,6 @@ class TestSessionExceptionHandling:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.get("https://example.com/test")
 
@@ -679,7 +1220,7 @@ class TestSessionExceptionHandling:
         assert call_kwargs["headers"]["Authorization"] == "Bearer my_bearer_token"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_post_with_basic_auth(
         self,
         mock_urlparse: mock.Mock,
@@ -704,7 +1245,6 @@ class TestSessionExceptionHandling:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.post("https://example.com/api", body="test")
 
@@ -714,7 +1254,7 @@ class TestSessionExceptionHandling:
         assert call_kwargs["headers"]["Authorization"].startswith("Basic ")
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_post_with_bearer_token(
         self,
         mock_urlparse: mock.Mock,
@@ -739,7 +1279,6 @@ class TestSessionExceptionHandling:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.post("https://example.com/api", body="test")
 
@@ -749,7 +1288,7 @@ class TestSessionExceptionHandling:
         assert call_kwargs["headers"]["Authorization"] == "Bearer token_abc123"
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_post_with_cookies(
         self,
         mock_urlparse: mock.Mock,
@@ -774,7 +1313,6 @@ class TestSessionExceptionHandling:
         session.pool = mock_pool
 
         MockRequest.send.return_value = mock_response
-        MockRequest.set_session_instance = mock.Mock()
 
         session.post("https://example.com/api", body="test")
 
@@ -785,7 +1323,7 @@ class TestSessionExceptionHandling:
         assert "session_id=xyz789" in cookie_header
         assert "user=john" in cookie_header
 
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_post_raises_on_invalid_url(self, mock_urlparse: mock.Mock) -> None:
         """Test sync POST raises ValueError for invalid URL."""
         session = Session()
@@ -799,7 +1337,7 @@ class TestSessionExceptionHandling:
             session.post("invalid://url", body="test")
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_sync_post_closes_connection_on_error(
         self,
         mock_urlparse: mock.Mock,
@@ -819,7 +1357,6 @@ class TestSessionExceptionHandling:
         mock_pool.get_connection.return_value = mock_conn
         session.pool = mock_pool
 
-        MockRequest.set_session_instance = mock.Mock()
         MockRequest.send.side_effect = RuntimeError("POST failed")
 
         with pytest.raises(RuntimeError, match="POST failed"):
@@ -837,13 +1374,8 @@ class TestSessionExceptionHandling:
         # Set a truthy value so we enter the try block
         mock_response.headers = Headers({"Set-Cookie": "some_cookie_string"})
 
-        # Patch SimpleCookie.load in the reqivo.client.session module to raise exception
-        with mock.patch(
-            "reqivo.client.session.SimpleCookie.load",
-            side_effect=CookieError("Malformed cookie"),
-        ):
-            # Should not raise - exception should be caught
-            async_session._update_cookies_from_response(mock_response)
+        # Should not raise - a line without name=value is skipped
+        async_session._update_cookies_from_response(mock_response)
 
         # Verify cookies remain empty after exception
         assert async_session.cookies == {}
@@ -855,13 +1387,12 @@ class TestSessionExceptionHandling:
     ) -> None:
         """Test that Session stores and passes limits."""
         limits = {"max_header_size": 1000}
-        session = Session(limits=limits)
+        session = Session(limits=limits, pool=MockPool())
         assert session.limits == limits
 
         resp = mock.Mock(spec=Response)
         resp.headers = Headers()
         MockRequest.send.return_value = resp
-        MockRequest.set_session_instance = mock.Mock()
 
         session.get("http://example.com")
 
@@ -890,3 +1421,34 @@ class TestSessionExceptionHandling:
 
         args, kwargs = MockAsyncSend.call_args
         assert kwargs["limits"] == limits
+
+    @mock.patch("reqivo.client.session.Request")
+    def test_session_passed_explicitly_to_send(
+        self, MockRequest: mock.MagicMock
+    ) -> None:
+        """Test Session hands itself to Request.send instead of a class global."""
+        session = Session()
+        session.pool = mock.Mock()
+        resp = mock.Mock(spec=Response)
+        resp.headers = Headers()
+        MockRequest.send.return_value = resp
+
+        session.get("http://example.com")
+
+        assert MockRequest.send.call_args[1]["session"] is session
+
+    @pytest.mark.asyncio
+    @mock.patch("reqivo.client.session.AsyncRequest")
+    async def test_async_session_passed_explicitly_to_send(
+        self, MockAsyncRequest: mock.MagicMock
+    ) -> None:
+        """Test AsyncSession hands itself to AsyncRequest.send."""
+        async_session = AsyncSession()
+        async_session.pool = mock.AsyncMock()
+        resp = mock.Mock(spec=Response)
+        resp.headers = Headers()
+        MockAsyncRequest.send = mock.AsyncMock(return_value=resp)
+
+        await async_session.get("http://example.com")
+
+        assert MockAsyncRequest.send.call_args[1]["session"] is async_session
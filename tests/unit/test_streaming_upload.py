@@ -177,6 +177,35 @@ class TestAsyncIterWriteChunked:
         assert len(write_calls) == 1
         assert write_calls[0] == mock.call(b"0\r\n\r\n")
 
+    @pytest.mark.asyncio
+    async def test_drain_batched_across_small_chunks(self) -> None:
+        """Test small chunks are queued and drained once, not per chunk."""
+        writer = self._make_writer()
+
+        async def gen():
+            for _ in range(10):
+                yield b"abc"
+
+        await async_iter_write_chunked(writer, gen())
+
+        assert writer.write.call_count == 11
+        writer.drain.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_drain_when_threshold_reached(self) -> None:
+        """Test the writer is drained as soon as 64 KiB are pending."""
+        writer = self._make_writer()
+        big = b"x" * (64 * 1024)
+
+        async def gen():
+            yield big
+            yield b"tail"
+
+        await async_iter_write_chunked(writer, gen())
+
+        assert writer.drain.await_count == 2
+        assert writer.write.call_args_list[0] == mock.call(b"10000\r\n" + big + b"\r\n")
+
 
 # ============================================================================
 # TEST CLASS: file_to_iterator
@@ -186,6 +215,15 @@ class TestAsyncIterWriteChunked:
 class TestFileToIterator:
     """Tests for file_to_iterator function."""
 
+    def test_default_chunk_size_is_64k(self) -> None:
+        """Test files are read 64 KiB at a time by default."""
+        data = b"x" * 100000
+        fileobj = io.BytesIO(data)
+
+        chunks = list(file_to_iterator(fileobj))
+
+        assert [len(chunk) for chunk in chunks] == [65536, 34464]
+
     def test_basic_file(self) -> None:
         """Test converting a BytesIO to iterator."""
         data = b"hello world"
@@ -380,7 +418,7 @@ class TestSessionStreamingUpload:
     """Tests for Session methods with streaming body."""
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_session_post_with_iterator_body(
         self,
         mock_urlparse: mock.Mock,
@@ -403,7 +441,6 @@ class TestSessionStreamingUpload:
         mock_resp = mock.Mock(spec=Response)
         mock_resp.headers = Headers()
         MockRequest.send.return_value = mock_resp
-        MockRequest.set_session_instance = mock.Mock()
 
         chunks = iter([b"chunk1", b"chunk2"])
         session.post("https://example.com/upload", body=chunks)
@@ -412,7 +449,7 @@ class TestSessionStreamingUpload:
         assert call_kwargs["body"] is chunks
 
     @mock.patch("reqivo.client.session.Request")
-    @mock.patch("reqivo.client.session.urllib.parse.urlparse")
+    @mock.patch("reqivo.client.session.urllib.parse.urlsplit")
     def test_session_put_with_file_body(
         self,
         mock_urlparse: mock.Mock,
@@ -435,7 +472,6 @@ class TestSessionStreamingUpload:
         mock_resp = mock.Mock(spec=Response)
         mock_resp.headers = Headers()
         MockRequest.send.return_value = mock_resp
-        MockRequest.set_session_instance = mock.Mock()
 
         fileobj = io.BytesIO(b"file data")
         session.put("https://example.com/upload", body=fileobj)
@@ -1,6 +1,11 @@
 """tests/unit/test_url.py"""
 
-from reqivo.http.url import URL
+import urllib.parse
+from unittest import mock
+
+import pytest
+
+from reqivo.http.url import DEFAULT_SCHEME_INFO, SCHEME_INFO, URL
 
 
 class TestURL:
@@ -42,3 +47,84 @@ class TestURL:
         url = URL("http://example.com/path?key=value")
         assert url.parsed.query == "key=value"
         assert url.path == "/path"
+
+
+class TestSchemeInfo:
+    """Tests for the shared scheme -> (default port, TLS) table."""
+
+    @pytest.mark.parametrize(
+        "scheme,expected",
+        [
+            ("http", (80, False)),
+            ("https", (443, True)),
+            ("ws", (80, False)),
+            ("wss", (443, True)),
+        ],
+    )
+    def test_known_schemes(self, scheme, expected):
+        """Test default ports and TLS flags for supported schemes."""
+        assert SCHEME_INFO[scheme] == expected
+
+    def test_unknown_scheme_default(self):
+        """Test unknown schemes fall back to plain port 80."""
+        assert SCHEME_INFO.get("ftp", DEFAULT_SCHEME_INFO) == (80, False)
+
+
+class TestURLParse:
+    """Tests for the cached regex fast path behind URL."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "http://Example.COM/Path",
+            "https://api.example.com:8443/v1/x?a=1#frag",
+            "http://h:/x",
+            "http://:80/",
+            "http:///p",
+            "HTTP://h/p;params?q",
+            "http://user:pw@h:1/",
+            "http://[::1]:8080/",
+            "ws://h:08/x",
+            " http://h/\t",
+            "http://bücher.de/x",
+            "http://h?x",
+            "http://a%Z/",
+            "http://Ex%41mple.com/p",
+        ],
+    )
+    def test_matches_urlparse(self, raw):
+        """Test fast path and fallback agree with urllib.parse.urlparse."""
+        url = URL(raw)
+        parsed = urllib.parse.urlparse(raw)
+        assert (url.scheme, url.host, url.port, url.path) == (
+            parsed.scheme,
+            parsed.hostname,
+            parsed.port,
+            parsed.path,
+        )
+
+    def test_simple_url_skips_urlparse(self):
+        """Test a plain URL is split without calling urlparse."""
+        with mock.patch("reqivo.http.url.urllib.parse.urlparse") as urlparse:
+            url = URL("https://fast.example.com:8443/v1/x?y=1")
+        urlparse.assert_not_called()
+        assert url.host == "fast.example.com"
+        assert url.port == 8443
+        assert url.path == "/v1/x"
+
+    def test_repeat_url_is_cached(self):
+        """Test the same URL string is only parsed once."""
+        URL("http://cached.example.com/a")
+        with mock.patch("reqivo.http.url._URL_RE") as pattern:
+            url = URL("http://cached.example.com/a")
+        pattern.match.assert_not_called()
+        assert url.host == "cached.example.com"
+
+    @pytest.mark.parametrize(
+        "raw", ["http://example.com:notaport/", "http://h:65536/", "http://h:123456/"]
+    )
+    def test_invalid_port_raises_every_time(self, raw):
+        """Test malformed ports raise like urlparse and are not cached."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                URL(raw)
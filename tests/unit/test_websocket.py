@@ -18,9 +18,16 @@ from unittest import mock
 
 import pytest
 
-from reqivo.client.request import Request
+from reqivo.client.request import Request, _header_line
 from reqivo.client.response import Response
-from reqivo.client.websocket import AsyncWebSocket, WebSocket, _compute_accept_key
+from reqivo.client.websocket import (
+    _HANDSHAKE_TEMPLATE,
+    AsyncWebSocket,
+    WebSocket,
+    _compute_accept_key,
+    _encode_handshake,
+    _handshake_headers,
+)
 from reqivo.transport.connection import AsyncConnection, Connection
 from reqivo.utils.websocket_utils import (
     OPCODE_BINARY,
@@ -57,6 +64,70 @@ def test_compute_accept_key_different_input():
     assert _compute_accept_key(key) == expected
 
 
+def test_encode_handshake_template_matches_request_builder():
+    """Test the fixed handshake template equals the generic builder output."""
+    headers = _handshake_headers("example.com:8080", "abc==", None, None)
+    expected = Request.build_request("GET", "/s?q=1", "example.com", headers, None)
+    assert _encode_handshake("/s?q=1", "example.com:8080", "abc==", {}, []) == expected
+
+
+def test_handshake_template_comes_from_request_builder():
+    """Test the template is rendered from build_request with no marks left."""
+    assert "\x01" not in _HANDSHAKE_TEMPLATE
+    assert _HANDSHAKE_TEMPLATE.startswith("GET {path} HTTP/1.1\r\nHost: {host}\r\n")
+    assert "Sec-WebSocket-Key: {key}\r\n" in _HANDSHAKE_TEMPLATE
+
+
+@pytest.mark.parametrize(
+    "path,host",
+    [("/", "h:80\r\nX-Evil: 1"), ("/\r\nX-Evil: 1", "h:80"), ("/\x00", "h:80")],
+)
+def test_encode_handshake_rejects_injection(path, host):
+    """Test CR, LF and NUL in the host or path are rejected on every path."""
+    with pytest.raises(ValueError):
+        _encode_handshake(path, host, "k", None, None)
+    with pytest.raises(ValueError):
+        _encode_handshake(path, host, "k", {"X-Token": "t"}, None)
+
+
+def test_encode_handshake_does_not_fill_header_line_cache():
+    """Test the template path checks the Host without caching its line."""
+    _header_line.cache_clear()
+    _encode_handshake("/", "fresh.example.com:80", "k", None, None)
+    assert _header_line.cache_info().currsize == 0
+
+
+def test_encode_handshake_with_user_headers_uses_builder():
+    """Test user headers are validated by the request builder."""
+    with pytest.raises(ValueError, match="Invalid character"):
+        _encode_handshake("/", "h:80", "k", {"X-Bad": "a\r\nb"}, [])
+    encoded = _encode_handshake("/", "h:80", "k", {"X-Token": "t"}, ["chat"])
+    assert b"X-Token: t\r\n" in encoded
+    assert b"Sec-WebSocket-Protocol: chat\r\n" in encoded
+
+
+def test_handshake_headers_defaults():
+    """Test the handshake carries the fixed RFC 6455 headers and the key."""
+    headers = _handshake_headers("example.com:80", "abc==", {}, [])
+    assert headers == {
+        "Host": "example.com:80",
+        "Sec-WebSocket-Key": "abc==",
+        "Upgrade": "websocket",
+        "Connection": "Upgrade",
+        "Sec-WebSocket-Version": "13",
+    }
+
+
+def test_handshake_headers_user_overrides_and_subprotocols():
+    """Test user headers override defaults and subprotocols are joined."""
+    extra = {"Connection": "keep-alive, Upgrade", "X-Token": "t"}
+    headers = _handshake_headers("h:443", "k", extra, ["chat", "v2"])
+    assert headers["Connection"] == "keep-alive, Upgrade"
+    assert headers["X-Token"] == "t"
+    assert headers["Sec-WebSocket-Protocol"] == "chat, v2"
+    assert extra == {"Connection": "keep-alive, Upgrade", "X-Token": "t"}
+
+
 # ============================================================================
 # TEST CLASS: WebSocket Initialization
 # ============================================================================
@@ -136,6 +207,35 @@ class TestWebSocketConnect:
         assert ws.connected is True
         assert ws.sock == mock_sock
 
+    @mock.patch("reqivo.client.websocket.Connection")
+    @mock.patch("reqivo.client.websocket.Request.build_request")
+    def test_connect_split_header_terminator(self, mock_build, mock_conn_cls):
+        """Test handshake whose blank line straddles two recv() chunks."""
+        ws = WebSocket("ws://example.com/socket")
+
+        mock_conn = mock.Mock(spec=Connection)
+        mock_sock = mock.Mock()
+        mock_conn_cls.return_value = mock_conn
+        mock_conn.open.return_value = mock_sock
+
+        mock_sock.recv.side_effect = [
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\n"
+            b"Connection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: s3pPLMBiTxaQ9kYGzzhZRbK+xOo=\r\n\r",
+            b"\n\x81\x02hi",
+        ]
+        mock_build.return_value = b"GET /socket HTTP/1.1\r\n\r\n"
+        buffer = ws._buffer
+
+        with mock.patch("os.urandom", return_value=b"the sample nonce"):
+            ws.connect()
+
+        assert ws.connected is True
+        assert bytes(ws._buffer) == b"\x81\x02hi"
+        assert ws._buffer is buffer
+        assert mock_sock.recv.call_count == 2
+
     @mock.patch("reqivo.client.websocket.Connection")
     @mock.patch("reqivo.client.websocket.Request.build_request")
     def test_connect_success_wss_scheme(self, mock_build, mock_conn_cls):
@@ -298,9 +398,8 @@ class TestWebSocketConnect:
             ws.connect()
 
         # Verify path with query string was used
-        call_args = mock_build.call_args[0]
-        path = call_args[1]
-        assert path == "/socket?token=abc123"
+        sent = mock_sock.sendall.call_args[0][0]
+        assert sent.startswith(b"GET /socket?token=abc123 HTTP/1.1\r\n")
 
 
 # ============================================================================
@@ -526,6 +625,59 @@ class TestWebSocketRecv:
         result = ws.recv()
         assert result == "secret"
 
+    def test_recv_two_frames_in_one_read(self):
+        """Test a frame arriving with the next one keeps the tail buffered."""
+        ws = WebSocket("ws://example.com/")
+        mock_sock = mock.Mock()
+        ws.sock = mock_sock
+        ws.connected = True
+
+        first = create_frame(b"one", opcode=OPCODE_TEXT, mask=True)
+        second = create_frame(b"\xff\x00", opcode=OPCODE_BINARY, mask=False)
+        mock_sock.recv.side_effect = [first + second]
+
+        assert ws.recv() == "one"
+        assert ws.recv() == b"\xff\x00"
+        mock_sock.recv.assert_called_once()
+
+    def test_recv_advances_cursor_instead_of_copying_tail(self):
+        """Test consumed frames move the read cursor and are dropped lazily."""
+        ws = WebSocket("ws://example.com/")
+        mock_sock = mock.Mock()
+        ws.sock = mock_sock
+        ws.connected = True
+
+        first = create_frame(b"one", opcode=OPCODE_TEXT, mask=False)
+        second = create_frame(b"x" * 20, opcode=OPCODE_TEXT, mask=False)
+        mock_sock.recv.side_effect = [first + second]
+        buffer = ws._buffer
+
+        assert ws.recv() == "one"
+        assert ws._buf_pos == len(first)
+        assert len(ws._buffer) == len(first) + len(second)
+
+        assert ws.recv() == "x" * 20
+        assert ws._buf_pos == 0
+        assert ws._buffer == bytearray()
+        assert ws._buffer is buffer
+
+    def test_recv_reads_large_payload_in_one_call(self):
+        """Test the missing payload is requested in full, not 4 KiB at a time."""
+        ws = WebSocket("ws://example.com/")
+        mock_sock = mock.Mock()
+        ws.sock = mock_sock
+        ws.connected = True
+
+        payload = b"\x00" * 100000
+        frame = create_frame(payload, opcode=OPCODE_BINARY, mask=False)
+        mock_sock.recv.side_effect = [frame[:10], frame[10:]]
+
+        assert ws.recv() == payload.decode("utf-8")
+        assert mock_sock.recv.call_args_list == [
+            mock.call(65536),
+            mock.call(len(frame) - 10),
+        ]
+
     def test_recv_extended_payload_length_126(self):
         """Test receiving frame with extended payload length (126 bytes)."""
         ws = WebSocket("ws://example.com/")
@@ -1125,6 +1277,47 @@ class TestAsyncWebSocketRecv:
 
         assert result == "test"
 
+    @pytest.mark.asyncio
+    async def test_async_recv_masked_extended_length_single_read(self):
+        """Test extended length and masking key are read in one call."""
+        ws = AsyncWebSocket("ws://example.com/")
+        mock_reader = mock.AsyncMock()
+        ws.reader = mock_reader
+        ws.connected = True
+
+        mask_key = b"\x12\x34\x56\x78"
+        payload = b"C" * 300
+        mock_reader.readexactly.side_effect = [
+            b"\x81\xfe",  # TEXT, masked, 16-bit extended length
+            (300).to_bytes(2, "big") + mask_key,
+            apply_mask(payload, mask_key),
+        ]
+
+        result = await ws.recv()
+
+        assert result == "C" * 300
+        assert mock_reader.readexactly.await_args_list == [
+            mock.call(2),
+            mock.call(6),
+            mock.call(300),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_recv_incomplete_extended_length(self):
+        """Test EOF inside the extended length is reported as a header error."""
+        ws = AsyncWebSocket("ws://example.com/")
+        mock_reader = mock.AsyncMock()
+        ws.reader = mock_reader
+        ws.connected = True
+
+        mock_reader.readexactly.side_effect = [
+            b"\x81\x7f",
+            asyncio.IncompleteReadError(b"\x00", 8),
+        ]
+
+        with pytest.raises(WebSocketError, match="reading frame header"):
+            await ws.recv()
+
 
 class TestAsyncWebSocketControlFrames:
     """Tests for AsyncWebSocket control frame methods."""
@@ -1583,38 +1776,21 @@ class TestSyncWebSocketEdgeCases:
         with pytest.raises(ConnectionError, match="WebSocket is not connected"):
             ws.recv()
 
-    @mock.patch("reqivo.client.websocket.parse_frame_header")
-    def test_sync_recv_incomplete_frame_header(self, mock_parse):
-        """Test sync recv when parse_frame_header returns None (lines 174-182)."""
+    def test_sync_recv_incomplete_frame_header(self):
+        """Test sync recv reads more when the extended length is missing."""
         ws = WebSocket("ws://example.com/")
         ws.connected = True
         mock_sock = mock.Mock()
         ws.sock = mock_sock
-        ws._buffer = bytearray(b"\x81")  # Incomplete header (only 1 byte)
-
-        # First call: parse returns None (incomplete)
-        # Second call: parse returns valid header
-        mock_parse.side_effect = [
-            None,  # Incomplete - triggers lines 173-182
-            (
-                2,
-                4,
-                1,
-                0,
-                0,
-                0,
-                OPCODE_TEXT,
-                False,
-            ),  # Complete: header_len=2, payload_len=4
-        ]
+        # TEXT, 16-bit extended length follows but has not arrived yet
+        ws._buffer = bytearray(b"\x81\x7e")
 
-        # Mock socket to return complete frame data in one recv
-        mock_sock.recv.return_value = b"\x04test"  # Length byte + payload
+        mock_sock.recv.return_value = b"\x00\x04test"
 
         result = ws.recv()
 
-        # Should successfully read after getting more data
         assert result == "test"
+        mock_sock.recv.assert_called_once_with(65536)
 
     def test_sync_recv_buffer_needs_more_data(self):
         """Test sync recv when buffer needs more data for payload (lines 195-203)."""
@@ -1687,14 +1863,11 @@ class TestSyncWebSocketEdgeCases:
         ws.connected = True
         mock_sock = mock.Mock()
         ws.sock = mock_sock
-        ws._buffer = bytearray(b"\x81")  # Incomplete header
+        # Masked TEXT frame: the 4-byte masking key is still missing
+        ws._buffer = bytearray(b"\x81\x85")
 
-        # Mock parse_frame_header to return None
-        with mock.patch(
-            "reqivo.client.websocket.parse_frame_header", return_value=None
-        ):
-            # Socket closes when trying to get more data
-            mock_sock.recv.return_value = b""
+        # Socket closes when trying to get more data
+        mock_sock.recv.return_value = b""
 
-            with pytest.raises(ConnectionError, match="Connection closed"):
-                ws.recv()
+        with pytest.raises(ConnectionError, match="Connection closed"):
+            ws.recv()
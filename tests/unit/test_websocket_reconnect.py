@@ -240,12 +240,15 @@ class TestSyncAutoReconnect:
         """Test that _reconnect clears the buffer."""
         ws = WebSocket("ws://example.com/")
         ws.connected = True
-        ws._buffer = bytearray(b"old data")
+        buffer = ws._buffer = bytearray(b"old data")
+        ws._buf_pos = 3
         ws.sock = mock.Mock()
 
         ws._reconnect()
 
         assert ws._buffer == bytearray()
+        assert ws._buffer is buffer
+        assert ws._buf_pos == 0
         mock_connect.assert_called_once()
 
 
@@ -1,12 +1,16 @@
 """tests/unit/test_websocket_utils.py"""
 
 import struct
+from unittest import mock
+
+import pytest
 
 from reqivo.utils.websocket_utils import (
     OPCODE_BINARY,
     OPCODE_CLOSE,
     OPCODE_TEXT,
     WebSocketError,
+    _MaskKeyPool,
     apply_mask,
     create_frame,
     parse_frame_header,
@@ -46,6 +50,14 @@ class TestApplyMask:
         masked = apply_mask(data, b"")
         assert masked == data
 
+    def test_apply_mask_accepts_buffer_objects(self):
+        """Test bytearray and memoryview payloads are masked without a cast."""
+        mask = b"\x12\x34\x56\x78"
+        expected = apply_mask(b"payload", mask)
+        assert apply_mask(bytearray(b"payload"), mask) == expected
+        assert apply_mask(memoryview(b"payload"), mask) == expected
+        assert isinstance(apply_mask(memoryview(b"payload"), b""), bytes)
+
     def test_apply_mask_xor_property(self):
         """Test that apply_mask correctly XORs each byte."""
         data = b"\x00\x00\x00\x00"
@@ -53,6 +65,15 @@ class TestApplyMask:
         masked = apply_mask(data, mask)
         assert masked == mask  # XOR with 0 returns the mask
 
+    @pytest.mark.parametrize("length", [0, 1, 3, 4, 5, 125, 126, 4097])
+    def test_apply_mask_matches_bytewise_xor(self, length):
+        """Test every length, including partial trailing words, is masked."""
+        data = bytes((i * 7 + 3) & 0xFF for i in range(length))
+        mask = b"\x00\xff\x5a\x81"
+        expected = bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+        assert apply_mask(data, mask) == expected
+        assert apply_mask(memoryview(bytearray(data)), mask) == expected
+
 
 class TestCreateFrame:
     """Tests for create_frame function."""
@@ -113,6 +134,47 @@ class TestCreateFrame:
         assert (b0 & 0x0F) == OPCODE_CLOSE
 
 
+class TestMaskKeyPool:
+    """Tests for the batched masking key source."""
+
+    def test_keys_drawn_in_batches(self):
+        """Test many keys come from a single os.urandom() call."""
+        pool = _MaskKeyPool()
+        with mock.patch(
+            "reqivo.utils.websocket_utils.os.urandom",
+            side_effect=lambda n: bytes(range(256)) * (n // 256),
+        ) as urandom:
+            keys = [pool.next_key() for _ in range(64)]
+
+        urandom.assert_called_once_with(4096)
+        assert keys[0] == b"\x00\x01\x02\x03"
+        assert keys[1] == b"\x04\x05\x06\x07"
+        assert all(len(key) == 4 for key in keys)
+
+    def test_refills_when_exhausted(self):
+        """Test a new batch is drawn after the previous one is used up."""
+        pool = _MaskKeyPool()
+        with mock.patch(
+            "reqivo.utils.websocket_utils.os.urandom",
+            side_effect=[b"AAAABBBB", b"CCCC"],
+        ) as urandom:
+            keys = [pool.next_key() for _ in range(3)]
+
+        assert keys == [b"AAAA", b"BBBB", b"CCCC"]
+        assert urandom.call_count == 2
+
+    def test_reset_discards_pending_keys(self):
+        """Test reset() forces the next key to come from a new batch."""
+        pool = _MaskKeyPool()
+        with mock.patch(
+            "reqivo.utils.websocket_utils.os.urandom",
+            side_effect=[b"AAAABBBB", b"CCCC"],
+        ):
+            assert pool.next_key() == b"AAAA"
+            pool.reset()
+            assert pool.next_key() == b"CCCC"
+
+
 class TestParseFrameHeader:
     """Tests for parse_frame_header function."""
 